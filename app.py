@@ -7,9 +7,37 @@
 
 import os
 import csv
+import bisect
+import time
+import threading
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
-from typing import List, Tuple, Dict, Any
-from circuitkit.CircuitKit import CircuitKit
+from typing import List, Tuple, Dict, Set, Any, Optional, Callable, Iterator, TYPE_CHECKING
+from storage.Journal import Journal, J_COMPONENT, J_KIT_QTY, J_KIT_ADD, FOLDED_FILE
+from storage.LockTable import LockTable
+from storage.WriterThread import WriterThread
+from storage.SharedDir import SharedDir
+from storage.AtomicFile import AtomicFile, FsyncPolicy, FSYNC_INTERVAL
+from storage import parallel_load
+from storage.ColumnarInventory import ColumnarInventory
+from storage.BinarySnapshot import BinarySnapshot, SNAPSHOT_FILE
+from component.Component import Component
+from component.ComponentKey import ComponentKey
+from component.factory import component_to_csv_row, csv_to_component
+from component.schema import schema_for_kind
+
+# kits, the kit planner and the ledger classes are imported when first used
+if TYPE_CHECKING:
+    from circuitkit.CircuitKit import CircuitKit
+    from circuitkit.KitPlanner import KitPlanner
+    from circuitkit.BomIndex import BomIndex
+    from transaction.TransactionHistory import TransactionHistory
+    from transaction.TransactionIndex import TransactionIndex
+    from transaction.LedgerSegments import LedgerSegments
+    from transaction.Transaction import Transaction
+    from transaction.PurchaseOrder import PurchaseOrder
+    from transaction.CustomerSale import CustomerSale
+    from profiling.Profiler import Profiler
 
 
 class App:
@@ -20,10 +48,45 @@ class App:
     Author: Pratik SAPKOTA
     '''
 
-    def __init__(self) -> None:
+    def __init__(self, data_dir: Optional[str] = None, checkpoint_every: int = 1000,
+                 columnar: bool = False, threadsafe: bool = False, shared: bool = False,
+                 fsync: str = FSYNC_INTERVAL, fsync_interval_ms: int = 1000,
+                 background: bool = False, profiler: Optional["Profiler"] = None,
+                 load_workers: Optional[int] = None,
+                 ledger_segment_bytes: Optional[int] = 64 * 1024 * 1024,
+                 ledger_monthly: bool = False) -> None:
         '''
-        Initialize the App by preparing file paths, ensuring files exist,
-        and loading component and kit data into memory.
+        Initialize the App by preparing file paths and ensuring files exist.
+        Components, kits and the ledger helpers are loaded the first time
+        they are used (see the private properties below); each dataset is
+        read from the last snapshot and the journal is replayed on top.
+
+        Parameters:
+        data_dir (Optional[str]): Data directory, defaults to ./data next to app.py.
+        checkpoint_every (int): Journal records written before the snapshots are compacted.
+        columnar (bool): Keep a ColumnarInventory in sync for stock analytics.
+        threadsafe (bool): Allow several threads (terminals) to share this App:
+        operations lock only the components and kits they touch, and every
+        file write is done in order by one writer thread.
+        shared (bool): Other processes use the same data directory. Every
+        operation then runs under the directory lock and first merges the
+        journal records other processes appended, or reloads after another
+        process checkpointed. Datasets are loaded at startup in this mode.
+        fsync (str): When journal appends and snapshot rewrites are forced to
+        disk: "always", "interval" (at most every fsync_interval_ms) or "close".
+        fsync_interval_ms (int): Interval for the "interval" policy.
+        background (bool): Persist off the interactive path: journal and ledger
+        appends and checkpoints run on the writer thread, and operations return
+        without waiting for them; flush() and close() wait. Implies threadsafe.
+        profiler (Optional[Profiler]): Time every public method and count bytes
+        saved and rows loaded; nothing is measured when None.
+        load_workers (Optional[int]): Processes used to parse CSV files of at
+        least parallel_load.PARALLEL_MIN_BYTES; None for one per CPU, 1 to
+        always parse on one core.
+        ledger_segment_bytes (Optional[int]): Close transactions.csv into a
+        gzip-compressed segment once it reaches this size; never if None.
+        ledger_monthly (bool): Also close it when the first append of a new
+        month is made. Closed segments stay searchable.
 
         Returns:
         None
@@ -31,20 +94,330 @@ class App:
         Author: Unubileg ADILBISH
         '''
         base = os.path.dirname(os.path.abspath(__file__))
-        self.__data_dir = os.path.join(base, "data")
+        self.__data_dir = data_dir if data_dir is not None else os.path.join(base, "data")
         if not os.path.exists(self.__data_dir):
             os.makedirs(self.__data_dir)
 
         self.__inventory_path = os.path.join(self.__data_dir, "circuits.csv")
         self.__kits_path = os.path.join(self.__data_dir, "components.csv")
         self.__transactions_path = os.path.join(self.__data_dir, "transactions.csv")
-
-        self.__components: Dict[str, int] = {}
-        self.__kits: Dict[str, Dict[str, Any]] = {}
+        self.__journal_path = os.path.join(self.__data_dir, "journal.csv")
+        self.__summary_path = os.path.join(self.__data_dir, "transactions_summary.csv")
+        self.__index_path = os.path.join(self.__data_dir, "transactions_index.csv")
+        self.__snapshot_path = os.path.join(self.__data_dir, SNAPSHOT_FILE)
+        self.__folded_path = os.path.join(self.__data_dir, FOLDED_FILE)
+
+        # datasets are None until first use; see __components / __kits etc.
+        self.__stock: Optional[Dict[str, int]] = None
+        self.__kit_table: Optional[Dict[str, Dict[str, Any]]] = None
+        # sorted views kept up to date by the mutators, so listings are slices
+        self.__stock_order: List[ComponentKey] = []
+        self.__stock_kinds: Dict[str, List[ComponentKey]] = {}
+        # "price" / "voltage" -> kind -> sorted (value, key), built on the first range query
+        self.__range_indexes: Dict[str, Dict[str, List[Tuple[float, ComponentKey]]]] = {}
+        self.__kit_names: List[str] = []
+        self.__kit_boms: Optional["BomIndex"] = None
+        # (mtime_ns, size) of each CSV when its dataset was last read or saved
+        self.__csv_stamps: Dict[str, Tuple[int, int]] = {}
+        # journal records of the operation in progress, one list per thread
+        self.__local = threading.local()
+        self.__checkpoint_every = checkpoint_every
+        self.__planner: Optional["KitPlanner"] = None
+        self.__plan: Optional[Dict[str, Tuple[int, Optional[str]]]] = None
+        self.__columnar = columnar
+        self.__stock_columns: Optional[ColumnarInventory] = None
+        self.__history_obj: Optional["TransactionHistory"] = None
+        self.__index_obj: Optional["TransactionIndex"] = None
+        self.__segments_obj: Optional["LedgerSegments"] = None
+        self.__ledger_segment_bytes = ledger_segment_bytes
+        self.__ledger_monthly = ledger_monthly
+        # per-key locks ("C" + fragment, "K" + kit name), a short lock around
+        # the in-memory structures, and the thread all file writes go through
+        threadsafe = threadsafe or background
+        self.__background = background
+        self.__locks: Optional[LockTable] = LockTable() if threadsafe else None
+        self.__state = threading.RLock() if threadsafe else nullcontext()
+        self.__writer: Optional[WriterThread] = WriterThread() if threadsafe else None
+        self.__checkpoint_due = False
+        # records already applied in memory whose journal append is still
+        # queued on the writer, in commit order; a checkpoint drops them
+        self.__unwritten: List[List[str]] = []
+        # directory lock, snapshot version seen and journal bytes merged (shared mode)
+        self.__shared: Optional[SharedDir] = SharedDir(self.__data_dir) if shared else None
+        self.__version = 0
+        self.__journal_pos = 0
+
+        # snapshots are replaced atomically; fsyncs follow the policy
+        self.__files = AtomicFile(FsyncPolicy(fsync, fsync_interval_ms))
 
         self.__ensure_files()
-        self.__load_components()
-        self.__load_kits()
+        # last journal generation folded into each CSV
+        self.__folded = self.__read_folded()
+        self.__journal = Journal(self.__journal_path, self.__files.policy, self.__next_generation())
+        # datasets with journaled changes not yet folded into their CSV
+        self.__dirty = self.__unfolded() if len(self.__journal) else set()
+        self.__profiler = profiler
+        self.__load_workers = load_workers
+        if self.__shared is not None:
+            with self.__shared.lock():
+                self.__reload()
+        if len(self.__journal) and len(self.__dirty) < 2:
+            # a checkpoint was interrupted after saving a CSV: finish it
+            self.checkpoint()
+        if profiler is not None:
+            profiler.instrument(self, "app")
+
+    # ---------------- lazily loaded datasets ----------------
+
+    @property
+    def __components(self) -> Dict[str, int]:
+        if self.__stock is None:
+            self.__load_components()
+        return self.__stock
+
+    @property
+    def __component_order(self) -> List[ComponentKey]:
+        if self.__stock is None:
+            self.__load_components()
+        return self.__stock_order
+
+    @property
+    def __kind_order(self) -> Dict[str, List[ComponentKey]]:
+        if self.__stock is None:
+            self.__load_components()
+        return self.__stock_kinds
+
+    @property
+    def __columns(self) -> Optional[ColumnarInventory]:
+        if self.__stock is None:
+            self.__load_components()
+        return self.__stock_columns
+
+    @property
+    def __kits(self) -> Dict[str, Dict[str, Any]]:
+        if self.__kit_table is None:
+            self.__load_kits()
+        return self.__kit_table
+
+    @property
+    def __kit_order(self) -> List[str]:
+        if self.__kit_table is None:
+            self.__load_kits()
+        return self.__kit_names
+
+    @property
+    def __bom(self) -> "BomIndex":
+        if self.__kit_table is None:
+            self.__load_kits()
+        return self.__kit_boms
+
+    @property
+    def __history(self) -> "TransactionHistory":
+        if self.__history_obj is None:
+            from transaction.TransactionHistory import TransactionHistory
+            self.__history_obj = TransactionHistory(self.__transactions_path, self.__summary_path,
+                                                    self.__ledger_segments)
+        return self.__history_obj
+
+    @property
+    def __ledger_index(self) -> "TransactionIndex":
+        if self.__index_obj is None:
+            from transaction.TransactionIndex import TransactionIndex
+            self.__index_obj = TransactionIndex(self.__transactions_path, self.__index_path,
+                                                self.__ledger_segments)
+        return self.__index_obj
+
+    @property
+    def __ledger_segments(self) -> "LedgerSegments":
+        if self.__segments_obj is None:
+            from transaction.LedgerSegments import LedgerSegments
+            segments = LedgerSegments.for_data_dir(self.__data_dir, max_bytes=self.__ledger_segment_bytes,
+                                                   monthly=self.__ledger_monthly, files=self.__files)
+            # finish a rotation a crash interrupted
+            with self.__shared.lock() if self.__shared is not None else nullcontext():
+                segments.recover()
+            self.__segments_obj = segments
+        return self.__segments_obj
+
+    @property
+    def __pending(self) -> List[List[str]]:
+        pending = getattr(self.__local, "pending", None)
+        if pending is None:
+            pending = self.__local.pending = []
+        return pending
+
+    def __record(self, rec: List[str]) -> None:
+        '''
+        Queue a journal record for the operation in progress. Its dataset is
+        dirty from now on, so a checkpoint saves the change even if the record
+        itself is never committed to the journal.
+
+        Author: Unubileg ADILBISH
+        '''
+        self.__pending.append(rec)
+        self.__mark_dirty([rec])
+
+    # ---------------- other processes ----------------
+
+    def __reload(self) -> None:
+        '''
+        Read both datasets again from the snapshots and the whole journal.
+        Called with the directory lock held.
+
+        Author: Botao HUANG
+        '''
+        self.__folded = self.__read_folded()
+        if self.__journal.recount(self.__next_generation()):
+            with self.__state:
+                self.__dirty.update(self.__unfolded())
+        with self.__state:
+            self.__read_components()
+            self.__read_kits()
+        self.__version = self.__shared.version()
+        self.__journal_pos = self.__journal.size()
+
+    def __merge_external(self) -> None:
+        '''
+        Apply the journal records other processes appended since the last
+        merge, or reload if another process has folded and truncated the
+        journal since. Called with the directory lock held.
+
+        Author: Botao HUANG
+        '''
+        from circuitkit.CircuitKit import CircuitKit
+        if self.__shared.version() != self.__version or self.__journal.size() < self.__journal_pos:
+            self.__reload()
+            return
+        records, self.__journal_pos = self.__journal.tail(self.__journal_pos)
+        self.__mark_dirty(records)
+        for rec in records:
+            op = rec[0]
+            try:
+                if op == J_COMPONENT:
+                    self.__apply_component_delta(ComponentKey.of(rec[2]), int(rec[1]))
+                elif op == J_KIT_QTY:
+                    self.__apply_kit_delta(rec[2], int(rec[1]))
+                elif op == J_KIT_ADD:
+                    qty, kit = CircuitKit.from_components_csv_row(rec[1:])
+                    self.__apply_kit_add(kit, qty)
+            except Exception:
+                continue
+
+    @contextmanager
+    def __shared_section(self) -> Iterator[None]:
+        if self.__shared is None:
+            yield
+            return
+        with self.__shared.lock() as outermost:
+            if outermost:
+                self.__merge_external()
+            yield
+
+    def refresh(self) -> None:
+        '''
+        Pick up changes other processes made to a shared data directory.
+        Does nothing unless the App was opened with shared=True.
+
+        Returns:
+        None
+
+        Author: Botao HUANG
+        '''
+        if self.__shared is not None:
+            with self.__shared_section():
+                pass
+
+    # ---------------- concurrency ----------------
+
+    @contextmanager
+    def __guard(self, *keys: str) -> Iterator[None]:
+        '''
+        Hold the per-key locks of an operation ("C" + fragment, "K" + kit name)
+        so its check and its update happen as one step. A checkpoint that
+        came due inside the operation runs once the thread holds no keys.
+        In shared mode the directory lock is held too.
+
+        Author: Pratik SAPKOTA
+        '''
+        held = self.__locks.hold(keys) if self.__locks is not None else nullcontext()
+        with held:
+            with self.__shared_section():
+                yield
+        if self.__checkpoint_due and not self.__background and \
+                (self.__locks is None or self.__locks.depth() == 0):
+            self.checkpoint()
+
+    @contextmanager
+    def __kit_guard(self, kit_name: str, *keys: str) -> Iterator[None]:
+        '''
+        __guard over a kit and every component of its stored definition.
+        The definition is read again once the locks are held, and the locks
+        are retaken if it changed in between.
+
+        Author: Pratik SAPKOTA
+        '''
+        while True:
+            held = set(keys)
+            held.add("K" + kit_name)
+            held.update(self.__definition_keys(kit_name))
+            with self.__guard(*held):
+                if held.issuperset(self.__definition_keys(kit_name)):
+                    yield
+                    return
+
+    def __definition_keys(self, kit_name: str) -> List[str]:
+        with self.__state:
+            return ["C" + ComponentKey.of(frag) for frag, _ in self.__bom.lines(kit_name)]
+
+    def __write(self, fn: Callable[..., Any], *args: Any) -> None:
+        '''
+        Run a file write, on the writer thread when the App is thread-safe.
+        In shared mode the caller writes it under the directory lock, so it
+        is on disk before the lock is released.
+
+        Author: Unubileg ADILBISH
+        '''
+        if self.__writer is None or self.__shared is not None:
+            fn(*args)
+        else:
+            self.__writer.submit(fn, *args)
+
+    def __mark_dirty(self, records: List[List[str]]) -> None:
+        with self.__state:
+            for rec in records:
+                self.__dirty.add("components" if rec[0] == J_COMPONENT else "kits")
+
+    def __read(self, fn: Callable[..., Any], *args: Any) -> Any:
+        '''
+        Run a file read after every write queued before it and return its result.
+
+        Author: Unubileg ADILBISH
+        '''
+        if self.__writer is None:
+            return fn(*args)
+        return self.__writer.call(fn, *args)
+
+    def __append_ledger(self, rows: List[List[Any]]) -> None:
+        if self.__ledger_segments.due():
+            self.__rotate_ledger()
+        self.__ledger_index.append_rows(rows)
+
+    def __rotate_ledger(self) -> None:
+        '''
+        Close transactions.csv into a compressed segment and start a new one.
+        In shared mode this runs under the directory lock, and is skipped if
+        another process rotated first.
+
+        Author: Botao HUANG
+        '''
+        with self.__shared.lock() if self.__shared is not None else nullcontext():
+            segments = self.__ledger_segments
+            if not segments.due():
+                return
+            segment = segments.rotate()
+            self.__ledger_index.rebuild()
+            if segment is not None and self.__profiler is not None:
+                self.__profiler.add_bytes("rotate_ledger", os.path.getsize(segments.path_of(segment)))
 
     def __ensure_files(self) -> None:
         '''
@@ -60,56 +433,338 @@ class App:
                 with open(p, "w", newline="", encoding="utf-8") as f:
                     pass
 
+    def __read_folded(self) -> Dict[str, int]:
+        '''
+        Read the last journal generation folded into each CSV (dataset -> generation).
+        Author: Unubileg ADILBISH
+        '''
+        folded: Dict[str, int] = {}
+        if not os.path.exists(self.__folded_path):
+            return folded
+        with open(self.__folded_path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.reader(f):
+                try:
+                    folded[row[0]] = int(row[1])
+                except (IndexError, ValueError):
+                    continue
+        return folded
+
+    def __write_folded(self, dataset: str, generation: int) -> None:
+        self.__folded[dataset] = generation
+        with self.__files.open(self.__folded_path) as f:
+            writer = csv.writer(f)
+            for name in sorted(self.__folded):
+                writer.writerow([name, self.__folded[name]])
+
+    def __next_generation(self) -> int:
+        return max(self.__folded.values(), default=-1) + 1
+
+    def __unfolded(self) -> Set[str]:
+        '''
+        Datasets whose CSV does not yet hold the journal's records.
+        Author: Unubileg ADILBISH
+        '''
+        gen = self.__journal.generation
+        return {ds for ds in ("components", "kits") if self.__folded.get(ds, -1) < gen}
+
+    def __open_snapshot(self) -> Optional[BinarySnapshot]:
+        return BinarySnapshot.open(self.__snapshot_path, [self.__inventory_path, self.__kits_path])
+
     def __load_components(self) -> None:
         '''
-        Load component inventory from circuits.csv into memory.
+        Load component inventory into memory, from the binary snapshot if it
+        is current and from circuits.csv otherwise, then replay the journaled
+        component deltas on top. Each fragment becomes an interned ComponentKey
+        used as the inventory key. Runs on first use of the component dataset.
 
         Returns:
         None
 
         Author: Botao HUANG
         '''
-        self.__components.clear()
-        with open(self.__inventory_path, "r", encoding="utf-8", newline="") as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if not row or len(row) < 2:
-                    continue
-                try:
-                    qty = int(row[0].strip())
-                except Exception:
-                    qty = 0
-                parts = [c.strip() for c in row[1:]]
-                frag = ",".join(parts)
-                self.__components[frag] = self.__components.get(frag, 0) + qty
+        with self.__state:
+            if self.__stock is None:
+                self.__read_components()
+
+    def __read_components(self) -> None:
+        stock: Dict[str, int] = {}
+        self.__csv_stamps[self.__inventory_path] = BinarySnapshot.stamps([self.__inventory_path])[0]
+        snap = self.__open_snapshot()
+        if snap is not None:
+            try:
+                # the snapshot holds canonical fragments, so keys are parsed lazily
+                canonical = ComponentKey.of_canonical
+                for qty, frag in snap.iter_components():
+                    stock[canonical(frag)] = qty
+                parsed = snap.component_count
+            finally:
+                snap.close()
+        elif parallel_load.worth_parallel(self.__inventory_path, self.__load_workers):
+            canonical = ComponentKey.of_canonical
+            for frag, qty in parallel_load.load_components(self.__inventory_path, self.__load_workers).items():
+                stock[canonical(frag)] = qty
+            parsed = len(stock)
+        else:
+            with open(self.__inventory_path, "r", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                for row in reader:
+                    if not row or len(row) < 2:
+                        continue
+                    try:
+                        qty = int(row[0].strip())
+                    except Exception:
+                        qty = 0
+                    frag = ComponentKey.of(",".join(row[1:]))
+                    stock[frag] = stock.get(frag, 0) + qty
+                parsed = reader.line_num
+        if self.__profiler is not None:
+            self.__profiler.add_rows("load_components", parsed)
+        replay = self.__journal.read() if "components" in self.__unfolded() else []
+        for rec in replay:
+            if rec[0] != J_COMPONENT:
+                continue
+            try:
+                frag = ComponentKey.of(rec[2])
+                newv = stock.get(frag, 0) + int(rec[1])
+            except Exception:
+                continue
+            if newv > 0:
+                stock[frag] = newv
+            else:
+                stock.pop(frag, None)
+        self.__stock_order = sorted(stock)
+        self.__stock_kinds = {}
+        for frag in self.__stock_order:
+            self.__stock_kinds.setdefault(frag.kind, []).append(frag)
+        self.__range_indexes = {}
+        self.__stock_columns = ColumnarInventory.from_stock(stock) if self.__columnar else None
+        self.__plan = None
+        # published last, so other threads never see a half-built dataset
+        self.__stock = stock
+
+    def save_snapshot(self) -> None:
+        '''
+        Write the binary snapshot of the current inventory, stamped with the
+        CSVs it mirrors. Called by checkpoint() right after the CSVs are saved.
+        If a CSV was changed by hand since it was read, the snapshot would not
+        mirror it, so the old snapshot is removed instead.
+
+        Returns:
+        None
+
+        Author: Unubileg ADILBISH
+        '''
+        with self.__state:
+            kits = [(name, int(data.get("qty", 0)), data["items"]) for name, data in self.__kits.items()]
+            components = dict(self.__components)
+            sources = [self.__inventory_path, self.__kits_path]
+            stamps = [self.__csv_stamps.get(p) for p in sources]
+        if stamps != BinarySnapshot.stamps(sources):
+            if os.path.exists(self.__snapshot_path):
+                os.remove(self.__snapshot_path)
+            return
+        BinarySnapshot.write(self.__snapshot_path, components, kits, sources, self.__files, stamps)
+        if self.__profiler is not None:
+            self.__profiler.add_bytes("save_snapshot", os.path.getsize(self.__snapshot_path))
 
     def save_components(self) -> None:
         '''
         Save the in-memory component inventory back to circuits.csv.
+        Called by checkpoint(); on its own it does not clear the journal.
+        The file is replaced atomically, so a crash never leaves it truncated.
 
         Returns:
         None
 
         Author: Unubileg ADILBISH
         '''
-        with open(self.__inventory_path, "w", newline="", encoding="utf-8") as f:
+        with self.__state:  # copied before the file is truncated
+            components = list(self.__components.items())
+        with self.__files.open(self.__inventory_path) as f:
             writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
-            for frag, qty in self.__components.items():
-                parts = [c.strip() for c in frag.split(",")]
-                writer.writerow([qty] + parts)
+            for frag, qty in components:
+                writer.writerow([qty] + list(frag.parts))
+            if self.__profiler is not None:
+                self.__profiler.add_bytes("save_components", f.tell())
+        self.__csv_stamps[self.__inventory_path] = BinarySnapshot.stamps([self.__inventory_path])[0]
 
-    def list_component_rows(self) -> List[Tuple[int, str]]:
+    def list_component_rows(self, offset: int = 0, limit: Optional[int] = None) -> List[Tuple[int, str]]:
         '''
-        Return a sorted list of component rows for display.
+        Return a sorted list of component rows for display. The sort order is
+        maintained by change_component_qty, so this is a slice of it.
+
+        Parameters:
+        offset (int): Index of the first row to return.
+        limit (Optional[int]): Maximum number of rows, or None for all.
+
+        Returns:
+        List[Tuple[int, str]]: (quantity, component fragment as a ComponentKey)
+
+        Author: Pratik SAPKOTA
+        '''
+        self.refresh()
+        end = None if limit is None else offset + limit
+        with self.__state:
+            comps = self.__components
+            return [(comps[frag], frag) for frag in self.__component_order[offset:end]]
+
+    def query_components(self, offset: int = 0, limit: Optional[int] = None, kind: Optional[str] = None,
+                         prefix: Optional[str] = None,
+                         min_price: Optional[float] = None, max_price: Optional[float] = None,
+                         min_voltage: Optional[float] = None, max_voltage: Optional[float] = None
+                         ) -> Tuple[int, List[Tuple[int, str]]]:
+        '''
+        Filtered, paginated component listing in display order. Kind and
+        prefix are answered from the sorted per-kind indexes with bisect,
+        price and voltage ranges from per-kind (value, key) indexes, so only
+        the matching keys are visited.
+
+        Parameters:
+        offset (int): Index of the first matching row to return.
+        limit (Optional[int]): Page size, or None for all matches.
+        kind (Optional[str]): Only this component kind, e.g. "Battery".
+        prefix (Optional[str]): Only fragments starting with this text, e.g. "Battery,AA".
+        min_price, max_price (Optional[float]): Inclusive unit price range.
+        min_voltage, max_voltage (Optional[float]): Inclusive voltage range; kinds
+        without a voltage never match a voltage filter.
+
+        Returns:
+        Tuple[int, List[Tuple[int, str]]]: (total matches, (quantity, fragment) page)
+
+        Author: Unubileg ADILBISH
+        '''
+        self.refresh()
+        with self.__state:
+            return self.__query_components(offset, limit, kind, prefix,
+                                           min_price, max_price, min_voltage, max_voltage)
+
+    def __query_components(self, offset: int, limit: Optional[int], kind: Optional[str],
+                           prefix: Optional[str], min_price: Optional[float], max_price: Optional[float],
+                           min_voltage: Optional[float], max_voltage: Optional[float]
+                           ) -> Tuple[int, List[Tuple[int, str]]]:
+        base = self.__component_order if kind is None else self.__kind_order.get(kind, [])
+        lo = 0
+        hi = len(base)
+        if prefix:
+            lo = bisect.bisect_left(base, prefix)
+            hi = bisect.bisect_left(base, prefix + "\U0010ffff", lo)
+        end = None if limit is None else offset + limit
+        comps = self.__components
+        if min_price is None and max_price is None and min_voltage is None and max_voltage is None:
+            page = base[lo + offset:hi if end is None else min(hi, lo + end)]
+            return hi - lo, [(comps[frag], frag) for frag in page]
+        ranges = []
+        if min_price is not None or max_price is not None:
+            ranges.append(("price", min_price, max_price))
+        if min_voltage is not None or max_voltage is not None:
+            ranges.append(("voltage", min_voltage, max_voltage))
+        kinds = [kind] if kind is not None else list(self.__kind_order)
+        # candidates come from the narrowest range; the other one is checked per key
+        candidates: Optional[List[ComponentKey]] = None
+        for attr, low, high in ranges:
+            found = []
+            index = self.__range_index(attr)
+            for k in kinds:
+                entries = index.get(k, [])
+                a = 0 if low is None else bisect.bisect_left(entries, (low,))
+                b = len(entries) if high is None else bisect.bisect_right(entries, (high, "\U0010ffff"), a)
+                found.extend([frag for _, frag in entries[a:b]])
+            if candidates is None or len(found) < len(candidates):
+                candidates = found
+        matches = []
+        for frag in candidates if candidates is not None else []:
+            if prefix and not frag.startswith(prefix):
+                continue
+            for attr, low, high in ranges:
+                value = getattr(frag, attr)
+                if value is None or (low is not None and value < low) or (high is not None and value > high):
+                    break
+            else:
+                matches.append(frag)
+        matches.sort()
+        return len(matches), [(comps[frag], frag) for frag in matches[offset:end]]
+
+    def __range_index(self, attr: str) -> Dict[str, List[Tuple[float, ComponentKey]]]:
+        '''
+        Per-kind keys sorted by (attr value, key), for keys that have the attribute.
+        Called with the state lock held.
+
+        Author: Unubileg ADILBISH
+        '''
+        index = self.__range_indexes.get(attr)
+        if index is None:
+            index = {}
+            for k, frags in self.__kind_order.items():
+                entries = [(getattr(frag, attr), frag) for frag in frags]
+                index[k] = sorted([e for e in entries if e[0] is not None])
+            self.__range_indexes[attr] = index
+        return index
+
+    def component_kinds(self) -> List[str]:
+        '''
+        Component kinds currently in stock, sorted.
+
+        Author: Botao HUANG
+        '''
+        with self.__state:
+            return sorted([k for k, frags in self.__kind_order.items() if frags])
+
+    def __analytics(self) -> ColumnarInventory:
+        '''
+        The maintained columnar store. Without columnar=True it is built on
+        the first analytics call and maintained from then on.
+
+        Author: Unubileg ADILBISH
+        '''
+        if self.__columns is None:
+            self.__stock_columns = ColumnarInventory.from_stock(self.__components)
+        return self.__stock_columns
+
+    def stock_valuation(self, kind: Optional[str] = None) -> float:
+        '''
+        Total value (unit price * quantity) of components on hand.
+
+        Parameters:
+        kind (Optional[str]): Only this component kind, e.g. "Battery".
+
+        Returns:
+        float
+
+        Author: Botao HUANG
+        '''
+        with self.__state:
+            return self.__analytics().valuation(kind)
+
+    def stock_totals_by_kind(self) -> Dict[str, Tuple[int, float]]:
+        '''
+        Units on hand and stock value per component kind.
+
+        Returns:
+        Dict[str, Tuple[int, float]]: kind -> (units, value)
+
+        Author: Botao HUANG
+        '''
+        with self.__state:
+            return self.__analytics().totals_by_kind()
+
+    def reorder_candidates(self, threshold: int, kind: Optional[str] = None) -> List[Tuple[int, str]]:
+        '''
+        Components at or below a stock threshold, lowest first. Components
+        that sold out since the columnar store was built (at startup with
+        columnar=True, else on the first analytics call) are included with
+        quantity 0.
+
+        Parameters:
+        threshold (int): Report components whose quantity is <= threshold.
+        kind (Optional[str]): Only this component kind.
 
         Returns:
         List[Tuple[int, str]]: (quantity, component fragment)
 
         Author: Pratik SAPKOTA
         '''
-        items = [(qty, frag) for frag, qty in self.__components.items()]
-        items.sort(key=lambda x: (x[1], x[0]))
-        return items
+        with self.__state:
+            return self.__analytics().reorder(threshold, kind)
 
     def change_component_qty(self, row_without_qty: str, delta: int) -> None:
         '''
@@ -124,71 +779,198 @@ class App:
 
         Author: Botao HUANG
         '''
-        cur = self.__components.get(row_without_qty, 0)
-        newv = cur + delta
-        if newv > 0:
-            self.__components[row_without_qty] = newv
-        else:
-            self.__components.pop(row_without_qty, None)
+        key = ComponentKey.of(row_without_qty)
+        self.__apply_component_delta(key, delta)
+        self.__record([J_COMPONENT, str(delta), key])
+
+    def __apply_component_delta(self, key: ComponentKey, delta: int) -> None:
+        '''
+        Apply a stock delta and keep the sorted views in step (not journaled).
+
+        Author: Botao HUANG
+        '''
+        with self.__state:
+            cur = self.__components.get(key, 0)
+            newv = cur + delta
+            if newv > 0:
+                if key not in self.__components:
+                    bisect.insort(self.__component_order, key)
+                    bisect.insort(self.__kind_order.setdefault(key.kind, []), key)
+                    for attr, index in self.__range_indexes.items():
+                        value = getattr(key, attr)
+                        if value is not None:
+                            bisect.insort(index.setdefault(key.kind, []), (value, key))
+                self.__components[key] = newv
+            elif key in self.__components:
+                del self.__components[key]
+                del self.__component_order[bisect.bisect_left(self.__component_order, key)]
+                same_kind = self.__kind_order[key.kind]
+                del same_kind[bisect.bisect_left(same_kind, key)]
+                for attr, index in self.__range_indexes.items():
+                    value = getattr(key, attr)
+                    if value is not None:
+                        entries = index[key.kind]
+                        del entries[bisect.bisect_left(entries, (value, key))]
+            if self.__columns is not None:
+                self.__columns.set_qty(key, newv)
+            self.__plan = None
 
     def __load_kits(self) -> None:
         '''
-        Load circuit kits from components.csv into memory.
+        Load circuit kits into memory, from the binary snapshot if it is
+        current and from components.csv otherwise, then replay the journaled
+        kit changes on top. Runs on first use of the kit dataset.
 
         Returns:
         None
 
         Author: Unubileg ADILBISH
         '''
-        self.__kits.clear()
-        with open(self.__kits_path, "r", encoding="utf-8", newline="") as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if not row or len(row) < 2:
-                    continue
-                try:
-                    qty, kit = CircuitKit.from_components_csv_row(row)
-                except Exception:
-                    continue
-                name = kit.name
-                if name in self.__kits:
-                    self.__kits[name]["qty"] += qty
-                else:
-                    self.__kits[name] = {"qty": qty, "items": kit.items}
+        with self.__state:
+            if self.__kit_table is None:
+                self.__read_kits()
+
+    def __read_kits(self) -> None:
+        from circuitkit.CircuitKit import CircuitKit
+        from circuitkit.BomIndex import BomIndex
+        kits: Dict[str, Dict[str, Any]] = {}
+        self.__csv_stamps[self.__kits_path] = BinarySnapshot.stamps([self.__kits_path])[0]
+        snap = self.__open_snapshot()
+        if snap is not None:
+            try:
+                canonical = ComponentKey.of_canonical
+                for name, qty, items in snap.iter_kits():
+                    kit = CircuitKit(name, 0.0, [(q, canonical(f)) for q, f in items])
+                    kits[name] = {"qty": qty, "items": kit.items, "kit": kit}
+                parsed = snap.kit_count
+            finally:
+                snap.close()
+        elif parallel_load.worth_parallel(self.__kits_path, self.__load_workers):
+            canonical = ComponentKey.of_canonical
+            for name, (qty, items) in parallel_load.load_kits(self.__kits_path, self.__load_workers).items():
+                kit = CircuitKit(name, 0.0, [(q, canonical(f)) for q, f in items])
+                kits[name] = {"qty": qty, "items": kit.items, "kit": kit}
+            parsed = len(kits)
+        else:
+            with open(self.__kits_path, "r", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                for row in reader:
+                    if not row or len(row) < 2:
+                        continue
+                    try:
+                        qty, kit = CircuitKit.from_components_csv_row(row)
+                    except Exception:
+                        continue
+                    name = kit.name
+                    if name in kits:
+                        kits[name]["qty"] += qty
+                    else:
+                        kits[name] = {"qty": qty, "items": kit.items, "kit": kit}
+                parsed = reader.line_num
+        if self.__profiler is not None:
+            self.__profiler.add_rows("load_kits", parsed)
+        replay = self.__journal.read() if "kits" in self.__unfolded() else []
+        for rec in replay:
+            op = rec[0]
+            try:
+                if op == J_KIT_QTY:
+                    name = rec[2]
+                    if name in kits:
+                        newv = int(kits[name]["qty"]) + int(rec[1])
+                        if newv > 0:
+                            kits[name]["qty"] = newv
+                        else:
+                            del kits[name]
+                elif op == J_KIT_ADD:
+                    qty, kit = CircuitKit.from_components_csv_row(rec[1:])
+                    data = kits.get(kit.name)
+                    if data is None:
+                        stored = CircuitKit(kit.name, 0.0, kit.items)
+                        kits[kit.name] = {"qty": qty, "items": stored.items, "kit": stored}
+                    else:
+                        data["qty"] += qty
+                        if data["items"] != kit.items:
+                            data["kit"] = CircuitKit(kit.name, 0.0, kit.items)
+                            data["items"] = data["kit"].items
+            except Exception:
+                continue
+        self.__kit_names = sorted(kits)
+        self.__kit_boms = BomIndex()
+        for name, data in kits.items():
+            self.__kit_boms.compile(name, data["items"])
+        self.__planner = None
+        self.__plan = None
+        self.__kit_table = kits
 
     def save_kits(self) -> None:
         '''
         Save the in-memory kit inventory back to components.csv.
+        Called by checkpoint(); on its own it does not clear the journal.
+        The file is replaced atomically, so a crash never leaves it truncated.
 
         Returns:
         None
 
         Author: Pratik SAPKOTA
         '''
-        with open(self.__kits_path, "w", newline="", encoding="utf-8") as f:
+        with self.__state:  # copied before the file is truncated
+            kits = [(data["kit"], int(data.get("qty", 0))) for data in self.__kits.values()]
+        with self.__files.open(self.__kits_path) as f:
             writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
-            for name, data in self.__kits.items():
-                kit = CircuitKit(name, 0.0, data.get("items", []))
-                row = kit.to_components_csv_row(int(data.get("qty", 0)))
-                writer.writerow(row)
+            for kit, qty in kits:
+                writer.writerow(kit.to_components_csv_row(qty))
+            if self.__profiler is not None:
+                self.__profiler.add_bytes("save_kits", f.tell())
+        self.__csv_stamps[self.__kits_path] = BinarySnapshot.stamps([self.__kits_path])[0]
 
-    def list_circuit_objects(self) -> List[Tuple[int, CircuitKit]]:
+    def list_circuit_objects(self, offset: int = 0, limit: Optional[int] = None) -> List[Tuple[int, "CircuitKit"]]:
         '''
-        Return a sorted list of kits as (quantity, CircuitKit).
+        Return a sorted list of kits as (quantity, CircuitKit). Kit objects and
+        the name order are maintained by the kit mutators and reused here.
+
+        Parameters:
+        offset (int): Index of the first kit to return.
+        limit (Optional[int]): Maximum number of kits, or None for all.
 
         Returns:
         List[Tuple[int, CircuitKit]]
 
         Author: Botao HUANG
         '''
+        self.refresh()
+        end = None if limit is None else offset + limit
         out = []
-        for name, data in self.__kits.items():
-            kit = CircuitKit(name, 0.0, data.get("items", []))
-            out.append((int(data.get("qty", 0)), kit))
-        out.sort(key=lambda x: x[1].name)
+        with self.__state:
+            for name in self.__kit_order[offset:end]:
+                data = self.__kits[name]
+                out.append((int(data["qty"]), data["kit"]))
         return out
 
-    def add_circuit_object(self, kit: CircuitKit, qty: int) -> None:
+    def query_circuits(self, offset: int = 0, limit: Optional[int] = None,
+                       prefix: Optional[str] = None) -> Tuple[int, List[Tuple[int, "CircuitKit"]]]:
+        '''
+        Paginated kit listing in name order, optionally limited to names with a prefix.
+
+        Returns:
+        Tuple[int, List[Tuple[int, CircuitKit]]]: (total matches, (quantity, kit) page)
+
+        Author: Pratik SAPKOTA
+        '''
+        self.refresh()
+        out = []
+        with self.__state:
+            lo = 0
+            hi = len(self.__kit_order)
+            if prefix:
+                lo = bisect.bisect_left(self.__kit_order, prefix)
+                hi = bisect.bisect_left(self.__kit_order, prefix + "\U0010ffff", lo)
+            end = hi if limit is None else min(hi, lo + offset + limit)
+            for name in self.__kit_order[lo + offset:end]:
+                data = self.__kits[name]
+                out.append((int(data["qty"]), data["kit"]))
+        return hi - lo, out
+
+    def add_circuit_object(self, kit: "CircuitKit", qty: int) -> None:
         '''
         Add or update a kit in the inventory.
 
@@ -201,11 +983,33 @@ class App:
 
         Author: Unubileg ADILBISH
         '''
-        if kit.name in self.__kits:
-            self.__kits[kit.name]["qty"] += qty
-            self.__kits[kit.name]["items"] = kit.items
-        else:
-            self.__kits[kit.name] = {"qty": qty, "items": kit.items}
+        self.__apply_kit_add(kit, qty)
+        self.__record([J_KIT_ADD] + kit.to_components_csv_row(qty))
+
+    def __apply_kit_add(self, kit: "CircuitKit", qty: int) -> None:
+        '''
+        Add kits to the inventory, storing a copy of the definition (not journaled).
+
+        Author: Unubileg ADILBISH
+        '''
+        from circuitkit.CircuitKit import CircuitKit
+        with self.__state:
+            if kit.name in self.__kits:
+                data = self.__kits[kit.name]
+                data["qty"] += qty
+                if data["items"] != kit.items:
+                    self.__planner = None
+                    self.__plan = None
+                    data["kit"] = CircuitKit(kit.name, 0.0, kit.items)
+                    data["items"] = data["kit"].items
+                    self.__bom.compile(kit.name, data["items"])
+            else:
+                stored = CircuitKit(kit.name, 0.0, kit.items)
+                self.__kits[kit.name] = {"qty": qty, "items": stored.items, "kit": stored}
+                bisect.insort(self.__kit_order, kit.name)
+                self.__bom.compile(kit.name, stored.items)
+                self.__planner = None
+                self.__plan = None
 
     def change_circuit_qty(self, kit_name: str, delta: int) -> bool:
         '''
@@ -220,39 +1024,288 @@ class App:
 
         Author: Pratik SAPKOTA
         '''
-        if kit_name not in self.__kits:
+        if not self.__apply_kit_delta(kit_name, delta):
             return False
-        cur = int(self.__kits[kit_name]["qty"])
-        newv = cur + delta
-        if newv > 0:
-            self.__kits[kit_name]["qty"] = newv
-        else:
-            del self.__kits[kit_name]
+        self.__record([J_KIT_QTY, str(delta), kit_name])
         return True
 
-    def can_pack(self, kit: CircuitKit, count: int) -> bool:
+    def __apply_kit_delta(self, kit_name: str, delta: int) -> bool:
         '''
-        Check if components are sufficient to pack the kit.
+        Change a kit quantity, removing the kit at <= 0 (not journaled).
 
-        Author: Botao HUANG
+        Author: Pratik SAPKOTA
         '''
-        for (iqty, frag) in kit.items:
-            if self.__components.get(frag, 0) < iqty * count:
+        with self.__state:
+            if kit_name not in self.__kits:
                 return False
-        return True
+            cur = int(self.__kits[kit_name]["qty"])
+            newv = cur + delta
+            if newv > 0:
+                self.__kits[kit_name]["qty"] = newv
+            else:
+                del self.__kits[kit_name]
+                del self.__kit_order[bisect.bisect_left(self.__kit_order, kit_name)]
+                self.__bom.remove(kit_name)
+                self.__planner = None
+                self.__plan = None
+            return True
+
+    def __commit(self) -> None:
+        '''
+        Write the deltas of the last operation to the journal in one append,
+        compacting into the snapshots once the journal grows long enough.
+        Inside a guarded operation the compaction waits for the guard to end.
 
-    def perform_pack(self, kit: CircuitKit, count: int) -> None:
+        Returns:
+        None
+
+        Author: Unubileg ADILBISH
+        '''
+        records = self.__pending
+        self.__local.pending = []
+        if self.__writer is None or self.__shared is not None:
+            self.__journal.append(records)
+        else:
+            with self.__state:
+                self.__unwritten.extend(records)
+            self.__writer.submit(self.__append_unwritten)
+        if self.__shared is not None:
+            # our own records are already applied; don't merge them back
+            self.__journal_pos = self.__journal.size()
+        queued = len(records) if self.__writer is not None and self.__shared is None else 0
+        if len(self.__journal) + queued >= self.__checkpoint_every:
+            if self.__background:
+                # queued once; it waits on the writer until this operation ends
+                if not self.__checkpoint_due:
+                    self.__checkpoint_due = True
+                    self.__writer.submit(self.checkpoint)
+            elif self.__locks is None or self.__locks.depth() == 0:
+                self.checkpoint()
+            else:
+                self.__checkpoint_due = True
+
+    def __append_unwritten(self) -> None:
         '''
-        Deduct components and add kits, then save and record transaction.
+        Append the queued records to the journal (on the writer thread). A
+        checkpoint that ran first has already folded them, leaving none.
+
+        Author: Unubileg ADILBISH
+        '''
+        with self.__state:
+            records = self.__unwritten
+            self.__unwritten = []
+        self.__journal.append(records)
+
+    def checkpoint(self) -> None:
+        '''
+        Fold the journal into circuits.csv and components.csv (and the binary
+        snapshot mirroring them), then truncate it. Only the CSVs whose
+        dataset has changed are rewritten; changes made through the public
+        mutators and not committed yet are saved with them. With threadsafe=True this
+        runs on the writer thread, after every journal append queued before
+        it, while no operation is in progress.
+
+        Returns:
+        None
+
+        Author: Pratik SAPKOTA
+        '''
+        if self.__writer is not None and not self.__writer.on_writer():
+            # only the writer thread takes the exclusive lock, so queued
+            # background checkpoints and this one cannot wait on each other;
+            # records not committed yet are already applied and saved by the fold
+            self.__local.pending = []
+            self.__writer.call(self.checkpoint)
+            return
+        exclusive = self.__locks.exclusive() if self.__locks is not None else nullcontext()
+        with exclusive:
+            self.__checkpoint_due = False
+            self.__local.pending = []
+            with self.__shared_section():
+                self.__fold_journal()
+
+    def __fold_journal(self) -> None:
+        if len(self.__journal) == 0 and not self.__dirty and BinarySnapshot.is_current(
+                self.__snapshot_path, [self.__inventory_path, self.__kits_path]):
+            # nothing to fold; don't load datasets just to rewrite them
+            return
+        with self.__state:
+            dirty = self.__dirty
+            self.__dirty = set()
+            # no operation runs during the fold, so the tables saved below
+            # hold every committed record; drop appends that are still queued
+            unwritten = self.__unwritten
+            self.__unwritten = []
+        gen = self.__journal.generation
+        try:
+            # each CSV is followed by the generation it now holds, so a crash
+            # before the journal is truncated can't replay it twice
+            if "components" in dirty:
+                self.save_components()
+                self.__write_folded("components", gen)
+            if "kits" in dirty:
+                self.save_kits()
+                self.__write_folded("kits", gen)
+            self.save_snapshot()
+            # the journal is the only other copy of these changes: make the
+            # folded files (and their directory) durable before truncating it
+            self.__files.policy.sync()
+        except BaseException:
+            with self.__state:
+                self.__dirty.update(dirty)
+            # nothing was committed during the fold, so these are still the oldest
+            self.__journal.append(unwritten)
+            raise
+        self.__journal.clear()
+        if self.__shared is not None:
+            self.__version = self.__shared.bump()
+            self.__journal_pos = 0
+
+    def flush(self) -> None:
+        '''
+        Wait until every journal append, ledger row and checkpoint queued so
+        far is written, re-raising the first error a background write hit.
+
+        Returns:
+        None
 
         Author: Unubileg ADILBISH
         '''
-        for (iqty, frag) in kit.items:
-            self.change_component_qty(frag, -iqty * count)
-        self.add_circuit_object(kit, count)
-        self.save_components()
-        self.save_kits()
-        self.add_circuit_transaction("Pack", kit, count)
+        if self.__writer is not None:
+            self.__writer.flush()
+
+    def close(self) -> None:
+        '''
+        Checkpoint, stop the writer thread and fsync whatever the fsync policy
+        has left unsynced. The App must not be used afterwards when it was
+        opened with threadsafe=True.
+
+        Returns:
+        None
+
+        Author: Botao HUANG
+        '''
+        self.checkpoint()
+        if self.__writer is not None:
+            self.__writer.close()
+        self.__files.policy.sync()
+        if self.__profiler is not None:
+            self.__profiler.dump()
+        if self.__shared is not None:
+            self.__shared.close()
+
+    def can_pack(self, kit: "CircuitKit", count: int) -> bool:
+        '''
+        Check if components are sufficient to pack the kit, against the
+        compiled BOM when kit matches the stored definition.
+
+        Author: Botao HUANG
+        '''
+        with self.__state:
+            stock = self.__components
+            data = self.__kits.get(kit.name)
+            if data is not None and data["items"] == kit.items:
+                return self.__bom.shortfall(kit.name, count, stock) is None
+            for frag, need in self.__kit_lines(kit, count):
+                if stock.get(frag, 0) < need:
+                    return False
+            return True
+
+    def __kit_lines(self, kit: "CircuitKit", count: int) -> List[Tuple[str, int]]:
+        '''
+        Component quantities needed for count kits of a definition that is
+        not compiled, merged per fragment.
+
+        Author: Botao HUANG
+        '''
+        merged: Dict[str, int] = {}
+        for iqty, frag in kit.items:
+            if iqty > 0:
+                merged[frag] = merged.get(frag, 0) + iqty * count
+        return list(merged.items())
+
+    def plan_kits(self) -> Dict[str, Tuple[int, Optional[str]]]:
+        '''
+        Maximum packable count of every kit from current stock, with the
+        component fragment that limits it. Cached until stock or kit
+        definitions change.
+
+        Returns:
+        Dict[str, Tuple[int, Optional[str]]]: kit name -> (count, bottleneck fragment)
+
+        Author: Botao HUANG
+        '''
+        self.refresh()
+        with self.__state:
+            if self.__planner is None:
+                from circuitkit.KitPlanner import KitPlanner
+                self.__planner = KitPlanner(self.__bom.definitions())
+            if self.__plan is None:
+                self.__plan = self.__planner.plan(self.__components)
+            return dict(self.__plan)
+
+    def where_used(self, frag: str, discontinued: bool = False) -> Dict[str, Tuple[int, Optional[str]]]:
+        '''
+        Kits whose definition uses a component, with how many of each can be
+        packed from current stock. Answered from the where-used index, so only
+        the affected kits are looked at.
+
+        Parameters:
+        frag (str): Component fragment.
+        discontinued (bool): Count as if this component had no stock at all.
+
+        Returns:
+        Dict[str, Tuple[int, Optional[str]]]: kit name -> (count, bottleneck fragment)
+
+        Author: Botao HUANG
+        '''
+        key = ComponentKey.of(frag)
+        with self.__state:
+            users = sorted(self.__bom.users(key))
+            if not discontinued and self.__plan is not None:
+                return {name: self.__plan[name] for name in users}
+            stock = self.__components
+            without = key if discontinued else None
+            return {name: self.__bom.packable(name, stock, without) for name in users}
+
+    def perform_pack(self, kit: "CircuitKit", count: int) -> None:
+        '''
+        Add kits and deduct their compiled BOM times count from stock in one
+        pass, then journal and record transaction. Stock is not checked; see
+        try_pack().
+
+        Author: Unubileg ADILBISH
+        '''
+        with self.__guard(*self.__pack_keys(kit)):
+            self.add_circuit_object(kit, count)
+            for frag, need in self.__bom.lines(kit.name, count):
+                self.change_component_qty(frag, -need)
+            self.__commit()
+            self.add_circuit_transaction("Pack", kit, count)
+
+    def __pack_keys(self, kit: "CircuitKit") -> List[str]:
+        # packing stores kit's own definition, so its items are the components touched
+        return ["K" + kit.name] + ["C" + ComponentKey.of(frag) for q, frag in kit.items if q > 0]
+
+    def try_pack(self, kit: "CircuitKit", count: int) -> bool:
+        '''
+        can_pack() and perform_pack() as one step: no other operation can take
+        the components between the check and the deduction.
+
+        Parameters:
+        kit (CircuitKit): Kit to pack.
+        count (int): Number of kits.
+
+        Returns:
+        bool: True if the kits were packed.
+
+        Author: Botao HUANG
+        '''
+        with self.__guard(*self.__pack_keys(kit)):
+            if not self.can_pack(kit, count):
+                return False
+            self.perform_pack(kit, count)
+            return True
 
     def can_unpack(self, kit_name: str, count: int) -> bool:
         '''
@@ -260,114 +1313,447 @@ class App:
 
         Author: Pratik SAPKOTA
         '''
-        return kit_name in self.__kits and int(self.__kits[kit_name]["qty"]) >= count
+        with self.__state:
+            return kit_name in self.__kits and int(self.__kits[kit_name]["qty"]) >= count
 
     def perform_unpack(self, kit_name: str, count: int) -> None:
         '''
-        Deduct kits and return components, then save and record transaction.
+        Deduct kits and return components, then journal and record transaction.
 
         Author: Botao HUANG
         '''
-        if kit_name not in self.__kits:
-            return
-        items = self.__kits[kit_name]["items"]
-        kit = CircuitKit(kit_name, 0.0, items)
-        self.change_circuit_qty(kit_name, -count)
-        for (iqty, frag) in items:
-            self.change_component_qty(frag, iqty * count)
-        self.save_components()
-        self.save_kits()
-        self.add_circuit_transaction("Unpack", kit, count)
+        with self.__kit_guard(kit_name):
+            with self.__state:
+                data = self.__kits.get(kit_name)
+                if data is None:
+                    return
+                kit = data["kit"]
+                lines = self.__bom.lines(kit_name, count)
+            self.change_circuit_qty(kit_name, -count)
+            for frag, qty in lines:
+                self.change_component_qty(frag, qty)
+            self.__commit()
+            self.add_circuit_transaction("Unpack", kit, count)
+
+    def try_unpack(self, kit_name: str, count: int) -> bool:
+        '''
+        can_unpack() and perform_unpack() as one step.
+
+        Returns:
+        bool: True if the kits were unpacked.
+
+        Author: Botao HUANG
+        '''
+        with self.__kit_guard(kit_name):
+            if not self.can_unpack(kit_name, count):
+                return False
+            self.perform_unpack(kit_name, count)
+            return True
+
+    def __component_row(self, op_type: str, ts: str, frag: str, qty: int) -> List[Any]:
+        '''
+        Build a transactions.csv row for a component line.
+
+        Author: Unubileg ADILBISH
+        '''
+        row: List[Any] = [op_type, " " + ts, qty]
+        row.extend(ComponentKey.of(frag).parts)
+        return row
+
+    def __circuit_row(self, op_type: str, ts: str, kit: "CircuitKit", qty: int) -> List[Any]:
+        '''
+        Build a transactions.csv row for a kit line.
+
+        Author: Pratik SAPKOTA
+        '''
+        row: List[Any] = [op_type, " " + ts, qty, kit.name]
+        row.extend(kit.items_as_flat_tokens())
+        return row
 
     def add_component_transaction(self, op_type: str, frag: str, qty: int) -> None:
         '''
-        Append a component transaction to transactions.csv.
+        Append a component transaction to transactions.csv and index it by day.
 
         Author: Unubileg ADILBISH
         '''
         ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(self.__transactions_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            row = [op_type, " " + ts, qty]
-            row.extend(frag.split(","))
-            writer.writerow(row)
+        self.__write(self.__append_ledger, [self.__component_row(op_type, ts, frag, qty)])
 
-    def add_circuit_transaction(self, op_type: str, kit: CircuitKit, qty: int) -> None:
+    def add_circuit_transaction(self, op_type: str, kit: "CircuitKit", qty: int) -> None:
         '''
-        Append a kit transaction to transactions.csv.
+        Append a kit transaction to transactions.csv and index it by day.
 
         Author: Pratik SAPKOTA
         '''
         ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(self.__transactions_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            row = [op_type, " " + ts, qty, kit.name]
-            row.extend(kit.items_as_flat_tokens())
-            writer.writerow(row)
+        self.__write(self.__append_ledger, [self.__circuit_row(op_type, ts, kit, qty)])
 
     def buy_component(self, frag: str, qty: int) -> None:
         '''
-        Purchase components, save, and record transaction.
+        Purchase components, journal, and record transaction.
 
         Author: Botao HUANG
         '''
-        self.change_component_qty(frag, qty)
-        self.save_components()
-        self.add_component_transaction("Purchase Order", frag, qty)
+        key = ComponentKey.of(frag)
+        with self.__guard("C" + key):
+            self.change_component_qty(key, qty)
+            self.__commit()
+            self.add_component_transaction("Purchase Order", key, qty)
 
     def sell_component(self, frag: str, qty: int) -> bool:
         '''
-        Sell components if available, save, and record transaction.
+        Sell components if available, journal, and record transaction.
+        The stock check and the deduction happen as one step.
 
         Author: Unubileg ADILBISH
         '''
-        if self.__components.get(frag, 0) < qty:
-            return False
-        self.change_component_qty(frag, -qty)
-        self.save_components()
-        self.add_component_transaction("Customer Sale", frag, qty)
-        return True
+        key = ComponentKey.of(frag)
+        with self.__guard("C" + key):
+            if self.__components.get(key, 0) < qty:
+                return False
+            self.change_component_qty(key, -qty)
+            self.__commit()
+            self.add_component_transaction("Customer Sale", key, qty)
+            return True
 
     def buy_circuit(self, kit_name: str, qty: int) -> bool:
         '''
-        Purchase kits if available, save, and record transaction.
+        Purchase kits if available, journal, and record transaction.
 
         Author: Pratik SAPKOTA
         '''
-        if kit_name not in self.__kits:
+        with self.__guard("K" + kit_name):
+            data = self.__kits.get(kit_name)
+            if data is None:
+                return False
+            kit = data["kit"]
+            # the definition is already stored, so only the quantity is journaled
+            self.change_circuit_qty(kit_name, qty)
+            self.__commit()
+            self.add_circuit_transaction("Purchase Order", kit, qty)
+            return True
+
+    def sell_circuit(self, kit_name: str, qty: int) -> bool:
+        '''
+        Sell kits if available, journal, and record transaction.
+
+        Author: Botao HUANG
+        '''
+        with self.__guard("K" + kit_name):
+            data = self.__kits.get(kit_name)
+            if data is None or int(data["qty"]) < qty:
+                return False
+            kit = data["kit"]
+            self.change_circuit_qty(kit_name, -qty)
+            self.__commit()
+            self.add_circuit_transaction("Customer Sale", kit, qty)
+            return True
+
+    def __normalized(self, frag: str) -> Tuple[Any, ...]:
+        '''
+        Comparable form of a fragment: numbers compared by value, text case-insensitively.
+
+        Author: Botao HUANG
+        '''
+        key = ComponentKey.of(frag)
+        return tuple([n if n is not None else p.lower() for p, n in zip(key.parts, key.numbers)])
+
+    def import_catalogue(self, path: str, chunk_rows: int = 10000,
+                         max_errors: int = 20) -> Dict[str, Any]:
+        '''
+        Bulk-import a supplier price list as one purchase order. Rows use the
+        circuits.csv layout (qty, kind, fields...) and are read chunk_rows at a
+        time. Each row is validated through factory.csv_to_component and kept
+        in the form component_to_csv_row writes, and it is matched to existing stock by value (numbers by value, text
+        case-insensitively), so "battery,aa,1.50,3.10" adds to
+        "Battery,AA,1.5,3.1". Quantities are merged, and everything is applied
+        in one step. The ledger gets one Purchase Order entry (one row per
+        component under a single timestamp), and the change is persisted once:
+        one journal append for small imports, one rewrite of circuits.csv for
+        large ones. Rejected rows are skipped and reported.
+
+        Parameters:
+        path (str): Supplier CSV file.
+        chunk_rows (int): Rows parsed per chunk.
+        max_errors (int): Rejected rows to describe in the report.
+
+        Returns:
+        Dict[str, Any]: rows, imported, rejected, errors [(line, message)],
+        components, units, seconds, rows_per_sec
+
+        Author: Pratik SAPKOTA
+        '''
+        t0 = time.perf_counter()
+        with self.__state:
+            by_value = {self.__normalized(f): f for f in self.__components}
+        merged: Dict[str, int] = {}
+        errors: List[Tuple[int, str]] = []
+        rows = rejected = 0
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            while True:
+                chunk = [(reader.line_num, row) for _, row in zip(range(chunk_rows), reader)]
+                if not chunk:
+                    break
+                for line, row in chunk:
+                    if not row or not "".join(row).strip():
+                        continue
+                    rows = rows + 1
+                    try:
+                        frag, qty = self.__catalogue_line(row)
+                    except Exception as e:
+                        rejected = rejected + 1
+                        if len(errors) < max_errors:
+                            errors.append((line, str(e)))
+                        continue
+                    norm = self.__normalized(frag)
+                    key = by_value.setdefault(norm, frag)
+                    merged[key] = merged.get(key, 0) + qty
+
+        journaled = self.__shared is not None or len(merged) < self.__checkpoint_every
+        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        ledger: List[List[Any]] = []
+        with self.__guard():
+            for frag, qty in merged.items():
+                key = ComponentKey.of(frag)
+                if journaled:
+                    self.change_component_qty(key, qty)
+                else:
+                    self.__apply_component_delta(key, qty)
+                ledger.append(self.__component_row("Purchase Order", ts, key, qty))
+            if journaled:
+                self.__commit()
+                self.__write(self.__append_ledger, ledger)
+            else:
+                with self.__state:
+                    self.__dirty.add("components")
+        if not journaled:
+            # a large import is folded straight into circuits.csv; the ledger
+            # rows follow once the stock they record is on disk
+            self.checkpoint()
+            self.__write(self.__append_ledger, ledger)
+        seconds = time.perf_counter() - t0
+        return {
+            "rows": rows,
+            "imported": rows - rejected,
+            "rejected": rejected,
+            "errors": errors,
+            "components": len(merged),
+            "units": sum(merged.values()),
+            "seconds": seconds,
+            "rows_per_sec": rows / seconds if seconds > 0 else float(rows),
+        }
+
+    def __catalogue_line(self, row: List[str]) -> Tuple[str, int]:
+        '''
+        Validate one supplier row and return (fragment as this program writes it, qty).
+
+        Author: Pratik SAPKOTA
+        '''
+        qty = int(row[0].strip())
+        if qty <= 0:
+            raise ValueError("quantity must be positive")
+        schema = schema_for_kind(row[1].strip())
+        if schema is None:
+            raise ValueError("unknown component kind " + repr(row[1].strip()))
+        fields = [c.strip() for c in row[2:]]
+        if len(fields) != schema.arity:
+            raise ValueError(schema.kind + " needs " + str(schema.arity) + " fields")
+        # raises on malformed values; the round trip drops the supplier's spelling
+        comp = csv_to_component(schema.kind, fields)
+        return ",".join(component_to_csv_row(qty, comp)[1:]), qty
+
+    def __resolve_lines(self, items: Dict[Any, int]) -> Optional[Tuple[Dict[str, int], Dict[str, Tuple["CircuitKit", int]]]]:
+        '''
+        Split order lines into component and kit quantities, merging duplicates.
+        Keys may be component fragments, CircuitKit objects or Component objects.
+
+        Returns:
+        Optional[Tuple[Dict[str, int], Dict[str, Tuple[CircuitKit, int]]]]:
+        (fragment -> qty, kit name -> (kit, qty)), or None if a line cannot be resolved.
+
+        Author: Botao HUANG
+        '''
+        comps: Dict[str, int] = {}
+        from circuitkit.CircuitKit import CircuitKit
+        kits: Dict[str, Tuple[CircuitKit, int]] = {}
+        by_value: Optional[Dict[Tuple[str, ...], str]] = None
+        for item, qty in items.items():
+            if int(qty) <= 0:
+                return None
+            if isinstance(item, CircuitKit):
+                prev = kits.get(item.name)
+                kits[item.name] = (item, int(qty) + (prev[1] if prev else 0))
+                continue
+            if isinstance(item, Component):
+                row = component_to_csv_row(0, item)
+                frag = ",".join(row[1:])
+                if frag not in self.__components:
+                    if by_value is None:
+                        with self.__state:
+                            by_value = {self.__normalized(f): f for f in self.__components}
+                    frag = by_value.get(self.__normalized(frag), frag)
+            else:
+                frag = item
+            frag = ComponentKey.of(frag)
+            comps[frag] = comps.get(frag, 0) + int(qty)
+        return comps, kits
+
+    def __order_total(self, comps: Dict[str, int], kits: Dict[str, Tuple["CircuitKit", int]]) -> float:
+        '''
+        Price a resolved order from the unit price at the end of each fragment.
+
+        Author: Unubileg ADILBISH
+        '''
+        total = 0.0
+        lines = [(q, frag) for frag, q in comps.items()]
+        for kit, q in kits.values():
+            lines.extend([(q * iq, frag) for iq, frag in kit.items])
+        for q, frag in lines:
+            total = total + q * ComponentKey.of(frag).price
+        return total
+
+    def __order_keys(self, comps: Dict[str, int], kits: Dict[str, Tuple["CircuitKit", int]]) -> List[str]:
+        # order lines only change the quantities of the kits they name
+        return ["C" + frag for frag in comps] + ["K" + name for name in kits]
+
+    def complete_purchase_order(self, order: "PurchaseOrder") -> bool:
+        '''
+        Apply every line of a purchase order at once: journal once and write
+        all ledger rows in one append under a single timestamp.
+        Nothing is applied if any line is invalid.
+
+        Parameters:
+        order (PurchaseOrder): The order to complete.
+
+        Returns:
+        bool: True if the order was applied.
+
+        Author: Pratik SAPKOTA
+        '''
+        resolved = self.__resolve_lines(order._items)
+        if resolved is None:
             return False
-        kit = CircuitKit(kit_name, 0.0, self.__kits[kit_name]["items"])
-        self.add_circuit_object(kit, qty)
-        self.save_kits()
-        self.add_circuit_transaction("Purchase Order", kit, qty)
+        comps, kits = resolved
+        with self.__guard(*self.__order_keys(comps, kits)):
+            for name, (kit, q) in kits.items():
+                if name not in self.__kits and len(kit.items) == 0:
+                    return False
+            ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            rows: List[List[Any]] = []
+            for frag, q in comps.items():
+                self.change_component_qty(frag, q)
+                rows.append(self.__component_row("Purchase Order", ts, frag, q))
+            applied: Dict[str, Tuple[CircuitKit, int]] = {}
+            for name, (kit, q) in kits.items():
+                if name in self.__kits:
+                    kit = self.__kits[name]["kit"]
+                self.add_circuit_object(kit, q)
+                rows.append(self.__circuit_row("Purchase Order", ts, kit, q))
+                applied[name] = (kit, q)
+            self.__commit()
+            self.__write(self.__append_ledger, rows)
+        order.salesTotal = self.__order_total(comps, applied)
+        order.completeOrder()
         return True
 
-    def sell_circuit(self, kit_name: str, qty: int) -> bool:
+    def complete_customer_sale(self, sale: "CustomerSale") -> bool:
         '''
-        Sell kits if available, save, and record transaction.
+        Check every line of a customer sale against stock, then apply them all
+        at once: journal once and write all ledger rows in one append.
+        Nothing is applied if any line is short.
+
+        Parameters:
+        sale (CustomerSale): The sale to complete.
+
+        Returns:
+        bool: True if the sale was applied.
 
         Author: Botao HUANG
         '''
-        if kit_name not in self.__kits or int(self.__kits[kit_name]["qty"]) < qty:
+        resolved = self.__resolve_lines(sale._items)
+        if resolved is None:
             return False
-        kit = CircuitKit(kit_name, 0.0, self.__kits[kit_name]["items"])
-        self.change_circuit_qty(kit_name, -qty)
-        self.save_kits()
-        self.add_circuit_transaction("Customer Sale", kit, qty)
+        comps, kits = resolved
+        with self.__guard(*self.__order_keys(comps, kits)):
+            for frag, q in comps.items():
+                if self.__components.get(frag, 0) < q:
+                    return False
+            for name, (kit, q) in kits.items():
+                if name not in self.__kits or int(self.__kits[name]["qty"]) < q:
+                    return False
+            ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            rows: List[List[Any]] = []
+            for frag, q in comps.items():
+                self.change_component_qty(frag, -q)
+                rows.append(self.__component_row("Customer Sale", ts, frag, q))
+            applied: Dict[str, Tuple[CircuitKit, int]] = {}
+            for name, (kit, q) in kits.items():
+                kit = self.__kits[name]["kit"]
+                self.change_circuit_qty(name, -q)
+                rows.append(self.__circuit_row("Customer Sale", ts, kit, q))
+                applied[name] = (kit, q)
+            self.__commit()
+            self.__write(self.__append_ledger, rows)
+        sale.saleTotal = self.__order_total(comps, applied)
+        sale.completeOrder()
         return True
 
     def summarize_transactions(self) -> List[Tuple[str, str, float]]:
         '''
         Summarize transactions by (op_type, timestamp) and calculate totals.
+        Only ledger rows appended since the previous call are read.
+
+        Returns:
+        List[Tuple[str, str, float]]: (op_type, timestamp, total)
 
         Author: Unubileg ADILBISH
         '''
-        # Implementation same as before...
-        results: List[Tuple[str, str, float]] = []
-        # (kept short for space – same logic as Chinese version)
-        return results
+        return self.__read(self.__summarize)
+
+    def __summarize(self) -> List[Tuple[str, str, float]]:
+        return self.__history.summarize()
+
+    def search_transactions(self, start: Any, end: Any = None) -> List["Transaction"]:
+        '''
+        Transactions dated start (or start..end inclusive), read via the day index.
+
+        Parameters:
+        start (date | datetime | str): First day.
+        end (date | datetime | str): Last day, defaults to start.
+
+        Returns:
+        List[Transaction]
+
+        Author: Botao HUANG
+        '''
+        return self.__read(self.__search, start, end)
+
+    def __search(self, start: Any, end: Any) -> List["Transaction"]:
+        from transaction.Transaction import Transaction
+        return Transaction().searchByDate(start, end, self.__ledger_index)
+
+    def rebuild_transaction_index(self) -> int:
+        '''
+        Rebuild the day index over transactions.csv from scratch.
+
+        Returns:
+        int: Number of rows indexed.
+
+        Author: Pratik SAPKOTA
+        '''
+        return self.__read(self.__rebuild_index)
+
+    def __rebuild_index(self) -> int:
+        return self.__ledger_index.rebuild()
 
 
 if __name__ == "__main__":
     from menu import UI
-    UI(App()).home()
\ No newline at end of file
+    # CIRCUITKIT_PROFILE=stats.json turns on profiling, dumped to that file
+    profile_path = os.environ.get("CIRCUITKIT_PROFILE")
+    profiler = None
+    if profile_path:
+        from profiling.Profiler import Profiler
+        profiler = Profiler(dump_path=profile_path)
+    UI(App(background=True, profiler=profiler), profiler=profiler).home()
\ No newline at end of file
@@ -0,0 +1,213 @@
+# File: bench_app.py
+# Author: Unubileg ADILBISH, Pratik SAPKOTA, Botao HUANG
+# ID: 523127, 522498, 521560
+# Email: 523127@learning.eynesbury.edu.au, 522498@learning.eynesbury.edu.au, 521560@learning.eynesbury.edu.au
+# Description: Benchmarks for the App inventory and ledger hot paths on synthetic data, with JSON output and baseline comparison.
+# This is our own work as defined by the Academic Integrity Policy
+#
+# Usage:
+#   python benchmarks/bench_app.py                         # 1k and 100k rows
+#   python benchmarks/bench_app.py --sizes 1k,100k,1m --out results.json
+#   python benchmarks/bench_app.py --baseline benchmarks/baseline.json
+#   python benchmarks/bench_app.py --save-baseline benchmarks/baseline.json
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import platform
+import argparse
+import tempfile
+import statistics
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple, Any, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import App
+from circuitkit.CircuitKit import CircuitKit
+
+SIZES = {"1k": 1000, "10k": 10000, "100k": 100000, "1m": 1000000}
+KIT_WIDTH = 24       # components per kit definition
+OPS = 200            # operations timed per mutating benchmark
+
+
+# ---------------- synthetic data ----------------
+
+def component_fragment(i: int) -> str:
+    '''
+    The i-th synthetic component fragment. Kinds rotate through every
+    schema and the unit price makes each fragment unique.
+    '''
+    j = i // 8
+    price = format(1 + j * 0.01, ".2f")
+    kind = i % 8
+    if kind == 0:
+        return "Wire," + str(10 + j % 500) + "," + price
+    if kind == 1:
+        size, volts = [("AA", "1.5"), ("AAA", "1.2"), ("C", "1.5"), ("D", "9.0")][j % 4]
+        return "Battery," + size + "," + volts + "," + price
+    if kind == 2:
+        return "Solar Panel," + format(1 + j % 12, ".1f") + ",0.5," + price
+    if kind == 3:
+        return "Light Globe," + ["red", "white", "blue"][j % 3] + ",3.0,200," + price
+    if kind == 4:
+        return "LED Light," + ["green", "yellow", "white"][j % 3] + ",2.0,20," + price
+    if kind == 5:
+        return "Switch," + ["push", "slide", "rocker", "toggle"][j % 4] + ",4.5," + price
+    if kind == 6:
+        return "Sensor," + ["motion", "light", "humidity"][j % 3] + ",5.0," + price
+    return "Buzzer," + str(200 + j % 800) + ",85,5.0,30," + price
+
+
+def make_dataset(data_dir: str, n: int, seed: int = 1046) -> List[CircuitKit]:
+    '''
+    Write circuits.csv with n components and components.csv with
+    max(10, n // 1000) kits of KIT_WIDTH components each.
+
+    Returns:
+    List[CircuitKit]: The kit definitions written.
+    '''
+    rng = random.Random(seed)
+    with open(os.path.join(data_dir, "circuits.csv"), "w", newline="", encoding="utf-8") as f:
+        for i in range(n):
+            f.write(str(rng.randint(50, 500)) + "," + component_fragment(i) + "\n")
+    kits = []
+    for k in range(max(10, n // 1000)):
+        picks = rng.sample(range(n), min(KIT_WIDTH, n))
+        items = [(rng.randint(1, 3), component_fragment(i)) for i in picks]
+        kits.append(CircuitKit("Kit " + str(k).zfill(5), 0.0, items))
+    with open(os.path.join(data_dir, "components.csv"), "w", newline="", encoding="utf-8") as f:
+        for kit in kits:
+            f.write(",".join([str(t) for t in kit.to_components_csv_row(5)]) + "\n")
+    return kits
+
+
+# ---------------- timing ----------------
+
+def timed(fn: Callable[[], Any], repeat: int) -> float:
+    '''
+    Median wall time of fn() over repeat runs, in seconds.
+    '''
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t0)
+    return statistics.median(runs)
+
+
+def bench_size(n: int, repeat: int) -> Dict[str, float]:
+    '''
+    Run every benchmark against a fresh synthetic data directory of n rows.
+
+    Returns:
+    Dict[str, float]: metric name -> seconds (totals) or microseconds per op ("_us").
+    '''
+    d = tempfile.mkdtemp(prefix="bench_app_")
+    try:
+        kits = make_dataset(d, n)
+        out: Dict[str, float] = {}
+
+        # load: CSV on a cold directory, then from the binary snapshot
+        out["load_csv_s"] = timed(lambda: App(d).list_component_rows(0, 1), 1)
+        App(d).save_snapshot()
+        out["load_snapshot_s"] = timed(lambda: App(d).list_component_rows(0, 1), repeat)
+
+        app = App(d, checkpoint_every=10 ** 9)
+        app.list_component_rows(0, 1)
+        app.list_circuit_objects(0, 1)  # both datasets loaded before timing
+        out["list_components_all_s"] = timed(lambda: app.list_component_rows(), repeat)
+        mid = n // 2
+        out["list_components_page_us"] = timed(lambda: app.list_component_rows(mid, 25), repeat) * 1e6
+
+        probe = kits[:min(len(kits), OPS)]
+        out["can_pack_us"] = timed(lambda: [app.can_pack(k, 1) for k in probe], repeat) / len(probe) * 1e6
+        out["perform_pack_us"] = timed(lambda: [app.perform_pack(k, 1) for k in probe], 1) / len(probe) * 1e6
+
+        frags = [component_fragment(i) for i in range(0, n, max(1, n // OPS))][:OPS]
+        out["sell_component_us"] = timed(lambda: [app.sell_component(f, 1) for f in frags], 1) / len(frags) * 1e6
+        out["ledger_append_us"] = timed(
+            lambda: [app.add_component_transaction("Purchase Order", f, 1) for f in frags], 1) / len(frags) * 1e6
+        out["checkpoint_s"] = timed(app.checkpoint, 1)
+        return out
+    finally:
+        shutil.rmtree(d, ignore_errors=True)
+
+
+# ---------------- reporting ----------------
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Any],
+            tolerance: float) -> List[Tuple[str, str, float, float, float]]:
+    '''
+    Metrics slower than the baseline by more than tolerance (0.25 = 25%).
+
+    Returns:
+    List[Tuple[str, str, float, float, float]]: (size, metric, baseline, now, ratio)
+    '''
+    regressions = []
+    base = baseline.get("results", {})
+    for size, metrics in results.items():
+        for name, now in metrics.items():
+            old = base.get(size, {}).get(name)
+            if not old:
+                continue
+            ratio = now / old
+            flag = "REGRESSION" if ratio > 1 + tolerance else ""
+            print("  " + size.ljust(5) + " " + name.ljust(26) + format(old, ">12.4f") +
+                  format(now, ">12.4f") + format(ratio, ">8.2f") + "x " + flag)
+            if flag:
+                regressions.append((size, name, old, now, ratio))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark App hot paths on synthetic data.")
+    parser.add_argument("--sizes", default="1k,100k", help="comma list of " + ",".join(SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per read-only benchmark (median)")
+    parser.add_argument("--out", default=None, help="write results JSON here")
+    parser.add_argument("--baseline", default=None, help="compare against this results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline")
+    parser.add_argument("--save-baseline", default=None, help="also write the results as a new baseline")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for label in [s.strip().lower() for s in args.sizes.split(",") if s.strip()]:
+        if label not in SIZES:
+            parser.error("unknown size " + label)
+        print("== " + label + " components ==")
+        results[label] = bench_size(SIZES[label], args.repeat)
+        for name, value in results[label].items():
+            print("  " + name.ljust(26) + format(value, ">12.4f"))
+
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    for path in [args.out, args.save_baseline]:
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+                f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print("== vs " + args.baseline + " (size, metric, baseline, now, ratio) ==")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(str(len(regressions)) + " metric(s) slower than baseline by more than " +
+                  format(args.tolerance * 100, ".0f") + "%")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
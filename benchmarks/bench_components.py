@@ -0,0 +1,145 @@
+# File: bench_components.py
+# Author: Unubileg ADILBISH, Pratik SAPKOTA, Botao HUANG
+# ID: 523127, 522498, 521560
+# Email: 523127@learning.eynesbury.edu.au, 522498@learning.eynesbury.edu.au, 521560@learning.eynesbury.edu.au
+# Description: Per-instance memory (tracemalloc) and construction speed (timeit) of the slotted component classes against an earlier revision.
+# This is our own work as defined by the Academic Integrity Policy
+#
+# Usage:
+#   python benchmarks/bench_components.py                  # 1M objects, against the first commit
+#   python benchmarks/bench_components.py --count 100000 --rev <git revision> --out results.json
+#
+# The baseline classes are taken from "git archive <rev> component" into a
+# temp folder and measured in a child process, so both versions can be
+# imported under the same package name.
+
+import os
+import sys
+import gc
+import json
+import timeit
+import argparse
+import shutil
+import tempfile
+import tarfile
+import subprocess
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# class name -> constructor arguments (the same signature in every revision)
+CASES: List[Tuple[str, Tuple[Any, ...]]] = [
+    ("Component", ("40mm Wire", 1.6)),
+    ("Battery", ("AA Battery", 3.1, 1.5)),
+    ("Light", ("LED Light", 0.5, "red", 2.0, 0.02)),
+    ("Buzzer", (5.0, 0.03, 2300.0, 85.0, 4.5)),
+]
+
+
+def per_instance_bytes(make: Callable[[], Any], count: int) -> float:
+    '''
+    Bytes traced per object while count objects are alive, not counting
+    the list holding them.
+    '''
+    gc.collect()
+    tracemalloc.start()
+    objs = [None] * count
+    base = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        objs[i] = make()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objs
+    return (after - base) / count
+
+
+def construct_ns(make: Callable[[], Any], count: int, repeat: int) -> float:
+    '''
+    Best time of repeat runs, in nanoseconds per construction.
+    '''
+    return min(timeit.repeat(make, number=count, repeat=repeat)) * 1e9 / count
+
+
+def measure(root: str, count: int, repeat: int) -> Dict[str, Dict[str, Any]]:
+    '''
+    Measure every case with the component package found under root.
+    '''
+    sys.path.insert(0, root)
+    out: Dict[str, Dict[str, Any]] = {}
+    for name, args in CASES:
+        cls = getattr(__import__("component." + name, fromlist=[name]), name)
+        make = lambda cls=cls, args=args: cls(*args)
+        row: Dict[str, Any] = {
+            "slotted": not hasattr(make(), "__dict__"),
+            "bytes": per_instance_bytes(make, count),
+            "ns": construct_ns(make, count, repeat),
+        }
+        trusted = getattr(cls, "fromTrusted", None)
+        if trusted is not None:
+            row["trusted_ns"] = construct_ns(lambda t=trusted, args=args: t(*args), count, repeat)
+        out[name] = row
+    return out
+
+
+def measure_in_child(root: str, count: int, repeat: int) -> Dict[str, Dict[str, Any]]:
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), "--measure", root,
+                             "--count", str(count), "--repeat", str(repeat)],
+                            stdout=subprocess.PIPE, check=True)
+    return json.loads(result.stdout)
+
+
+def measure_revision(rev: str, count: int, repeat: int) -> Dict[str, Dict[str, Any]]:
+    '''
+    Extract component/ at rev and measure it in a child process.
+    '''
+    folder = tempfile.mkdtemp()
+    try:
+        archive = os.path.join(folder, "component.tar")
+        with open(archive, "wb") as f:
+            subprocess.run(["git", "archive", rev, "component"], cwd=ROOT, stdout=f, check=True)
+        with tarfile.open(archive) as tar:
+            tar.extractall(folder)
+        return measure_in_child(folder, count, repeat)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def first_commit() -> str:
+    return subprocess.run(["git", "rev-list", "--max-parents=0", "HEAD"], cwd=ROOT,
+                          stdout=subprocess.PIPE, check=True, text=True).stdout.split()[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare component memory and construction speed with an earlier revision.")
+    parser.add_argument("--count", type=int, default=1000000, help="objects per measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="timeit repeats (the best is kept)")
+    parser.add_argument("--rev", default=None, help="git revision to compare with (default: first commit)")
+    parser.add_argument("--out", default=None, help="write results as JSON")
+    parser.add_argument("--measure", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        print(json.dumps(measure(args.measure, args.count, args.repeat)))
+        return
+
+    rev = args.rev if args.rev is not None else first_commit()
+    baseline = measure_revision(rev, args.count, args.repeat)
+    current = measure_in_child(ROOT, args.count, args.repeat)
+
+    print(str(args.count) + " objects per class, baseline " + rev[:10])
+    print(format("class", "<10") + format("B/obj base", ">12") + format("B/obj now", ">11") +
+          format("ns base", ">10") + format("ns now", ">9") + format("ns trusted", ">12"))
+    for name, _ in CASES:
+        b = baseline[name]
+        c = current[name]
+        trusted = format(c["trusted_ns"], ".0f") if "trusted_ns" in c else "-"
+        print(format(name, "<10") + format(b["bytes"], ">12.1f") + format(c["bytes"], ">11.1f") +
+              format(b["ns"], ">10.0f") + format(c["ns"], ">9.0f") + format(trusted, ">12"))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"count": args.count, "baseline_rev": rev, "baseline": baseline, "current": current}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
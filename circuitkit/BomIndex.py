@@ -0,0 +1,161 @@
+# File: BomIndex.py
+# Author: Botao HUANG
+# ID: 521560
+# Email: 521560@learning.eynesbury.edu.au
+# Description: Compiled bill of materials for every kit, with a component -> kits reverse index.
+# This is my own work as defined by the Academic Integrity Policy
+
+from array import array
+from typing import Dict, List, Set, Tuple, Optional
+
+
+class BomIndex:
+    '''
+    Bill-of-materials index over kit definitions.
+
+    Every component fragment used by a kit gets a small integer id. Each kit
+    definition is compiled once into a BOM vector: parallel arrays of
+    component ids and per-kit quantities, with repeated fragments merged.
+    A reverse index maps every component id to the names of the kits that
+    use it.
+
+    Botao HUANG
+    '''
+
+    def __init__(self) -> None:
+        self.__frags: List[str] = []
+        self.__id_of: Dict[str, int] = {}
+        self.__boms: Dict[str, Tuple[array, array]] = {}
+        self.__users: Dict[int, Set[str]] = {}
+
+    def __component_id(self, frag: str) -> int:
+        cid = self.__id_of.get(frag)
+        if cid is None:
+            cid = len(self.__frags)
+            self.__id_of[frag] = cid
+            self.__frags.append(frag)
+        return cid
+
+    def compile(self, name: str, items: List[Tuple[int, str]]) -> Tuple[array, array]:
+        '''
+        Compile (or recompile) the BOM of a kit and update the reverse index.
+
+        Parameters:
+        name (str): Kit name.
+        items (List[Tuple[int, str]]): Kit definition as (qty, fragment) pairs.
+
+        Returns:
+        Tuple[array, array]: (component ids, quantities per kit)
+        Botao HUANG
+        '''
+        self.remove(name)
+        merged: Dict[int, int] = {}
+        for q, frag in items:
+            if q <= 0:
+                continue
+            cid = self.__component_id(frag)
+            merged[cid] = merged.get(cid, 0) + int(q)
+        bom = (array("l", merged.keys()), array("q", merged.values()))
+        self.__boms[name] = bom
+        for cid in merged:
+            self.__users.setdefault(cid, set()).add(name)
+        return bom
+
+    def remove(self, name: str) -> None:
+        '''
+        Forget a kit definition.
+        Botao HUANG
+        '''
+        bom = self.__boms.pop(name, None)
+        if bom is None:
+            return
+        for cid in bom[0]:
+            users = self.__users.get(cid)
+            if users is not None:
+                users.discard(name)
+                if not users:
+                    del self.__users[cid]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__boms
+
+    def lines(self, name: str, count: int = 1) -> List[Tuple[str, int]]:
+        '''
+        BOM of a kit scaled to count kits, as (fragment, qty) pairs.
+
+        Parameters:
+        name (str): Kit name.
+        count (int): Number of kits.
+
+        Returns:
+        List[Tuple[str, int]]: Empty if the kit is unknown.
+        Botao HUANG
+        '''
+        bom = self.__boms.get(name)
+        if bom is None:
+            return []
+        frags = self.__frags
+        return [(frags[cid], q * count) for cid, q in zip(bom[0], bom[1])]
+
+    def shortfall(self, name: str, count: int, stock: Dict[str, int]) -> Optional[str]:
+        '''
+        First component that stock cannot cover for count kits, or None.
+        Botao HUANG
+        '''
+        bom = self.__boms.get(name)
+        if bom is None:
+            return None
+        frags = self.__frags
+        for cid, q in zip(bom[0], bom[1]):
+            if stock.get(frags[cid], 0) < q * count:
+                return frags[cid]
+        return None
+
+    def packable(self, name: str, stock: Dict[str, int],
+                 without: Optional[str] = None) -> Tuple[int, Optional[str]]:
+        '''
+        How many of a kit the stock can make, and the component that limits it.
+
+        Parameters:
+        name (str): Kit name.
+        stock (Dict[str, int]): fragment -> quantity on hand.
+        without (Optional[str]): Treat this component as out of stock.
+
+        Returns:
+        Tuple[int, Optional[str]]: (count, bottleneck fragment); (0, None)
+        for unknown or empty kits.
+        Botao HUANG
+        '''
+        bom = self.__boms.get(name)
+        if bom is None or len(bom[0]) == 0:
+            return 0, None
+        frags = self.__frags
+        best = -1
+        limit: Optional[str] = None
+        for cid, q in zip(bom[0], bom[1]):
+            frag = frags[cid]
+            have = 0 if frag == without else stock.get(frag, 0)
+            n = have // q
+            if best < 0 or n < best:
+                best = n
+                limit = frag
+        return max(best, 0), limit
+
+    def users(self, frag: str) -> Set[str]:
+        '''
+        Names of the kits whose definition uses a component.
+        Botao HUANG
+        '''
+        cid = self.__id_of.get(frag)
+        if cid is None:
+            return set()
+        return set(self.__users.get(cid, ()))
+
+    def definitions(self) -> Dict[str, List[Tuple[int, str]]]:
+        '''
+        Merged kit definitions as name -> [(qty, fragment), ...].
+        Botao HUANG
+        '''
+        frags = self.__frags
+        return {name: [(q, frags[cid]) for cid, q in zip(ids, qtys)]
+                for name, (ids, qtys) in self.__boms.items()}
@@ -6,6 +6,11 @@
 # This is my own work as defined by the Academic Integrity Policy
 
 from typing import List, Tuple
+from component.ComponentKey import ComponentKey
+
+# item parsing requires knowing how many columns each type has
+# (fields after item_type, same layout as circuits.csv); see component.schema
+from component.schema import ITEM_ARITY
 
 
 class CircuitKit:
@@ -16,7 +21,8 @@ class CircuitKit:
     name (str): Kit display name, e.g., "Light Circuit", "Sensor Circuit".
     price (float): Optional overall price (not stored in CSV; computed in UI when needed).
     items (List[Tuple[int, str]]): A list of (qty, component_row_without_stock_qty).
-                                   component_row_without_stock_qty is like "Battery,AA,1.5,3.1".
+                                   component_row_without_stock_qty is an interned ComponentKey
+                                   such as "Battery,AA,1.5,3.1".
     Your Name
     '''
 
@@ -34,7 +40,7 @@ class CircuitKit:
         self.price = float(price) if price is not None else 0.0
         self.items: List[Tuple[int, str]] = []
         for q, frag in items:
-            self.items.append((int(q), str(frag).strip()))
+            self.items.append((int(q), ComponentKey.of(frag)))
 
     # ---------------- Heading helpers for UI ----------------
 
@@ -62,11 +68,40 @@ class CircuitKit:
         '''
         out: List[str] = []
         for qty, frag in self.items:
-            parts = [c.strip() for c in frag.split(",")]
             out.append(str(int(qty)))
-            out.extend(parts)
+            out.extend(frag.parts)
         return out
 
+    @staticmethod
+    def parse_item_tokens(tokens: List[str]) -> List[Tuple[int, str]]:
+        '''
+        Parse flat item tokens back into (qty, component_fragment) pairs.
+        Parsing stops at the first token that does not fit the format.
+
+        Format:
+          item_qty, item_type, ...fields..., item_qty, item_type, ...fields...
+        Your Name
+        '''
+        items: List[Tuple[int, str]] = []
+        i = 0
+        while i < len(tokens):
+            try:
+                item_qty = int(str(tokens[i]).strip())
+            except Exception:
+                break
+            i = i + 1
+            if i >= len(tokens):
+                break
+            item_type = tokens[i].strip()
+            i = i + 1
+            ncols = ITEM_ARITY.get(item_type, 0)
+            if ncols <= 0 or i + ncols - 1 >= len(tokens):
+                break
+            fields = [item_type] + [c.strip() for c in tokens[i:i + ncols]]
+            i = i + ncols
+            items.append((item_qty, ComponentKey.of(",".join(fields))))
+        return items
+
     @staticmethod
     def from_components_csv_row(row: List[str]) -> Tuple[int, "CircuitKit"]:
         '''
@@ -86,38 +121,7 @@ class CircuitKit:
 
         kit_name = row[1].strip()
 
-        # item parsing requires knowing how many columns each type has
-        arity = {
-            "Wire": 3,
-            "Battery": 4,
-            "Solar Panel": 4,
-            "Light Globe": 5,
-            "LED Light": 5,
-            "Switch": 4,
-            "Sensor": 4,
-            "Buzzer": 6,
-        }
-
-        items: List[Tuple[int, str]] = []
-        i = 2
-        while i < len(row):
-            try:
-                item_qty = int(str(row[i]).strip())
-            except Exception:
-                break
-            i = i + 1
-            if i >= len(row):
-                break
-            item_type = row[i].strip()
-            i = i + 1
-            ncols = arity.get(item_type, 0)
-            if ncols <= 0 or i + ncols - 1 >= len(row):
-                break
-            fields = [item_type] + [c.strip() for c in row[i:i + ncols]]
-            i = i + ncols
-            frag = ",".join(fields)
-            items.append((item_qty, frag))
-
+        items = CircuitKit.parse_item_tokens(row[2:])
         kit = CircuitKit(kit_name, 0.0, items)
         return qty, kit
 
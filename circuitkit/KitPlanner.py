@@ -0,0 +1,82 @@
+# File: KitPlanner.py
+# Author: Botao HUANG
+# ID: 521560
+# Email: 521560@learning.eynesbury.edu.au
+# Description: Computes how many of every kit can be packed from current stock.
+# This is my own work as defined by the Academic Integrity Policy
+
+from array import array
+from operator import floordiv
+from typing import Dict, List, Tuple, Optional
+
+
+class KitPlanner:
+    '''
+    Kit availability planner.
+
+    Kit definitions are compiled once into a sparse requirement matrix
+    (row pointers, component columns and per-kit quantities, all typed
+    arrays). plan() gathers the stock for every column into an array and
+    works out, for every kit in one pass, the maximum packable count and the
+    component fragment that limits it.
+
+    Botao HUANG
+    '''
+
+    def __init__(self, kits: Dict[str, List[Tuple[int, str]]]) -> None:
+        '''
+        Compile kit definitions.
+
+        Parameters:
+        kits (Dict[str, List[Tuple[int, str]]]): kit name -> [(qty, fragment), ...]
+        Botao HUANG
+        '''
+        self.__names: List[str] = []
+        self.__frags: List[str] = []
+        col_of: Dict[str, int] = {}
+        self.__row_ptr = array("l", [0])
+        self.__cols = array("l")
+        self.__need = array("q")
+        for name, items in kits.items():
+            # the same fragment may appear twice in a kit; merge it
+            merged: Dict[int, int] = {}
+            for q, frag in items:
+                if q <= 0:
+                    continue
+                col = col_of.get(frag)
+                if col is None:
+                    col = len(self.__frags)
+                    col_of[frag] = col
+                    self.__frags.append(frag)
+                merged[col] = merged.get(col, 0) + int(q)
+            self.__names.append(name)
+            self.__cols.extend(merged.keys())
+            self.__need.extend(merged.values())
+            self.__row_ptr.append(len(self.__cols))
+
+    def plan(self, stock: Dict[str, int]) -> Dict[str, Tuple[int, Optional[str]]]:
+        '''
+        Maximum packable count for every kit against the given stock.
+
+        Parameters:
+        stock (Dict[str, int]): fragment -> quantity on hand.
+
+        Returns:
+        Dict[str, Tuple[int, Optional[str]]]: kit name -> (max count, bottleneck
+        fragment). Kits without items report (0, None).
+        Botao HUANG
+        '''
+        have = array("q", [stock.get(f, 0) for f in self.__frags])
+        per_item = list(map(floordiv, map(have.__getitem__, self.__cols), self.__need))
+        out: Dict[str, Tuple[int, Optional[str]]] = {}
+        ptr = self.__row_ptr
+        for k, name in enumerate(self.__names):
+            lo = ptr[k]
+            hi = ptr[k + 1]
+            if lo == hi:
+                out[name] = (0, None)
+                continue
+            seg = per_item[lo:hi]
+            best = min(seg)
+            out[name] = (max(best, 0), self.__frags[self.__cols[lo + seg.index(best)]])
+        return out
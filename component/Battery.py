@@ -14,6 +14,8 @@ class Battery(Component):
     Unubileg
     '''
 
+    __slots__ = ("_voltage",)
+
     def __init__(self, name: str, price: float, voltage: float):
         '''
         Initializes the Battery with name, price, and voltage.
@@ -22,6 +24,18 @@ class Battery(Component):
         super().__init__(name, price)
         self._voltage = float(voltage)
 
+    @classmethod
+    def fromTrusted(cls, name: str, price: float, voltage: float) -> "Battery":
+        '''
+        Builds a Battery from already validated data, skipping the setters.
+        Unubileg
+        '''
+        obj = cls.__new__(cls)
+        obj._name = name
+        obj._price = price
+        obj._voltage = voltage
+        return obj
+
     @property
     def name(self) -> str:
         '''Returns the name of the battery. Unubileg'''
@@ -8,6 +8,8 @@
 from component.Component import Component
 
 class Buzzer(Component):
+    __slots__ = ("__voltage", "__current", "__frequency", "__sound_pressure")
+
     def __init__(self, voltage: float, current: float, frequency: float, sound_pressure: float, price: float) -> None:
         super().__init__("Buzzer", price)
         self.__voltage = voltage
@@ -15,6 +17,17 @@ class Buzzer(Component):
         self.__frequency = frequency
         self.__sound_pressure = sound_pressure
 
+    @classmethod
+    def fromTrusted(cls, voltage: float, current: float, frequency: float, sound_pressure: float, price: float) -> "Buzzer":
+        obj = cls.__new__(cls)
+        obj._name = "Buzzer"
+        obj._price = price
+        obj.__voltage = voltage
+        obj.__current = current
+        obj.__frequency = frequency
+        obj.__sound_pressure = sound_pressure
+        return obj
+
     @property
     def voltage(self) -> float:
         return self.__voltage
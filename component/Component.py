@@ -11,6 +11,8 @@ class Component:
     Unubileg
     '''
 
+    __slots__ = ("_name", "_price")
+
     def __init__(self, name: str, price: float):
         '''
         Initializes the component with a name and price.
@@ -25,6 +27,22 @@ class Component:
         self.name = name
         self.price = price
 
+    @classmethod
+    def fromTrusted(cls, name: str, price: float) -> "Component":
+        '''
+        Builds a component from already validated data (e.g. a snapshot
+        written by this program), skipping the property setters.
+
+        Parameters:
+        name (str): The name of the component.
+        price (float): The price of the component, already a float.
+        Unubileg
+        '''
+        obj = cls.__new__(cls)
+        obj._name = name
+        obj._price = price
+        return obj
+
     @property
     def name(self) -> str:
         '''
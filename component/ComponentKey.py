@@ -0,0 +1,129 @@
+# File: ComponentKey.py
+# Author: Unubileg
+# ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Parsed, interned inventory key for a component fragment
+# This is my own work as defined by the Academic Integrity Policy
+
+import weakref
+from typing import Optional, Tuple
+from component.schema import SCHEMAS
+
+# position of the voltage field in each kind's parts (kind is position 0)
+VOLTAGE_FIELD = {kind: s.voltage_index for kind, s in SCHEMAS.items() if s.voltage_index}
+# position of the current field and the factor that turns it into amps
+CURRENT_FIELD = {kind: (s.current_index, s.current_scale) for kind, s in SCHEMAS.items() if s.current_index}
+
+
+class ComponentKey(str):
+    '''
+    Inventory key for a component fragment such as "Battery,AA,1.5,3.1".
+
+    A ComponentKey is the fragment string itself (so it hashes, compares and
+    writes exactly like the plain string), with the fields parsed once:
+    kind, attributes, price and the numeric value of every field. Keys are
+    interned by their canonical text for as long as something holds them,
+    so ComponentKey.of() returns the same object for the same fragment
+    everywhere and nothing re-splits or re-parses it later. The fields are
+    slots, so a key carries no per-instance __dict__.
+    Unubileg
+    '''
+
+    __slots__ = ("kind", "parts", "attrs", "numbers", "price", "voltage", "current", "__weakref__")
+
+    kind: str
+    parts: Tuple[str, ...]
+    attrs: Tuple[str, ...]
+    numbers: Tuple[Optional[float], ...]
+    price: float
+    voltage: Optional[float]
+    current: Optional[float]
+
+    @staticmethod
+    def of(frag: str) -> "ComponentKey":
+        '''
+        Return the interned key for frag, parsing it the first time it is seen.
+
+        Parameters:
+        frag (str): Component fragment (row without stock quantity).
+
+        Returns:
+        ComponentKey
+        Unubileg
+        '''
+        if type(frag) is ComponentKey:
+            return frag
+        key = _INTERNED.get(frag)
+        if key is not None:
+            return key
+        # only canonical text is interned; other spellings are split each time
+        parts = tuple([c.strip() for c in str(frag).split(",")])
+        canonical = ",".join(parts)
+        key = _INTERNED.get(canonical)
+        if key is None:
+            key = str.__new__(ComponentKey, canonical)
+            key.__parse(parts)
+            _INTERNED[canonical] = key
+        return key
+
+    @staticmethod
+    def of_canonical(frag: str) -> "ComponentKey":
+        '''
+        Interned key for a fragment that is already in canonical form (no
+        spaces around commas), e.g. one read back from the binary snapshot.
+        Only the kind is split off now; the other fields are parsed the first
+        time one of them is used.
+
+        Parameters:
+        frag (str): Canonical component fragment.
+
+        Returns:
+        ComponentKey
+        Unubileg
+        '''
+        key = _INTERNED.get(frag)
+        if key is None:
+            key = str.__new__(ComponentKey, frag)
+            key.kind = frag.split(",", 1)[0]
+            _INTERNED[frag] = key
+        return key
+
+    def __parse(self, parts: Tuple[str, ...]) -> None:
+        numbers = []
+        for p in parts:
+            # skip the exception for obvious words such as the kind
+            if p[:1] in _NUMBER_START:
+                try:
+                    numbers.append(float(p))
+                    continue
+                except ValueError:
+                    pass
+            numbers.append(None)
+        self.parts = parts
+        self.kind = parts[0]
+        self.attrs = parts[1:-1]
+        self.numbers = tuple(numbers)
+        last = numbers[-1] if len(parts) > 1 else None
+        self.price = last if last is not None else 0.0
+        vi = VOLTAGE_FIELD.get(self.kind, 0)
+        self.voltage = numbers[vi] if 0 < vi < len(numbers) - 1 else None
+        ci, scale = CURRENT_FIELD.get(self.kind, (0, 1.0))
+        current = numbers[ci] if 0 < ci < len(numbers) - 1 else None
+        self.current = current * scale if current is not None else None
+
+    def __getattr__(self, name: str):
+        # only reached for keys made by of_canonical() that are not parsed yet
+        if name in _PARSED_FIELDS:
+            self.__parse(tuple(str.split(self, ",")))
+            return object.__getattribute__(self, name)
+        raise AttributeError(name)
+
+    def __reduce__(self):
+        # unpickle through of() so keys stay interned across processes
+        return (ComponentKey.of, (str(self),))
+
+
+# canonical fragment -> key; an entry goes when the last reference to its key does
+_INTERNED: "weakref.WeakValueDictionary[str, ComponentKey]" = weakref.WeakValueDictionary()
+_PARSED_FIELDS = frozenset(["parts", "attrs", "numbers", "price", "voltage", "current"])
+_NUMBER_START = frozenset("0123456789+-.")
@@ -15,6 +15,8 @@ class InputComponent(Component, ABC):
     Unubileg
     '''
 
+    __slots__ = ("__voltage",)
+
     def __init__(self, name: str, voltage: float, price: float):
         super().__init__(name, price)
         self.__voltage = voltage
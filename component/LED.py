@@ -8,6 +8,8 @@
 from component.Component import Component
 
 class LED(Component):
+    __slots__ = ("__colour", "__voltage", "__current")
+
     def __init__(self, colour: str, voltage: float, current: float, price: float) -> None:
         super().__init__("LED Light", price)
         self.__colour = colour
@@ -10,12 +10,24 @@
 from component.Component import Component
 
 class Light(Component):
+    __slots__ = ("colour", "current", "voltage")
+
     def __init__(self, name: str, price: float, colour: str = "", voltage: float = 0.0, current: float = 0.0) -> None:
         super().__init__(name, price)
         self.colour = colour
         self.current = float(current)
         self.voltage = float(voltage)
 
+    @classmethod
+    def fromTrusted(cls, name: str, price: float, colour: str = "", voltage: float = 0.0, current: float = 0.0) -> "Light":
+        obj = cls.__new__(cls)
+        obj._name = name
+        obj._price = price
+        obj.colour = colour
+        obj.current = current
+        obj.voltage = voltage
+        return obj
+
     def showDetails(self):
         head = super().showDetails()[:-1]
         volt = format(self.voltage, ".2f") + "V"
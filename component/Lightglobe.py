@@ -13,6 +13,8 @@ class Lightglobe(Light):
     Unubileg
     '''
 
+    __slots__ = ()
+
     def __init__(self, name: str, price: float, colour: str, voltage: float, current: float):
         super().__init__(name, price, colour, voltage, current)
 
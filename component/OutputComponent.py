@@ -14,6 +14,8 @@ class OutputComponent(Component, ABC):
     Unubileg
     '''
 
+    __slots__ = ("__voltage",)
+
     def __init__(self, name: str, voltage: float, price: float):
         super().__init__(name, price)
         self.__voltage = voltage
@@ -9,6 +9,8 @@ from component.Component import Component
 from abc import ABC
 
 class PowerSupply(Component, ABC):
+    __slots__ = ("__voltage",)
+
     def __init__(self, name: str, voltage: float, price: float) -> None:
         super().__init__(name, price)
         self.__voltage = voltage
@@ -8,6 +8,8 @@
 from component.Component import Component
 
 class Sensor(Component):
+    __slots__ = ("__sensor_type", "__voltage")
+
     def __init__(self, sensor_type: str, voltage: float, price: float) -> None:
         super().__init__("Sensor", price)
         self.__sensor_type = sensor_type
@@ -13,6 +13,8 @@ class Solarpanel(Component):
     Unubileg
     '''
 
+    __slots__ = ("__voltage", "__current")
+
     def __init__(self, voltage: float, current: float, price: float):
         super().__init__("Solar Panel", price)
         self.__voltage = voltage
@@ -8,6 +8,8 @@
 from component.Component import Component
 
 class Switch(Component):
+    __slots__ = ("__switch_type", "__voltage")
+
     def __init__(self, switch_type: str, voltage: float, price: float) -> None:
         super().__init__("Switch", price)
         self.__switch_type = switch_type
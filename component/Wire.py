@@ -10,11 +10,13 @@
 from component.Component import Component
 
 class Wire(Component):
+    __slots__ = ("_length", "_colour")
+
     def __init__(self, name: str, price: float, length: float, colour: str) -> None:
         super().__init__(name, price)
         self._length = float(length)
         self._colour = colour
-        
+
     @property
     def name(self) -> str:
         return self._name
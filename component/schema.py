@@ -0,0 +1,197 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from component.Component import Component
+from component.Light import Light
+from component.Battery import Battery
+from component.Buzzer import Buzzer
+
+# Column types
+T_STR   = "str"
+T_FLOAT = "float"
+
+# Label segment ops: (op, column[, decimals])
+#   "f"     number with n decimals      "ma"    amps shown as mA, 1 decimal
+#   "int"   number as integer           "upper" / "title" / "text"  text column
+#   plain strings are copied as-is
+
+
+class ComponentSchema:
+    """
+    Declarative CSV layout of one component kind. The column list and the
+    label templates are compiled once into decode / encode / label callables,
+    so per-row work is a dict lookup plus the compiled call.
+    """
+
+    def __init__(self, kind: str, columns: Sequence[Tuple[str, str]],
+                 build: Callable[[Tuple[Any, ...]], Component],
+                 to_fields: Callable[[Component], List[str]],
+                 caps: Sequence[Any], pretty: Sequence[Any],
+                 build_trusted: Optional[Callable[[Tuple[Any, ...]], Component]] = None) -> None:
+        self.kind = kind
+        self.columns = tuple(name for name, _ in columns)
+        self.arity = len(self.columns)
+        # position of each column in a fragment's parts (kind is position 0)
+        self.position = {name: i + 1 for i, name in enumerate(self.columns)}
+        self.voltage_index = self.position.get("voltage", 0)
+        # current is stored in A or mA depending on the kind; scale gives amps
+        self.current_index = self.position.get("current", self.position.get("current_ma", 0))
+        self.current_scale = 0.001 if "current_ma" in self.position else 1.0
+        self.price_index = self.position["price"]
+        convs = [float if t == T_FLOAT else str.strip for _, t in columns]
+        self.decode: Callable[[Sequence[str]], Tuple[Any, ...]] = \
+            lambda fields: tuple([conv(f) for conv, f in zip(convs, fields)])
+        self._build = build
+        self._build_trusted = build_trusted if build_trusted is not None else build
+        self._to_fields = to_fields
+        self.caps: Callable[[Sequence[str], Sequence[Optional[float]]], str] = self.__compile_label(caps)
+        self.pretty: Callable[[Sequence[str], Sequence[Optional[float]]], str] = self.__compile_label(pretty)
+
+    def __compile_label(self, template: Sequence[Any]) -> Callable[[Sequence[str], Sequence[Optional[float]]], str]:
+        segs: List[Callable[[Sequence[str], Sequence[Optional[float]]], str]] = []
+        for seg in template:
+            if isinstance(seg, str):
+                segs.append(lambda p, n, s=seg: s)
+                continue
+            op = seg[0]
+            i = self.position[seg[1]]
+            if op == "f":
+                fmt = "." + str(seg[2]) + "f"
+                segs.append(lambda p, n, i=i, fmt=fmt: p[i] if n[i] is None else format(n[i], fmt))
+            elif op == "ma":
+                segs.append(lambda p, n, i=i: p[i] if n[i] is None else format(n[i] * 1000.0, ".1f"))
+            elif op == "int":
+                segs.append(lambda p, n, i=i: p[i] if n[i] is None else str(int(n[i])))
+            elif op == "upper":
+                segs.append(lambda p, n, i=i: p[i].upper())
+            elif op == "title":
+                segs.append(lambda p, n, i=i: p[i][0:1].upper() + p[i][1:].lower())
+            else:
+                segs.append(lambda p, n, i=i: p[i])
+        return lambda parts, numbers: "".join([s(parts, numbers) for s in segs])
+
+    def to_component(self, fields: Sequence[str], trusted: bool = False) -> Component:
+        """
+        Decode fields (excluding qty and kind) into a Component object.
+        trusted=True is for rows this program wrote itself (e.g. the ledger):
+        the object is built with fromTrusted, skipping the checking setters.
+        """
+        if trusted:
+            return self._build_trusted(self.decode(fields))
+        return self._build(self.decode(fields))
+
+    def component_fields(self, comp: Component) -> List[str]:
+        """
+        Encode a Component object back to its CSV fields (excluding qty and kind).
+        """
+        return self._to_fields(comp)
+
+
+def _wire_length(comp: Component) -> str:
+    try:
+        return str(int(float(comp.name.split("mm")[0])))
+    except Exception:
+        return "0"
+
+
+SCHEMAS: Dict[str, ComponentSchema] = {}
+
+
+def register(schema: ComponentSchema) -> ComponentSchema:
+    SCHEMAS[schema.kind] = schema
+    return schema
+
+
+WIRE = register(ComponentSchema(
+    "Wire", [("length", T_FLOAT), ("price", T_FLOAT)],
+    lambda v: Component(str(int(v[0])) + "mm Wire", v[1]),
+    lambda c: [_wire_length(c), format(c.price, ".2f")],
+    caps=[("f", "length", 0), "MM WIRE $", ("f", "price", 2)],
+    pretty=[("f", "length", 0), "mm Wire $", ("f", "price", 2)],
+    build_trusted=lambda v: Component.fromTrusted(str(int(v[0])) + "mm Wire", v[1])))
+
+BATTERY = register(ComponentSchema(
+    "Battery", [("size", T_STR), ("voltage", T_FLOAT), ("price", T_FLOAT)],
+    lambda v: Battery(v[0].upper() + " Battery", v[2], v[1]),
+    lambda c: [c.name.split(" ")[0].upper(), format(c.voltage, ".1f"), format(c.price, ".2f")],
+    caps=[("f", "voltage", 1), "V ", ("upper", "size"), " BATTERY $", ("f", "price", 2)],
+    pretty=[("f", "voltage", 1), "V ", ("upper", "size"), " Battery $", ("f", "price", 2)],
+    build_trusted=lambda v: Battery.fromTrusted(v[0].upper() + " Battery", v[2], v[1])))
+
+SOLAR_PANEL = register(ComponentSchema(
+    "Solar Panel", [("voltage", T_FLOAT), ("current", T_FLOAT), ("price", T_FLOAT)],
+    lambda v: Light("Solar Panel", v[2], "", v[0], v[1]),
+    lambda c: [format(c.voltage, ".1f"), format(c.current, ".1f"), format(c.price, ".2f")],
+    caps=[("f", "voltage", 1), "V ", ("ma", "current"), "MA SOLAR PANEL $", ("f", "price", 2)],
+    pretty=[("f", "voltage", 1), "V ", ("ma", "current"), "mA Solar Panel $", ("f", "price", 2)],
+    build_trusted=lambda v: Light.fromTrusted("Solar Panel", v[2], "", v[0], v[1])))
+
+LIGHT_GLOBE = register(ComponentSchema(
+    "Light Globe", [("colour", T_STR), ("voltage", T_FLOAT), ("current_ma", T_FLOAT), ("price", T_FLOAT)],
+    lambda v: Light("Light Globe", v[3], v[0], v[1], v[2] / 1000.0),
+    lambda c: [getattr(c, "colour", "").lower(), format(c.voltage, ".1f"), format(c.current * 1000.0, ".0f"), format(c.price, ".2f")],
+    caps=[("f", "voltage", 1), "V ", ("f", "current_ma", 1), "MA ", ("upper", "colour"), " LIGHT GLOBE $", ("f", "price", 2)],
+    pretty=[("f", "voltage", 1), "V ", ("f", "current_ma", 1), "mA ", ("title", "colour"), " Light Globe $", ("f", "price", 2)],
+    build_trusted=lambda v: Light.fromTrusted("Light Globe", v[3], v[0], v[1], v[2] / 1000.0)))
+
+LED_LIGHT = register(ComponentSchema(
+    "LED Light", [("colour", T_STR), ("voltage", T_FLOAT), ("current_ma", T_FLOAT), ("price", T_FLOAT)],
+    lambda v: Light("LED Light", v[3], v[0], v[1], v[2] / 1000.0),
+    lambda c: [getattr(c, "colour", "").lower(), format(c.voltage, ".1f"), format(c.current * 1000.0, ".0f"), format(c.price, ".2f")],
+    caps=[("f", "voltage", 1), "V ", ("f", "current_ma", 1), "MA ", ("upper", "colour"), " LED LIGHT $", ("f", "price", 2)],
+    pretty=[("f", "voltage", 1), "V ", ("f", "current_ma", 1), "mA ", ("title", "colour"), " LED Light $", ("f", "price", 2)],
+    build_trusted=lambda v: Light.fromTrusted("LED Light", v[3], v[0], v[1], v[2] / 1000.0)))
+
+SWITCH = register(ComponentSchema(
+    "Switch", [("type", T_STR), ("voltage", T_FLOAT), ("price", T_FLOAT)],
+    lambda v: Component(v[0].capitalize() + " Switch", v[2]),
+    lambda c: ["push", "4.5", format(c.price, ".2f")],
+    caps=[("f", "voltage", 1), "V ", ("upper", "type"), " SWITCH $", ("f", "price", 2)],
+    pretty=[("f", "voltage", 1), "V ", ("title", "type"), " Switch $", ("f", "price", 2)],
+    build_trusted=lambda v: Component.fromTrusted(v[0].capitalize() + " Switch", v[2])))
+
+SENSOR = register(ComponentSchema(
+    "Sensor", [("type", T_STR), ("voltage", T_FLOAT), ("price", T_FLOAT)],
+    lambda v: Component(v[0].capitalize() + " Sensor", v[2]),
+    lambda c: [c.name.split(" ")[0].lower(), "5.0", format(c.price, ".2f")],
+    caps=[("f", "voltage", 1), "V ", ("upper", "type"), " SENSOR $", ("f", "price", 2)],
+    pretty=[("f", "voltage", 1), "V ", ("title", "type"), " Sensor $", ("f", "price", 2)],
+    build_trusted=lambda v: Component.fromTrusted(v[0].capitalize() + " Sensor", v[2])))
+
+BUZZER = register(ComponentSchema(
+    "Buzzer", [("frequency", T_FLOAT), ("spl", T_FLOAT), ("voltage", T_FLOAT), ("current_ma", T_FLOAT), ("price", T_FLOAT)],
+    lambda v: Buzzer(v[2], v[3] / 1000.0, v[0], v[1], v[4]),
+    lambda c: [format(c.frequency, ".1f"), format(c.sound_pressure, ".0f"),
+               format(c.voltage, ".1f"), format(c.current * 1000.0, ".0f"), format(c.price, ".2f")],
+    caps=[("f", "voltage", 1), "V ", ("f", "current_ma", 1), "MA ", ("f", "frequency", 1), "HZ ", ("int", "spl"), "DB BUZZER $", ("f", "price", 2)],
+    pretty=[("f", "voltage", 1), "V ", ("f", "current_ma", 1), "mA ", ("f", "frequency", 1), "Hz ", ("int", "spl"), "dB Buzzer $", ("f", "price", 2)],
+    build_trusted=lambda v: Buzzer.fromTrusted(v[2], v[3] / 1000.0, v[0], v[1], v[4])))
+
+# Lookup tables built once: case-insensitive kind names and the last word of
+# a component's name (e.g. "40mm Wire", "Push Switch") for encoding objects.
+BY_LOWER_KIND: Dict[str, ComponentSchema] = {k.lower(): s for k, s in SCHEMAS.items()}
+_BY_NAME_SUFFIX: Dict[str, ComponentSchema] = {"wire": WIRE, "battery": BATTERY, "switch": SWITCH, "sensor": SENSOR}
+ITEM_ARITY: Dict[str, int] = {k: s.arity for k, s in SCHEMAS.items()}
+
+
+def schema_for_kind(kind: str) -> Optional[ComponentSchema]:
+    """
+    Schema for a kind name as written in the CSVs (case-insensitive).
+    """
+    s = SCHEMAS.get(kind)
+    if s is None:
+        s = BY_LOWER_KIND.get(kind.strip().lower())
+    return s
+
+
+def schema_for_component(comp: Component) -> Optional[ComponentSchema]:
+    """
+    Schema that can encode a Component object, or None.
+    """
+    if isinstance(comp, Buzzer):
+        return BUZZER
+    low = comp.name.lower()
+    if isinstance(comp, Light):
+        return BY_LOWER_KIND.get(low)
+    s = _BY_NAME_SUFFIX.get(low.rsplit(" ", 1)[-1])
+    if s is BATTERY and not isinstance(comp, Battery):
+        return None
+    return s
@@ -1,5 +1,18 @@
-from typing import Callable, Optional, List, Tuple, Any
-from circuitkit.CircuitKit import CircuitKit
+from collections import OrderedDict
+from typing import Callable, Optional, List, Tuple, Any, Hashable, TYPE_CHECKING
+from component.ComponentKey import ComponentKey
+from component.schema import SCHEMAS
+from transaction.PurchaseOrder import PurchaseOrder
+from transaction.CustomerSale import CustomerSale
+
+# circuitkit is imported on first use so the main menu comes up without it
+if TYPE_CHECKING:
+    from circuitkit.CircuitKit import CircuitKit
+
+
+def datetime_now() -> str:
+    import datetime
+    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
 class Menu:
@@ -28,24 +41,125 @@ class Menu:
         print(name)
         return fn
 
-    def run(self) -> None:
+    def run(self) -> bool:
+        '''
+        Returns True if an option with an action was chosen, False for BACK.
+        '''
         fn = self._input_select()
         if fn is None:
-            return
+            return False
         try:
             fn()
         except SystemExit:
             raise
         except Exception as e:
             print("Error: " + str(e))
+        return True
+
+
+class PagedMenu(Menu):
+    '''
+    Menu over a large result set. fetch(offset, limit) returns (total, options)
+    for one page, so only the visible page of options is ever built.
+    NEXT PAGE / PREVIOUS PAGE entries are added as needed.
+    '''
+    def __init__(self, title: str, fetch: Callable[[int, int], Tuple[int, List[tuple[str, Optional[Callable[[], None]]]]]],
+                 page_size: int = 25, prompt: str = "Please enter a number: ") -> None:
+        super().__init__(title, [], prompt)
+        self._fetch = fetch
+        self._page_size = page_size
+        self._offset = 0
+
+    def run(self) -> bool:
+        while True:
+            total, page = self._fetch(self._offset, self._page_size)
+            if self._offset > 0 and self._offset >= total:
+                self._offset = max(0, total - self._page_size)
+                continue
+            step: List[int] = []
+            self._options = list(page)
+            if self._offset + self._page_size < total:
+                self._options.append(("NEXT PAGE", (lambda: step.append(self._page_size))))
+            if self._offset > 0:
+                self._options.append(("PREVIOUS PAGE", (lambda: step.append(-self._page_size))))
+            self._options.append(("BACK", None))
+            title = self._title
+            if total > len(page):
+                title = title + " (" + str(self._offset + 1) + "-" + str(self._offset + len(page)) + " OF " + str(total) + ")"
+            fn = Menu(title, self._options, self._prompt)._input_select()
+            if fn is None:
+                return False
+            try:
+                fn()
+            except SystemExit:
+                raise
+            except Exception as e:
+                print("Error: " + str(e))
+            if len(step) == 0:
+                return True
+            self._offset = max(0, self._offset + step[0])
+
+
+class LabelCache:
+    '''
+    Bounded LRU cache of rendered menu labels keyed by (fragment, style).
+    The least recently used label is evicted once maxsize is reached.
+    '''
+    def __init__(self, maxsize: int = 16384) -> None:
+        self._maxsize = maxsize
+        self._labels: "OrderedDict[Tuple[Hashable, str], str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, style: str, render: Callable[[Any], str]) -> str:
+        k = (key, style)
+        label = self._labels.get(k)
+        if label is not None:
+            self._labels.move_to_end(k)
+            self.hits = self.hits + 1
+            return label
+        self.misses = self.misses + 1
+        label = render(key)
+        self._labels[k] = label
+        if len(self._labels) > self._maxsize:
+            self._labels.popitem(last=False)
+        return label
+
+    def clear(self) -> None:
+        self._labels.clear()
+
+    def __len__(self) -> int:
+        return len(self._labels)
 
 
 class UI:
-    def __init__(self, app: Any) -> None:
+    # actions timed by a profiler; time spent at their prompts is not counted
+    PROFILED_ACTIONS = [
+        "import_catalogue", "new_circuit_menu", "view_buildable_kits", "close_app",
+        "_where_used", "_buy_component", "_sell_component", "_sell_kit", "_pack_more",
+        "_unpack_kit", "_buy_kit", "_purchase_add_item", "_complete_purchase_order",
+        "_customer_sale_add_item", "_complete_customer_sale",
+    ]
+
+    def __init__(self, app: Any, label_cache_size: int = 16384, page_size: int = 25,
+                 profiler: Any = None) -> None:
         self.app = app
+        self._labels = LabelCache(label_cache_size)
+        self._page_size = page_size
+        self._profiler = profiler
+        if profiler is not None:
+            # menu actions are looked up on the instance, so they pick up the
+            # wrappers; the menu loops themselves mostly wait on input()
+            profiler.instrument(self, "ui", UI.PROFILED_ACTIONS)
+
+    def _input(self, prompt: str) -> str:
+        if self._profiler is None:
+            return input(prompt)
+        with self._profiler.paused():
+            return input(prompt)
 
     def _input_int(self, prompt: str, min_val: Optional[int] = None, max_val: Optional[int] = None) -> int:
-        s = input(prompt).strip()
+        s = self._input(prompt).strip()
         v = int(s)
         if min_val is not None and v < min_val:
             raise ValueError("Value must be at least " + str(min_val))
@@ -59,73 +173,31 @@ class UI:
         return s[0:1].upper() + s[1:].lower()
 
     def _component_caps(self, frag: str) -> str:
-        parts = [c.strip() for c in frag.split(",")]
-        kind = parts[0] if len(parts) > 0 else ""
-        def _f(x, n):
-            try:
-                return format(float(x), "." + str(n) + "f")
-            except Exception:
-                return x
-        if kind == "Wire" and len(parts) >= 3:
-            return _f(parts[1], 0) + "MM WIRE $" + _f(parts[2], 2)
-        if kind == "Battery" and len(parts) >= 4:
-            return _f(parts[2], 1) + "V " + parts[1].upper() + " BATTERY $" + _f(parts[3], 2)
-        if kind == "Solar Panel" and len(parts) >= 4:
-            try:
-                ma = format(float(parts[2]) * 1000.0, ".1f")
-            except Exception:
-                ma = parts[2]
-            return _f(parts[1], 1) + "V " + ma + "MA SOLAR PANEL $" + _f(parts[3], 2)
-        if kind == "Light Globe" and len(parts) >= 5:
-            return _f(parts[2], 1) + "V " + _f(parts[3], 1) + "MA " + parts[1].upper() + " LIGHT GLOBE $" + _f(parts[4], 2)
-        if kind == "LED Light" and len(parts) >= 5:
-            return _f(parts[2], 1) + "V " + _f(parts[3], 1) + "MA " + parts[1].upper() + " LED LIGHT $" + _f(parts[4], 2)
-        if kind == "Switch" and len(parts) >= 4:
-            return _f(parts[2], 1) + "V " + parts[1].upper() + " SWITCH $" + _f(parts[3], 2)
-        if kind == "Sensor" and len(parts) >= 4:
-            return _f(parts[2], 1) + "V " + parts[1].upper() + " SENSOR $" + _f(parts[3], 2)
-        if kind == "Buzzer" and len(parts) >= 6:
-            return _f(parts[3], 1) + "V " + _f(parts[4], 1) + "MA " + _f(parts[1], 1) + "HZ " + str(int(float(parts[2]))) + "DB BUZZER $" + _f(parts[5], 2)
-        return frag.upper()
+        return self._labels.get(frag, "caps", self._render_component_caps)
 
     def _component_pretty(self, frag: str) -> str:
-        parts = [c.strip() for c in frag.split(",")]
-        kind = parts[0] if len(parts) > 0 else ""
-        def _f(x, n):
-            try:
-                return format(float(x), "." + str(n) + "f")
-            except Exception:
-                return x
-        def _t(s):
-            return self._tc(s)
-        if kind == "Wire" and len(parts) >= 3:
-            return _f(parts[1], 0) + "mm Wire $" + _f(parts[2], 2)
-        if kind == "Battery" and len(parts) >= 4:
-            return _f(parts[2], 1) + "V " + parts[1].upper() + " Battery $" + _f(parts[3], 2)
-        if kind == "Solar Panel" and len(parts) >= 4:
-            try:
-                ma = format(float(parts[2]) * 1000.0, ".1f")
-            except Exception:
-                ma = parts[2]
-            return _f(parts[1], 1) + "V " + ma + "mA Solar Panel $" + _f(parts[3], 2)
-        if kind == "Light Globe" and len(parts) >= 5:
-            return _f(parts[2], 1) + "V " + _f(parts[3], 1) + "mA " + _t(parts[1]) + " Light Globe $" + _f(parts[4], 2)
-        if kind == "LED Light" and len(parts) >= 5:
-            return _f(parts[2], 1) + "V " + _f(parts[3], 1) + "mA " + _t(parts[1]) + " LED Light $" + _f(parts[4], 2)
-        if kind == "Switch" and len(parts) >= 4:
-            return _f(parts[2], 1) + "V " + _t(parts[1]) + " Switch $" + _f(parts[3], 2)
-        if kind == "Sensor" and len(parts) >= 4:
-            return _f(parts[2], 1) + "V " + _t(parts[1]) + " Sensor $" + _f(parts[3], 2)
-        if kind == "Buzzer" and len(parts) >= 6:
-            return _f(parts[3], 1) + "V " + _f(parts[4], 1) + "mA " + _f(parts[1], 1) + "Hz " + str(int(float(parts[2]))) + "dB Buzzer $" + _f(parts[5], 2)
-        return frag
+        return self._labels.get(frag, "pretty", self._render_component_pretty)
+
+    def _render_component_caps(self, frag: str) -> str:
+        key = ComponentKey.of(frag)
+        schema = SCHEMAS.get(key.kind)
+        if schema is not None and len(key.parts) > schema.arity:
+            return schema.caps(key.parts, key.numbers)
+        return key.upper()
+
+    def _render_component_pretty(self, frag: str) -> str:
+        key = ComponentKey.of(frag)
+        schema = SCHEMAS.get(key.kind)
+        if schema is not None and len(key.parts) > schema.arity:
+            return schema.pretty(key.parts, key.numbers)
+        return str(key)
 
     def _infer_kit_name(self, items: List[Tuple[int, str]]) -> str:
         has_globe = False
         has_led = False
         has_sensor = False
         for q, frag in items:
-            t = frag.split(",")[0].strip()
+            t = ComponentKey.of(frag).kind
             if t == "Light Globe":
                 has_globe = True
             elif t == "LED Light":
@@ -153,9 +225,24 @@ class UI:
         Menu("COMPONENT MENU", [
             ("NEW COMPONENT", self.new_component_menu),
             ("VIEW COMPONENTS", self.view_components),
+            ("SEARCH COMPONENTS", self.search_components),
+            ("IMPORT CATALOGUE", self.import_catalogue),
             ("BACK", None),
         ]).run()
 
+    def import_catalogue(self) -> None:
+        print("IMPORT CATALOGUE")
+        path = self._input("Supplier CSV file (qty,kind,fields...): ").strip()
+        report = self.app.import_catalogue(path)
+        print("Imported " + str(report["imported"]) + " of " + str(report["rows"]) + " rows: " +
+              str(report["units"]) + " units of " + str(report["components"]) + " components")
+        for line, message in report["errors"]:
+            print("  line " + str(line) + ": " + message)
+        if report["rejected"] > len(report["errors"]):
+            print("  ... " + str(report["rejected"] - len(report["errors"])) + " more rows rejected")
+        print(format(report["rows_per_sec"], ".0f") + " rows/sec")
+        print("Completing Purchase Order " + datetime_now())
+
     def new_component_menu(self) -> None:
         Menu("NEW COMPONENT MENU", [
             ("WIRE", lambda: print("NEW WIRE")),
@@ -169,27 +256,74 @@ class UI:
             ("BACK", None),
         ]).run()
 
-    def view_components(self) -> None:
-        rows = self.app.list_component_rows()
-        if not rows:
+    def view_components(self, **filters: Any) -> None:
+        def fetch(offset: int, limit: int) -> Tuple[int, List[Tuple[str, Optional[Callable[[], None]]]]]:
+            total, rows = self.app.query_components(offset, limit, **filters)
+            options: List[Tuple[str, Optional[Callable[[], None]]]] = []
+            for qty, frag in rows:
+                label = self._component_caps(frag) + " X " + str(qty)
+                options.append((label, (lambda f=frag: self._component_actions(f))))
+            return total, options
+        # the first page also gives the total; PagedMenu reuses it
+        first = [fetch(0, self._page_size)]
+        if first[0][0] == 0:
             print("ALL COMPONENTS")
-            print("No components yet.")
+            print("No components yet." if not filters else "No matching components.")
             return
-        options: List[Tuple[str, Optional[Callable[[], None]]]] = []
-        for qty, frag in rows:
-            label = self._component_caps(frag) + " X " + str(qty)
-            options.append((label, (lambda f=frag: self._component_actions(f))))
-        options.append(("BACK", None))
-        Menu("ALL COMPONENTS", options).run()
+
+        def page(offset: int, limit: int) -> Tuple[int, List[Tuple[str, Optional[Callable[[], None]]]]]:
+            return first.pop() if first and offset == 0 else fetch(offset, limit)
+        menu = PagedMenu("ALL COMPONENTS" if not filters else "MATCHING COMPONENTS", page, self._page_size)
+        again = True
+        while again:
+            again = menu.run()
+
+    def _input_optional_float(self, prompt: str) -> Optional[float]:
+        s = self._input(prompt).strip()
+        if s == "":
+            return None
+        return float(s)
+
+    def search_components(self) -> None:
+        kinds = self.app.component_kinds()
+        print("SEARCH COMPONENTS")
+        for i, k in enumerate(kinds, 1):
+            print(str(i) + ". " + k.upper())
+        sel = self._input("Kind number (blank for any): ").strip()
+        while sel != "" and not (sel.isdigit() and 1 <= int(sel) <= len(kinds)):
+            print("Wrong input, must be a number between 1 and " + str(len(kinds)))
+            sel = self._input("Kind number (blank for any): ").strip()
+        filters: dict = {}
+        if sel != "":
+            filters["kind"] = kinds[int(sel) - 1]
+        text = self._input("Starts with (blank for any): ").strip()
+        if text != "":
+            filters["prefix"] = text if "kind" not in filters else filters["kind"] + "," + text
+        filters["min_price"] = self._input_optional_float("Minimum price (blank for any): ")
+        filters["max_price"] = self._input_optional_float("Maximum price (blank for any): ")
+        filters["min_voltage"] = self._input_optional_float("Minimum voltage (blank for any): ")
+        filters["max_voltage"] = self._input_optional_float("Maximum voltage (blank for any): ")
+        self.view_components(**{k: v for k, v in filters.items() if v is not None})
 
     def _component_actions(self, frag: str) -> None:
         title = self._component_caps(frag)
         Menu(title, [
             ("BUY",  (lambda: self._buy_component(frag))),
             ("SELL", (lambda: self._sell_component(frag))),
+            ("WHERE USED", (lambda: self._where_used(frag))),
             ("BACK", None),
         ]).run()
-        self.view_components()
+
+    def _where_used(self, frag: str) -> None:
+        now = self.app.where_used(frag)
+        print("KITS USING " + self._component_caps(frag))
+        if len(now) == 0:
+            print("Not used by any circuit kit.")
+            return
+        gone = self.app.where_used(frag, discontinued=True)
+        for i, name in enumerate(now, 1):
+            print(str(i) + ". " + name.upper() + " X " + str(now[name][0]) +
+                  " (X " + str(gone[name][0]) + " IF DISCONTINUED)")
 
     def _buy_component(self, frag: str) -> None:
         pretty = self._component_pretty(frag)
@@ -214,6 +348,7 @@ class UI:
         Menu("CIRCUIT KIT MENU", [
             ("NEW CIRCUIT KIT", self.new_circuit_menu),
             ("VIEW CIRCUIT KITS", self.view_circuitkits),
+            ("BUILDABLE CIRCUIT KITS", self.view_buildable_kits),
             ("BACK", None),
         ]).run()
 
@@ -250,40 +385,52 @@ class UI:
             return
 
         base = self._infer_kit_name(chosen)
-        name = input("Please enter kit name (default " + base + "): ").strip()
+        name = self._input("Please enter kit name (default " + base + "): ").strip()
         if name == "":
             name = base
 
         total_price = 0.0
         for q, frag in chosen:
-            try:
-                unit = float(frag.split(",")[-1])
-            except Exception:
-                unit = 0.0
-            total_price = total_price + (q * unit)
+            total_price = total_price + (q * ComponentKey.of(frag).price)
 
+        from circuitkit.CircuitKit import CircuitKit
         kit = CircuitKit(name, total_price, chosen)
         count = self._input_int("Please enter number of " + kit.heading_pretty() + ": ", 1)
-        if not self.app.can_pack(kit, count):
+        if not self.app.try_pack(kit, count):
             print("Not enough components to pack the requested number.")
             return
-
-        self.app.perform_pack(kit, count)
         print("Packed " + kit.heading_pretty() + " X " + str(count))
 
     def view_circuitkits(self) -> None:
-        kits = self.app.list_circuit_objects()
-        if len(kits) == 0:
+        def fetch(offset: int, limit: int) -> Tuple[int, List[Tuple[str, Optional[Callable[[], None]]]]]:
+            total, kits = self.app.query_circuits(offset, limit)
+            options: List[Tuple[str, Optional[Callable[[], None]]]] = []
+            for qty, kit in kits:
+                options.append((kit.heading_caps() + " X " + str(qty), (lambda k=kit: self._kit_actions(k))))
+            return total, options
+        if self.app.query_circuits(0, 0)[0] == 0:
             print("ALL CIRCUIT KITS")
             print("No circuit kits yet.")
             return
-        options: List[Tuple[str, Optional[Callable[[], None]]]] = []
-        for qty, kit in kits:
-            options.append((kit.heading_caps() + " X " + str(qty), (lambda k=kit: self._kit_actions(k))))
-        options.append(("BACK", None))
-        Menu("ALL CIRCUIT KITS", options).run()
-
-    def _kit_actions(self, kit: CircuitKit) -> None:
+        menu = PagedMenu("ALL CIRCUIT KITS", fetch, self._page_size)
+        again = True
+        while again:
+            again = menu.run()
+
+    def view_buildable_kits(self) -> None:
+        plan = self.app.plan_kits()
+        print("BUILDABLE CIRCUIT KITS")
+        if len(plan) == 0:
+            print("No circuit kits yet.")
+            return
+        for i, name in enumerate(sorted(plan), 1):
+            count, limit = plan[name]
+            line = str(i) + ". " + name.upper() + " X " + str(count)
+            if limit is not None:
+                line = line + " (LIMITED BY " + self._component_caps(limit) + ")"
+            print(line)
+
+    def _kit_actions(self, kit: "CircuitKit") -> None:
         Menu(kit.heading_pretty(), [
             ("SELL", (lambda: self._sell_kit(kit))),
             ("PACK", (lambda: self._pack_more(kit))),
@@ -291,9 +438,8 @@ class UI:
             ("BUY", (lambda: self._buy_kit(kit))),
             ("BACK", None),
         ]).run()
-        self.view_circuitkits()
 
-    def _sell_kit(self, kit: CircuitKit) -> None:
+    def _sell_kit(self, kit: "CircuitKit") -> None:
         n = self._input_int("Please enter number of " + kit.heading_pretty() + ": ", 1)
         ok = self.app.sell_circuit(kit.name, n)
         if ok:
@@ -302,23 +448,21 @@ class UI:
         else:
             print("Not enough stock to sell.")
 
-    def _pack_more(self, kit: CircuitKit) -> None:
+    def _pack_more(self, kit: "CircuitKit") -> None:
         n = self._input_int("Please enter number of " + kit.heading_pretty() + ": ", 1)
-        if not self.app.can_pack(kit, n):
+        if not self.app.try_pack(kit, n):
             print("Not enough components to pack the requested number.")
             return
-        self.app.perform_pack(kit, n)
         print("Packed " + kit.heading_pretty() + " X " + str(n))
 
-    def _unpack_kit(self, kit: CircuitKit) -> None:
+    def _unpack_kit(self, kit: "CircuitKit") -> None:
         n = self._input_int("Please enter number of " + kit.heading_pretty() + ": ", 1)
-        if not self.app.can_unpack(kit.name, n):
+        if not self.app.try_unpack(kit.name, n):
             print("Not enough kits to unpack.")
             return
-        self.app.perform_unpack(kit.name, n)
         print("Unpacked " + kit.heading_pretty() + " X " + str(n))
 
-    def _buy_kit(self, kit: CircuitKit) -> None:
+    def _buy_kit(self, kit: "CircuitKit") -> None:
         n = self._input_int("Please enter number of " + kit.heading_pretty() + ": ", 1)
         ok = self.app.buy_circuit(kit.name, n)
         if ok:
@@ -327,13 +471,35 @@ class UI:
         else:
             print("Kit not found.")
 
-    def purchase_orders_menu(self) -> None:
-        Menu("PURCHASE ORDER", [
-            ("Add Item from Catalogue to Order", self._purchase_add_item),
-            ("BACK (CANCEL ORDER)", None),
-        ], prompt="Select Option Number: ").run()
-
-    def _purchase_add_item(self) -> None:
+    def _order_line_label(self, item: Any) -> str:
+        from circuitkit.CircuitKit import CircuitKit
+        if isinstance(item, CircuitKit):
+            return item.heading_caps()
+        return self._component_caps(item)
+
+    def _order_qty(self, items: dict, obj: Any) -> int:
+        from circuitkit.CircuitKit import CircuitKit
+        total = 0
+        for item, q in items.items():
+            if item is obj or item == obj or (isinstance(item, CircuitKit) and isinstance(obj, CircuitKit) and item.name == obj.name):
+                total = total + q
+        return total
+
+    def purchase_orders_menu(self, order: Optional[PurchaseOrder] = None) -> None:
+        if order is None:
+            order = PurchaseOrder("Supplier", "Any")
+        # loop rather than recurse, so long orders don't grow the stack
+        while True:
+            added: List[bool] = []
+            Menu("PURCHASE ORDER", [
+                ("Add Item from Catalogue to Order", (lambda: added.append(self._purchase_add_item(order)))),
+                ("Complete Purchase Order", (lambda: self._complete_purchase_order(order))),
+                ("BACK (CANCEL ORDER)", None),
+            ], prompt="Select Option Number: ").run()
+            if not added:
+                return
+
+    def _purchase_add_item(self, order: PurchaseOrder) -> bool:
         comp = self.app.list_component_rows()
         kits = self.app.list_circuit_objects()
         index_map = {}
@@ -349,27 +515,40 @@ class UI:
             i = i + 1
         print(str(i) + ". BACK")
         sel = self._input_int("Select Option Number: ", 1, i)
-        if sel == i:
+        if sel != i:
+            kind, obj = index_map[sel]
+            q = self._input_int("Quantity: ", 1)
+            order.addItem(obj, q)
+            print("Adding " + str(q) + " x " + self._order_line_label(obj))
+        return True
+
+    def _complete_purchase_order(self, order: PurchaseOrder) -> None:
+        if len(order._items) == 0:
+            print("Order is empty.")
             return
-        kind, obj = index_map[sel]
-        q = self._input_int("Quantity: ", 1)
-        if kind == "comp":
-            self.app.buy_component(obj, q)
-            print("Adding " + str(q) + " x " + self._component_caps(obj))
+        ok = self.app.complete_purchase_order(order)
+        if ok:
+            for item, q in order._items.items():
+                print("Bought " + self._order_line_label(item) + " X " + str(q))
+            print("Completing Purchase Order " + datetime_now() + ", total $" + format(order.salesTotal, ".2f"))
         else:
-            ok = self.app.buy_circuit(obj.name, q)
-            if ok:
-                print("Adding " + str(q) + " x " + obj.heading_caps())
-            else:
-                print("Kit not found.")
-
-    def customer_sales_menu(self) -> None:
-        Menu("CUSTOMER SALE", [
-            ("Add Item from Inventory to Sale", self._customer_sale_add_item),
-            ("BACK (CANCEL ORDER)", None),
-        ], prompt="Select Option Number: ").run()
+            print("Kit not found.")
 
-    def _customer_sale_add_item(self) -> None:
+    def customer_sales_menu(self, sale: Optional[CustomerSale] = None) -> None:
+        if sale is None:
+            sale = CustomerSale("Customer")
+        # loop rather than recurse, so long orders don't grow the stack
+        while True:
+            added: List[bool] = []
+            Menu("CUSTOMER SALE", [
+                ("Add Item from Inventory to Sale", (lambda: added.append(self._customer_sale_add_item(sale)))),
+                ("Complete Customer Sale", (lambda: self._complete_customer_sale(sale))),
+                ("BACK (CANCEL ORDER)", None),
+            ], prompt="Select Option Number: ").run()
+            if not added:
+                return
+
+    def _customer_sale_add_item(self, sale: CustomerSale) -> bool:
         comp = self.app.list_component_rows()
         kits = self.app.list_circuit_objects()
         index_map = {}
@@ -385,25 +564,27 @@ class UI:
             i = i + 1
         print(str(i) + ". BACK")
         sel = self._input_int("Select Option Number: ", 1, i)
-        if sel == i:
-            return
-        kind, obj, have = index_map[sel]
-        q = self._input_int("Quantity: ", 1)
-        if q > have:
-            print("Not enough stock.")
-            return
-        if kind == "comp":
-            ok = self.app.sell_component(obj, q)
-            if ok:
-                print("Adding " + str(q) + " x " + self._component_caps(obj))
-            else:
+        if sel != i:
+            kind, obj, have = index_map[sel]
+            q = self._input_int("Quantity: ", 1)
+            if q + self._order_qty(sale._items, obj) > have:
                 print("Not enough stock.")
-        else:
-            ok = self.app.sell_circuit(obj.name, q)
-            if ok:
-                print("Adding " + str(q) + " x " + obj.heading_caps())
             else:
-                print("Not enough stock.")
+                sale.addItem(obj, q)
+                print("Adding " + str(q) + " x " + self._order_line_label(obj))
+        return True
+
+    def _complete_customer_sale(self, sale: CustomerSale) -> None:
+        if len(sale._items) == 0:
+            print("Sale is empty.")
+            return
+        ok = self.app.complete_customer_sale(sale)
+        if ok:
+            for item, q in sale._items.items():
+                print("Sold " + self._order_line_label(item) + " X " + str(q))
+            print("Completing Customer Sale " + datetime_now() + ", total $" + format(sale.saleTotal, ".2f"))
+        else:
+            print("Not enough stock.")
 
     def transactions_menu(self) -> None:
         lines = self.app.summarize_transactions()
@@ -420,10 +601,5 @@ class UI:
 
     def close_app(self) -> None:
         print("Saving and Closing")
-        self.app.save_components()
-        self.app.save_kits()
+        self.app.close()
         raise SystemExit(0)
-
-    def datetime_now() -> str:
-        import datetime
-        return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
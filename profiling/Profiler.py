@@ -0,0 +1,220 @@
+# File: Profiler.py
+# Author: Unubileg ADILBISH, Pratik SAPKOTA, Botao HUANG
+# ID: 523127, 522498, 521560
+# Email: 523127@learning.eynesbury.edu.au, 522498@learning.eynesbury.edu.au, 521560@learning.eynesbury.edu.au
+# Description: Opt-in call counts, latency percentiles and I/O counters for App and UI operations.
+# This is our own work as defined by the Academic Integrity Policy
+
+import os
+import json
+import math
+import time
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# latency histogram: 4 buckets per doubling of microseconds (~19% wide)
+_BUCKETS_PER_DOUBLING = 4
+_N_BUCKETS = 32 * _BUCKETS_PER_DOUBLING
+
+
+def _bucket(us: float) -> int:
+    if us <= 1.0:
+        return 0
+    return min(int(math.log2(us) * _BUCKETS_PER_DOUBLING) + 1, _N_BUCKETS - 1)
+
+
+def _bucket_upper_ms(b: int) -> float:
+    return 2.0 ** (b / _BUCKETS_PER_DOUBLING) / 1000.0
+
+
+class _OpStats:
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * _N_BUCKETS
+
+    def percentile(self, p: float) -> float:
+        want = math.ceil(self.count * p)
+        seen = 0
+        for b, n in enumerate(self.buckets):
+            seen = seen + n
+            if seen >= want:
+                return min(_bucket_upper_ms(b), self.max * 1000.0)
+        return self.max * 1000.0
+
+
+class Profiler:
+    '''
+    Collects per-operation call counts and latency histograms, plus bytes
+    written by saves and rows parsed by loads. Nothing is measured unless a
+    Profiler is handed to App / UI, which then wrap their public methods
+    with instrument(); without one no wrapper exists, so there is no cost.
+
+    Latencies go into fixed log-scale buckets, so percentiles are accurate to
+    about 19% and memory does not grow with the number of calls. Time spent
+    inside paused() (waiting for the user to type) is left out of every
+    call in progress on that thread.
+
+    Author: Pratik SAPKOTA
+    '''
+
+    def __init__(self, dump_path: Optional[str] = None, dump_every_s: float = 60.0) -> None:
+        '''
+        Parameters:
+        dump_path (Optional[str]): Write stats() here as JSON every dump_every_s seconds.
+        dump_every_s (float): Minimum time between periodic dumps.
+
+        Author: Pratik SAPKOTA
+        '''
+        self.__ops: Dict[str, _OpStats] = {}
+        self.__bytes: Dict[str, int] = {}
+        self.__rows: Dict[str, int] = {}
+        self.__lock = threading.Lock()
+        self.__dump_path = dump_path
+        self.__dump_every = dump_every_s
+        self.__last_dump = time.monotonic()
+        self.__local = threading.local()
+
+    # ---------------- recording ----------------
+
+    def record(self, name: str, seconds: float) -> None:
+        '''
+        Add one call of name that took seconds.
+
+        Author: Pratik SAPKOTA
+        '''
+        with self.__lock:
+            op = self.__ops.get(name)
+            if op is None:
+                op = self.__ops[name] = _OpStats()
+            op.count = op.count + 1
+            op.total = op.total + seconds
+            if seconds > op.max:
+                op.max = seconds
+            op.buckets[_bucket(seconds * 1e6)] += 1
+            due = self.__dump_path is not None and time.monotonic() - self.__last_dump >= self.__dump_every
+            if due:
+                self.__last_dump = time.monotonic()
+        if due:
+            self.dump()
+
+    def add_bytes(self, name: str, n: int) -> None:
+        '''
+        Count n bytes written by name (e.g. "save_components").
+
+        Author: Unubileg ADILBISH
+        '''
+        with self.__lock:
+            self.__bytes[name] = self.__bytes.get(name, 0) + n
+
+    def add_rows(self, name: str, n: int) -> None:
+        '''
+        Count n rows parsed by name (e.g. "load_components").
+
+        Author: Unubileg ADILBISH
+        '''
+        with self.__lock:
+            self.__rows[name] = self.__rows.get(name, 0) + n
+
+    def wrap(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        '''
+        fn, timed under name.
+
+        Author: Botao HUANG
+        '''
+        clock = time.perf_counter
+        record = self.record
+        local = self.__local
+
+        @wraps(fn)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            paused = getattr(local, "paused", 0.0)
+            t0 = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, clock() - t0 - (getattr(local, "paused", 0.0) - paused))
+        return timed
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        '''
+        Leave the block (e.g. an input() prompt) out of the timed calls around it.
+
+        Author: Botao HUANG
+        '''
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__local.paused = getattr(self.__local, "paused", 0.0) + time.perf_counter() - t0
+
+    def instrument(self, obj: Any, prefix: str, names: Optional[List[str]] = None) -> None:
+        '''
+        Replace the public methods of obj (or just names) with timed wrappers,
+        recorded as prefix + "." + method name. Only this instance is changed.
+
+        Parameters:
+        obj (Any): An App or UI instance.
+        prefix (str): Operation name prefix, e.g. "app" or "ui".
+        names (Optional[List[str]]): Methods to wrap; all public ones if None.
+
+        Author: Botao HUANG
+        '''
+        if names is None:
+            names = [n for n, member in vars(type(obj)).items()
+                     if not n.startswith("_") and callable(member)]
+        for n in names:
+            setattr(obj, n, self.wrap(prefix + "." + n, getattr(obj, n)))
+
+    # ---------------- reporting ----------------
+
+    def stats(self) -> Dict[str, Any]:
+        '''
+        Snapshot of everything recorded so far.
+
+        Returns:
+        Dict[str, Any]: {"ops": {name: {count, total_ms, mean_ms, p50_ms, p95_ms,
+        p99_ms, max_ms}}, "bytes_written": {name: n}, "rows_parsed": {name: n}}
+
+        Author: Pratik SAPKOTA
+        '''
+        with self.__lock:
+            ops = {}
+            for name, op in sorted(self.__ops.items()):
+                ops[name] = {
+                    "count": op.count,
+                    "total_ms": op.total * 1000.0,
+                    "mean_ms": op.total * 1000.0 / op.count,
+                    "p50_ms": op.percentile(0.50),
+                    "p95_ms": op.percentile(0.95),
+                    "p99_ms": op.percentile(0.99),
+                    "max_ms": op.max * 1000.0,
+                }
+            return {"ops": ops, "bytes_written": dict(self.__bytes), "rows_parsed": dict(self.__rows)}
+
+    def dump(self, path: Optional[str] = None) -> None:
+        '''
+        Write stats() as JSON to path (default: the dump_path given at construction).
+
+        Author: Unubileg ADILBISH
+        '''
+        path = path if path is not None else self.__dump_path
+        if path is None:
+            return
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.stats(), f, indent=2)
+            f.write("\n")
+        os.replace(tmp, path)
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__ops = {}
+            self.__bytes = {}
+            self.__rows = {}
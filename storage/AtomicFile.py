@@ -0,0 +1,190 @@
+# File: AtomicFile.py
+# Author: Unubileg ADILBISH, Pratik SAPKOTA, Botao HUANG
+# ID: 523127, 522498, 521560
+# Email: 523127@learning.eynesbury.edu.au, 522498@learning.eynesbury.edu.au, 521560@learning.eynesbury.edu.au
+# Description: Crash-safe whole-file writes (temp file + os.replace) with a configurable fsync policy.
+# This is our own work as defined by the Academic Integrity Policy
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+from typing import IO, Dict, Iterator, Optional, Set
+
+FSYNC_ALWAYS = "always"      # fsync every write before it is made visible
+FSYNC_INTERVAL = "interval"  # fsync at most once per interval_ms
+FSYNC_ON_CLOSE = "close"     # fsync only when the App is closed
+FSYNC_MODES = (FSYNC_ALWAYS, FSYNC_INTERVAL, FSYNC_ON_CLOSE)
+
+
+def _fsync_path(path: str) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # directories cannot be fsync'd on some platforms
+    finally:
+        os.close(fd)
+
+
+class FsyncPolicy:
+    '''
+    Decides when written files are forced to disk. With FSYNC_ALWAYS every
+    write is fsync'd as it happens; otherwise the paths are remembered and
+    fsync'd together, either once interval_ms has passed since the last
+    sync or when sync() is called (App.close()).
+
+    Author: Pratik SAPKOTA
+    '''
+
+    def __init__(self, mode: str = FSYNC_ALWAYS, interval_ms: int = 1000) -> None:
+        if mode not in FSYNC_MODES:
+            raise ValueError("fsync mode must be one of " + ", ".join(FSYNC_MODES))
+        self.__mode = mode
+        self.__interval = interval_ms / 1000.0
+        self.__dirty: Set[str] = set()
+        self.__last = time.monotonic()
+        self.__lock = threading.Lock()
+
+    @property
+    def mode(self) -> str:
+        return self.__mode
+
+    @property
+    def immediate(self) -> bool:
+        return self.__mode == FSYNC_ALWAYS
+
+    def written(self, path: str, f: Optional[IO] = None) -> None:
+        '''
+        Note that path was written (and flushed, if f is its open file).
+
+        Parameters:
+        path (str): The file written.
+        f (Optional[IO]): The still-open file, fsync'd directly under FSYNC_ALWAYS.
+
+        Author: Pratik SAPKOTA
+        '''
+        if self.__mode == FSYNC_ALWAYS:
+            if f is not None:
+                os.fsync(f.fileno())
+            else:
+                _fsync_path(path)
+            return
+        with self.__lock:
+            self.__dirty.add(path)
+            due = self.__mode == FSYNC_INTERVAL and time.monotonic() - self.__last >= self.__interval
+        if due:
+            self.sync()
+
+    def sync(self) -> None:
+        '''
+        fsync every file written since the last sync, and their directories.
+
+        Author: Pratik SAPKOTA
+        '''
+        with self.__lock:
+            dirty = self.__dirty
+            self.__dirty = set()
+            self.__last = time.monotonic()
+        dirs = set()
+        for path in dirty:
+            _fsync_path(path)
+            dirs.add(os.path.dirname(path) or ".")
+        for d in dirs:
+            _fsync_path(d)
+
+
+class AtomicFile:
+    '''
+    Replaces whole files without ever leaving a truncated one behind: data is
+    written to path + ".tmp" and swapped in with os.replace.
+
+    Inside batch(), the swaps wait until the batch ends and are done together
+    (one directory fsync for all of them), and a file written twice in the
+    same batch is only swapped in once, with the last contents.
+
+    Author: Unubileg ADILBISH
+    '''
+
+    def __init__(self, policy: Optional[FsyncPolicy] = None) -> None:
+        self.__policy = policy if policy is not None else FsyncPolicy()
+        self.__local = threading.local()
+
+    @property
+    def policy(self) -> FsyncPolicy:
+        return self.__policy
+
+    @contextmanager
+    def open(self, path: str, binary: bool = False) -> Iterator[IO]:
+        '''
+        Open a temp file standing in for path; it replaces path when the
+        block ends without an exception (or when the enclosing batch ends).
+
+        Parameters:
+        path (str): File to replace.
+        binary (bool): Open in "wb" instead of text mode with newline="".
+
+        Author: Unubileg ADILBISH
+        '''
+        tmp = path + ".tmp"
+        if binary:
+            f = open(tmp, "wb")
+        else:
+            f = open(tmp, "w", newline="", encoding="utf-8")
+        try:
+            yield f
+            f.flush()
+            if self.__policy.immediate:
+                os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        f.close()
+        pending: Optional[Dict[str, str]] = getattr(self.__local, "pending", None)
+        if pending is not None:
+            pending[path] = tmp
+        else:
+            self.__swap({path: tmp})
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        '''
+        Coalesce the writes made in the block into one set of swaps at its end.
+
+        Author: Botao HUANG
+        '''
+        if getattr(self.__local, "pending", None) is not None:
+            yield  # already batching
+            return
+        pending: Dict[str, str] = {}
+        self.__local.pending = pending
+        try:
+            yield
+        except BaseException:
+            for tmp in pending.values():
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+            raise
+        finally:
+            self.__local.pending = None
+        self.__swap(pending)
+
+    def __swap(self, files: Dict[str, str]) -> None:
+        dirs = set()
+        for path, tmp in files.items():
+            os.replace(tmp, path)
+            dirs.add(os.path.dirname(path) or ".")
+            if not self.__policy.immediate:
+                self.__policy.written(path)
+        if self.__policy.immediate:
+            for d in dirs:
+                _fsync_path(d)
@@ -0,0 +1,262 @@
+# File: BinarySnapshot.py
+# Author: Unubileg ADILBISH, Pratik SAPKOTA, Botao HUANG
+# ID: 523127, 522498, 521560
+# Email: 523127@learning.eynesbury.edu.au, 522498@learning.eynesbury.edu.au, 521560@learning.eynesbury.edu.au
+# Description: Memory-mapped binary copy of circuits.csv + components.csv used for fast startup.
+# This is our own work as defined by the Academic Integrity Policy
+
+import os
+import mmap
+import struct
+from typing import Dict, List, Tuple, Iterator, Optional
+from storage.AtomicFile import AtomicFile
+
+SNAPSHOT_FILE = "snapshot.bin"
+
+# Layout (little-endian):
+#   header        MAGIC, source count, then (mtime_ns, size) per source CSV,
+#                 then string / component / kit / item counts and section offsets
+#   string table  (count + 1) uint64 offsets followed by one UTF-8 blob
+#   components    fixed records: string id, qty
+#   kits          fixed records: name string id, qty, first item, item count
+#   items         fixed records: fragment string id, item qty
+MAGIC = b"CKSNAP01"
+_STAMP = struct.Struct("<qq")
+_COUNTS = struct.Struct("<IIIIQQQQ")
+_OFFSET = struct.Struct("<Q")
+_COMPONENT = struct.Struct("<Iq")
+_KIT = struct.Struct("<IqII")
+_ITEM = struct.Struct("<Iq")
+
+
+def _stamps(sources: List[str]) -> List[Tuple[int, int]]:
+    out = []
+    for p in sources:
+        try:
+            st = os.stat(p)
+            out.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            out.append((-1, -1))
+    return out
+
+
+class BinarySnapshot:
+    '''
+    Read side of the binary snapshot. The file is mmap'd and records are
+    decoded only when they are asked for, so opening it costs the same no
+    matter how large the catalogue is. A snapshot is only handed out when
+    the CSVs it was written from are unchanged (same mtime and size); the
+    CSVs stay the interchange format and the source of truth.
+
+    Author: Unubileg ADILBISH
+    '''
+
+    def __init__(self, f, mm: mmap.mmap, counts: Tuple[int, ...]) -> None:
+        self.__file = f
+        self.__mm = mm
+        n_strings, n_components, n_kits, n_items, str_off, comp_off, kit_off, item_off = counts
+        self.__n_strings = n_strings
+        self.__n_components = n_components
+        self.__n_kits = n_kits
+        self.__str_off = str_off
+        self.__blob_off = str_off + (n_strings + 1) * _OFFSET.size
+        self.__comp_off = comp_off
+        self.__kit_off = kit_off
+        self.__item_off = item_off
+        self.__strings: List[Optional[str]] = [None] * n_strings
+
+    # ---------------- opening / writing ----------------
+
+    @staticmethod
+    def open(path: str, sources: List[str]) -> Optional["BinarySnapshot"]:
+        '''
+        Map the snapshot at path if it exists and matches the source CSVs.
+
+        Parameters:
+        path (str): Snapshot file.
+        sources (List[str]): The CSV files the snapshot was written from.
+
+        Returns:
+        Optional[BinarySnapshot]: None if missing, stale or unreadable.
+
+        Author: Unubileg ADILBISH
+        '''
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return None
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            f.close()
+            return None
+        try:
+            if mm[:len(MAGIC)] != MAGIC:
+                raise ValueError("not a snapshot")
+            pos = len(MAGIC)
+            n_sources = struct.unpack_from("<I", mm, pos)[0]
+            pos = pos + 4
+            stored = [_STAMP.unpack_from(mm, pos + i * _STAMP.size) for i in range(n_sources)]
+            pos = pos + n_sources * _STAMP.size
+            if stored != _stamps(sources):
+                raise ValueError("stale snapshot")
+            counts = _COUNTS.unpack_from(mm, pos)
+            if counts[7] + counts[3] * _ITEM.size > len(mm):
+                raise ValueError("truncated snapshot")
+        except (ValueError, struct.error):
+            mm.close()
+            f.close()
+            return None
+        return BinarySnapshot(f, mm, counts)
+
+    @staticmethod
+    def is_current(path: str, sources: List[str]) -> bool:
+        '''
+        True if the snapshot at path exists and matches the source CSVs.
+
+        Author: Unubileg ADILBISH
+        '''
+        snap = BinarySnapshot.open(path, sources)
+        if snap is None:
+            return False
+        snap.close()
+        return True
+
+    @staticmethod
+    def stamps(sources: List[str]) -> List[Tuple[int, int]]:
+        '''
+        (mtime_ns, size) of each source CSV, (-1, -1) if it is missing.
+
+        Author: Unubileg ADILBISH
+        '''
+        return _stamps(sources)
+
+    @staticmethod
+    def write(path: str, components: Dict[str, int],
+              kits: List[Tuple[str, int, List[Tuple[int, str]]]], sources: List[str],
+              files: Optional[AtomicFile] = None,
+              stamps: Optional[List[Tuple[int, int]]] = None) -> None:
+        '''
+        Write a snapshot of the given inventory, stamped with the current
+        mtime/size of the source CSVs. Written to a temp file, then swapped in.
+
+        Parameters:
+        path (str): Snapshot file.
+        components (Dict[str, int]): fragment -> quantity, in file order.
+        kits (List[Tuple[str, int, List[Tuple[int, str]]]]): (name, qty, items).
+        sources (List[str]): The CSV files this snapshot mirrors.
+        files (Optional[AtomicFile]): Writer applying the App's fsync policy.
+        stamps (Optional[List[Tuple[int, int]]]): Stamps of the sources as they
+        were when the inventory was read from or written to them; the current
+        ones if None.
+
+        Author: Botao HUANG
+        '''
+        string_id: Dict[str, int] = {}
+        strings: List[bytes] = []
+
+        def sid(s: str) -> int:
+            i = string_id.get(s)
+            if i is None:
+                i = len(strings)
+                string_id[s] = i
+                strings.append(str(s).encode("utf-8"))
+            return i
+
+        comp_recs = bytearray()
+        for frag, qty in components.items():
+            comp_recs += _COMPONENT.pack(sid(frag), int(qty))
+        kit_recs = bytearray()
+        item_recs = bytearray()
+        n_items = 0
+        for name, qty, items in kits:
+            kit_recs += _KIT.pack(sid(name), int(qty), n_items, len(items))
+            for iqty, frag in items:
+                item_recs += _ITEM.pack(sid(frag), int(iqty))
+            n_items = n_items + len(items)
+
+        offsets = bytearray()
+        pos = 0
+        for b in strings:
+            offsets += _OFFSET.pack(pos)
+            pos = pos + len(b)
+        offsets += _OFFSET.pack(pos)
+        blob = b"".join(strings)
+
+        stamps = stamps if stamps is not None else _stamps(sources)
+        header_len = len(MAGIC) + 4 + len(stamps) * _STAMP.size + _COUNTS.size
+        str_off = header_len
+        comp_off = str_off + len(offsets) + len(blob)
+        kit_off = comp_off + len(comp_recs)
+        item_off = kit_off + len(kit_recs)
+        with (files if files is not None else AtomicFile()).open(path, binary=True) as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(stamps)))
+            for st in stamps:
+                f.write(_STAMP.pack(*st))
+            f.write(_COUNTS.pack(len(strings), len(components), len(kits), n_items,
+                                 str_off, comp_off, kit_off, item_off))
+            f.write(offsets)
+            f.write(blob)
+            f.write(comp_recs)
+            f.write(kit_recs)
+            f.write(item_recs)
+
+    def close(self) -> None:
+        self.__mm.close()
+        self.__file.close()
+
+    # ---------------- lazy decoding ----------------
+
+    def string(self, i: int) -> str:
+        '''
+        Decode string i from the string table (cached after the first call).
+
+        Author: Pratik SAPKOTA
+        '''
+        s = self.__strings[i]
+        if s is None:
+            lo, hi = struct.unpack_from("<QQ", self.__mm, self.__str_off + i * _OFFSET.size)
+            s = self.__mm[self.__blob_off + lo:self.__blob_off + hi].decode("utf-8")
+            self.__strings[i] = s
+        return s
+
+    @property
+    def component_count(self) -> int:
+        return self.__n_components
+
+    @property
+    def kit_count(self) -> int:
+        return self.__n_kits
+
+    def component(self, i: int) -> Tuple[int, str]:
+        '''
+        (quantity, fragment) of component record i.
+
+        Author: Pratik SAPKOTA
+        '''
+        s, qty = _COMPONENT.unpack_from(self.__mm, self.__comp_off + i * _COMPONENT.size)
+        return qty, self.string(s)
+
+    def iter_components(self) -> Iterator[Tuple[int, str]]:
+        '''
+        All (quantity, fragment) records in file order.
+
+        Author: Pratik SAPKOTA
+        '''
+        end = self.__comp_off + self.__n_components * _COMPONENT.size
+        for s, qty in _COMPONENT.iter_unpack(self.__mm[self.__comp_off:end]):
+            yield qty, self.string(s)
+
+    def iter_kits(self) -> Iterator[Tuple[str, int, List[Tuple[int, str]]]]:
+        '''
+        All (kit name, quantity, [(item qty, fragment), ...]) records in file order.
+
+        Author: Botao HUANG
+        '''
+        end = self.__kit_off + self.__n_kits * _KIT.size
+        for s, qty, first, count in _KIT.iter_unpack(self.__mm[self.__kit_off:end]):
+            lo = self.__item_off + first * _ITEM.size
+            items = [(iqty, self.string(f)) for f, iqty in
+                     _ITEM.iter_unpack(self.__mm[lo:lo + count * _ITEM.size])]
+            yield self.string(s), qty, items
@@ -0,0 +1,218 @@
+# File: ColumnarInventory.py
+# Author: Unubileg ADILBISH, Pratik SAPKOTA, Botao HUANG
+# ID: 523127, 522498, 521560
+# Email: 523127@learning.eynesbury.edu.au, 522498@learning.eynesbury.edu.au, 521560@learning.eynesbury.edu.au
+# Description: Column-per-field (struct of arrays) copy of the component inventory for stock analytics.
+# This is our own work as defined by the Academic Integrity Policy
+
+import math
+from array import array
+from operator import mul
+from typing import Dict, List, Tuple, Optional
+from component.ComponentKey import ComponentKey
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the array module path is used instead
+    np = None
+
+NAN = float("nan")
+
+
+class ColumnarInventory:
+    '''
+    Inventory held as parallel typed columns (kind id, price, voltage,
+    current in amps, quantity) with a fragment -> row index. Valuation, per-kind
+    totals and reorder queries run over whole columns, with numpy when it is
+    installed and over the arrays with map()/zip() otherwise.
+
+    Rows are never removed while the store lives: a component that sells out
+    keeps its row with quantity 0, which is what reorder() reports on.
+
+    Author: Unubileg ADILBISH
+    '''
+
+    def __init__(self) -> None:
+        self.__frags: List[ComponentKey] = []
+        self.__row_of: Dict[str, int] = {}
+        self.__kinds: List[str] = []
+        self.__kind_id: Dict[str, int] = {}
+        self.__kind = array("l")
+        self.__price = array("d")
+        self.__voltage = array("d")
+        self.__current = array("d")
+        self.__qty = array("q")
+
+    @staticmethod
+    def from_stock(stock: Dict[str, int]) -> "ColumnarInventory":
+        '''
+        Build the columns from an App-style fragment -> quantity mapping.
+
+        Parameters:
+        stock (Dict[str, int]): fragment -> quantity on hand.
+
+        Returns:
+        ColumnarInventory
+
+        Author: Unubileg ADILBISH
+        '''
+        inv = ColumnarInventory()
+        for frag, qty in stock.items():
+            inv.set_qty(frag, qty)
+        return inv
+
+    def __len__(self) -> int:
+        return len(self.__frags)
+
+    def row_of(self, frag: str) -> Optional[int]:
+        '''
+        Row number of a fragment, or None if it has never been stocked.
+
+        Author: Pratik SAPKOTA
+        '''
+        return self.__row_of.get(frag)
+
+    def __add_row(self, key: ComponentKey) -> int:
+        kid = self.__kind_id.get(key.kind)
+        if kid is None:
+            kid = len(self.__kinds)
+            self.__kind_id[key.kind] = kid
+            self.__kinds.append(key.kind)
+        row = len(self.__frags)
+        self.__frags.append(key)
+        self.__row_of[key] = row
+        self.__kind.append(kid)
+        self.__price.append(key.price)
+        self.__voltage.append(key.voltage if key.voltage is not None else NAN)
+        self.__current.append(key.current if key.current is not None else NAN)
+        self.__qty.append(0)
+        return row
+
+    def set_qty(self, frag: str, qty: int) -> None:
+        '''
+        Set the quantity of a component, adding its row the first time.
+        Negative quantities are stored as 0.
+
+        Parameters:
+        frag (str): Component fragment (row without stock quantity).
+        qty (int): New quantity on hand.
+
+        Author: Pratik SAPKOTA
+        '''
+        row = self.__row_of.get(frag)
+        if row is None:
+            if qty <= 0:
+                return
+            row = self.__add_row(ComponentKey.of(frag))
+        self.__qty[row] = qty if qty > 0 else 0
+
+    def qty(self, frag: str) -> int:
+        row = self.__row_of.get(frag)
+        return 0 if row is None else self.__qty[row]
+
+    def valuation(self, kind: Optional[str] = None) -> float:
+        '''
+        Total value (price * quantity) of the stock, optionally of one kind.
+
+        Parameters:
+        kind (Optional[str]): Only this component kind, e.g. "Battery".
+
+        Returns:
+        float
+
+        Author: Botao HUANG
+        '''
+        if kind is not None:
+            return self.totals_by_kind().get(kind, (0, 0.0))[1]
+        if np is not None and self.__frags:
+            price = np.frombuffer(self.__price, dtype=np.float64)
+            qty = np.frombuffer(self.__qty, dtype=np.int64)
+            return float(np.dot(price, qty))
+        return math.fsum(map(mul, self.__price, self.__qty))
+
+    def totals_by_kind(self) -> Dict[str, Tuple[int, float]]:
+        '''
+        Units on hand and stock value per component kind. Kinds whose every
+        row has sold out are left out.
+
+        Returns:
+        Dict[str, Tuple[int, float]]: kind -> (units, value)
+
+        Author: Botao HUANG
+        '''
+        nk = len(self.__kinds)
+        if np is not None and self.__frags:
+            kind = np.frombuffer(self.__kind, dtype=np.dtype("l"))
+            qty = np.frombuffer(self.__qty, dtype=np.int64)
+            price = np.frombuffer(self.__price, dtype=np.float64)
+            units_col = np.bincount(kind, weights=qty, minlength=nk)
+            value_col = np.bincount(kind, weights=price * qty, minlength=nk)
+            units = [int(u) for u in units_col]
+            value = [float(v) for v in value_col]
+        else:
+            units = [0] * nk
+            value = [0.0] * nk
+            for kid, p, q in zip(self.__kind, self.__price, self.__qty):
+                units[kid] += q
+                value[kid] += p * q
+        return {self.__kinds[k]: (units[k], value[k]) for k in range(nk) if units[k] > 0}
+
+    def reorder(self, threshold: int, kind: Optional[str] = None) -> List[Tuple[int, ComponentKey]]:
+        '''
+        Components at or below a stock threshold, sold-out ones included,
+        lowest quantity first.
+
+        Parameters:
+        threshold (int): Report rows whose quantity is <= threshold.
+        kind (Optional[str]): Only this component kind.
+
+        Returns:
+        List[Tuple[int, ComponentKey]]: (quantity, fragment)
+
+        Author: Pratik SAPKOTA
+        '''
+        kid = -1
+        if kind is not None:
+            kid = self.__kind_id.get(kind, -2)
+            if kid == -2:
+                return []
+        if np is not None and self.__frags:
+            qty = np.frombuffer(self.__qty, dtype=np.int64)
+            mask = qty <= threshold
+            if kid >= 0:
+                mask &= np.frombuffer(self.__kind, dtype=np.dtype("l")) == kid
+            rows = [int(r) for r in np.flatnonzero(mask)]
+        else:
+            rows = [r for r, q in enumerate(self.__qty) if q <= threshold]
+            if kid >= 0:
+                kcol = self.__kind
+                rows = [r for r in rows if kcol[r] == kid]
+        out = [(self.__qty[r], self.__frags[r]) for r in rows]
+        out.sort()
+        return out
+
+    def voltage_range(self, lo: float, hi: float) -> List[ComponentKey]:
+        '''
+        In-stock components rated between lo and hi volts (inclusive).
+
+        Author: Unubileg ADILBISH
+        '''
+        return self.__in_range(self.__voltage, lo, hi)
+
+    def current_range(self, lo: float, hi: float) -> List[ComponentKey]:
+        '''
+        In-stock components drawing or supplying between lo and hi amps (inclusive).
+
+        Author: Unubileg ADILBISH
+        '''
+        return self.__in_range(self.__current, lo, hi)
+
+    def __in_range(self, column: array, lo: float, hi: float) -> List[ComponentKey]:
+        # NaN (no such field) fails both comparisons, so those rows never match
+        if np is not None and self.__frags:
+            col = np.frombuffer(column, dtype=np.float64)
+            qty = np.frombuffer(self.__qty, dtype=np.int64)
+            rows = np.flatnonzero((col >= lo) & (col <= hi) & (qty > 0))
+            return [self.__frags[int(r)] for r in rows]
+        return [self.__frags[r] for r, (v, q) in enumerate(zip(column, self.__qty))
+                if lo <= v <= hi and q > 0]
@@ -0,0 +1,216 @@
+# File: Journal.py
+# Author: Unubileg ADILBISH, Pratik SAPKOTA, Botao HUANG
+# ID: 523127, 522498, 521560
+# Email: 523127@learning.eynesbury.edu.au, 522498@learning.eynesbury.edu.au, 521560@learning.eynesbury.edu.au
+# Description: Append-only mutation journal that sits on top of the CSV snapshots.
+# This is our own work as defined by the Academic Integrity Policy
+
+import io
+import os
+import csv
+from typing import List, Tuple, Iterator, Optional
+from storage.AtomicFile import FsyncPolicy
+
+# Record types (first column of every journal row)
+J_COMPONENT = "C"   # C, delta, fragment
+J_KIT_QTY   = "K"   # K, delta, kit_name
+J_KIT_ADD   = "A"   # A, qty, kit_name, item_qty, item_type, ...fields...
+
+# Every record ends with this column so a torn last line can be recognised
+J_END = "."
+
+# First line of a non-empty journal: "#gen,<n>". Each checkpoint folds one
+# generation into the CSVs and starts the next; FOLDED_FILE records, per
+# dataset, the last generation already folded in, so records of that
+# generation are not replayed twice after a crash between the two steps.
+J_GENERATION = "#gen"
+FOLDED_FILE = "journal_folded.csv"
+
+
+class Journal:
+    '''
+    Append-only log of inventory deltas. Each stock mutation is written as one
+    small CSV row instead of rewriting circuits.csv / components.csv, and the
+    log is folded back into the snapshots by App.checkpoint().
+
+    Author: Unubileg ADILBISH
+    '''
+
+    def __init__(self, path: str, policy: Optional[FsyncPolicy] = None, next_generation: int = 0) -> None:
+        '''
+        Open (or create) the journal file at path.
+
+        Parameters:
+        path (str): Location of the journal file.
+        policy (Optional[FsyncPolicy]): When appends are fsync'd; never if None.
+        next_generation (int): Generation of the journal if it is empty
+        (one past the last generation folded into the CSVs).
+
+        Returns:
+        None
+
+        Author: Unubileg ADILBISH
+        '''
+        self.__path = path
+        self.__policy = policy
+        if not os.path.exists(path):
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                pass
+        self.__seal_torn_tail()
+        self.__generation = self.__read_generation(next_generation)
+        self.__count = sum(1 for _ in self.read())
+
+    @property
+    def path(self) -> str:
+        '''
+        Returns the journal file path.
+        Author: Unubileg ADILBISH
+        '''
+        return self.__path
+
+    @property
+    def generation(self) -> int:
+        '''
+        Checkpoint generation the records in the journal belong to.
+        Author: Unubileg ADILBISH
+        '''
+        return self.__generation
+
+    def __read_generation(self, next_generation: int) -> int:
+        '''
+        The generation in the header line; next_generation for an empty
+        journal, 0 for one written before generations existed.
+
+        Author: Unubileg ADILBISH
+        '''
+        with open(self.__path, "r", encoding="utf-8", newline="") as f:
+            first = f.readline()
+        if first == "":
+            return next_generation
+        if first.startswith(J_GENERATION + ","):
+            try:
+                return int(first.strip().split(",")[1])
+            except ValueError:
+                pass
+        return 0
+
+    def __len__(self) -> int:
+        '''
+        Number of records written since the last clear().
+        Author: Unubileg ADILBISH
+        '''
+        return self.__count
+
+    def __seal_torn_tail(self) -> None:
+        '''
+        Terminate a torn last line so the next append starts on a fresh row.
+
+        Returns:
+        None
+
+        Author: Botao HUANG
+        '''
+        with open(self.__path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def append(self, records: List[List[str]]) -> None:
+        '''
+        Append a batch of records with a single open/write/flush.
+
+        Parameters:
+        records (List[List[str]]): Rows to append.
+
+        Returns:
+        None
+
+        Author: Pratik SAPKOTA
+        '''
+        if not records:
+            return
+        with open(self.__path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+            if f.tell() == 0:
+                writer.writerow([J_GENERATION, self.__generation])
+            writer.writerows([r + [J_END] for r in records])
+            f.flush()
+            if self.__policy is not None:
+                self.__policy.written(self.__path, f)
+        self.__count += len(records)
+
+    def read(self) -> Iterator[List[str]]:
+        '''
+        Stream the journal records in the order they were written.
+        A torn last line (crash mid-append) is skipped.
+
+        Returns:
+        Iterator[List[str]]
+
+        Author: Botao HUANG
+        '''
+        with open(self.__path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.reader(f):
+                if len(row) < 4 or row[-1] != J_END:
+                    continue
+                yield row[:-1]
+
+    def size(self) -> int:
+        '''
+        Current length of the journal file in bytes.
+        Author: Botao HUANG
+        '''
+        return os.path.getsize(self.__path)
+
+    def tail(self, offset: int) -> Tuple[List[List[str]], int]:
+        '''
+        Records appended after byte offset, e.g. by another process sharing
+        the journal. Only complete lines are returned; they are added to len().
+
+        Parameters:
+        offset (int): Byte offset to read from (a value returned by size() or tail()).
+
+        Returns:
+        Tuple[List[List[str]], int]: (records, offset just past the last complete line)
+
+        Author: Botao HUANG
+        '''
+        with open(self.__path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        records = []
+        for row in csv.reader(io.StringIO(data[:end].decode("utf-8"), newline="")):
+            if len(row) < 4 or row[-1] != J_END:
+                continue
+            records.append(row[:-1])
+        self.__count += len(records)
+        return records, offset + end
+
+    def recount(self, next_generation: int = 0) -> int:
+        '''
+        Count the records on disk again (after another process truncated the journal).
+        next_generation is as for the constructor.
+        Author: Botao HUANG
+        '''
+        self.__generation = self.__read_generation(next_generation)
+        self.__count = sum(1 for _ in self.read())
+        return self.__count
+
+    def clear(self) -> None:
+        '''
+        Truncate the journal once its records are folded into the snapshots,
+        starting the next generation.
+
+        Returns:
+        None
+
+        Author: Pratik SAPKOTA
+        '''
+        with open(self.__path, "w", newline="", encoding="utf-8") as f:
+            pass
+        self.__generation = self.__generation + 1
+        self.__count = 0
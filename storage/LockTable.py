@@ -0,0 +1,121 @@
+# File: LockTable.py
+# Author: Unubileg ADILBISH, Pratik SAPKOTA, Botao HUANG
+# ID: 523127, 522498, 521560
+# Email: 523127@learning.eynesbury.edu.au, 522498@learning.eynesbury.edu.au, 521560@learning.eynesbury.edu.au
+# Description: Per-key locks (one per component / kit) plus an exclusive mode for compaction.
+# This is our own work as defined by the Academic Integrity Policy
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator
+
+
+class LockTable:
+    '''
+    One re-entrant lock per key (e.g. per component fragment or kit name),
+    created on first use. hold() takes the locks for a set of keys in sorted
+    order, so two operations over overlapping keys cannot deadlock, and
+    operations over disjoint keys do not wait for each other.
+
+    Every hold() also counts as a shared hold; exclusive() waits until no
+    thread holds any key and blocks new holders until it is done, which is
+    what a checkpoint needs to see a quiet inventory.
+
+    Author: Pratik SAPKOTA
+    '''
+
+    def __init__(self) -> None:
+        self.__locks: Dict[str, threading.RLock] = {}
+        self.__table_lock = threading.Lock()
+        self.__cond = threading.Condition(threading.Lock())
+        self.__holders = 0
+        self.__exclusive_owner = None
+        self.__exclusive_depth = 0
+        self.__local = threading.local()
+
+    def __lock_for(self, key: str) -> threading.RLock:
+        lock = self.__locks.get(key)
+        if lock is None:
+            with self.__table_lock:
+                lock = self.__locks.setdefault(key, threading.RLock())
+        return lock
+
+    def depth(self) -> int:
+        '''
+        How many hold() blocks the calling thread is inside.
+
+        Author: Pratik SAPKOTA
+        '''
+        return getattr(self.__local, "depth", 0)
+
+    def __enter_shared(self) -> None:
+        depth = self.depth()
+        me = threading.get_ident()
+        if depth == 0 and self.__exclusive_owner != me:
+            with self.__cond:
+                while self.__exclusive_owner is not None:
+                    self.__cond.wait()
+                self.__holders = self.__holders + 1
+        self.__local.depth = depth + 1
+
+    def __exit_shared(self) -> None:
+        depth = self.depth() - 1
+        self.__local.depth = depth
+        if depth == 0 and self.__exclusive_owner != threading.get_ident():
+            with self.__cond:
+                self.__holders = self.__holders - 1
+                self.__cond.notify_all()
+
+    @contextmanager
+    def hold(self, keys: Iterable[str]) -> Iterator[None]:
+        '''
+        Lock every key in keys (sorted, duplicates ignored) for the block.
+
+        Parameters:
+        keys (Iterable[str]): Keys to lock.
+
+        Author: Pratik SAPKOTA
+        '''
+        self.__enter_shared()
+        taken = []
+        try:
+            for key in sorted(set(keys)):
+                lock = self.__lock_for(key)
+                lock.acquire()
+                taken.append(lock)
+            yield
+        finally:
+            for lock in reversed(taken):
+                lock.release()
+            self.__exit_shared()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        '''
+        Wait for every other holder to leave, then keep them out for the block.
+        Must not be entered from inside hold() by the same thread.
+
+        Author: Unubileg ADILBISH
+        '''
+        me = threading.get_ident()
+        if self.__exclusive_owner == me:
+            self.__exclusive_depth = self.__exclusive_depth + 1
+            try:
+                yield
+            finally:
+                self.__exclusive_depth = self.__exclusive_depth - 1
+            return
+        if self.depth() > 0:
+            raise RuntimeError("exclusive() entered while holding keys")
+        with self.__cond:
+            while self.__exclusive_owner is not None:
+                self.__cond.wait()
+            self.__exclusive_owner = me
+            while self.__holders > 0:
+                self.__cond.wait()
+        try:
+            yield
+        finally:
+            with self.__cond:
+                self.__exclusive_owner = None
+                self.__cond.notify_all()
@@ -0,0 +1,116 @@
+# File: SharedDir.py
+# Author: Unubileg ADILBISH, Pratik SAPKOTA, Botao HUANG
+# ID: 523127, 522498, 521560
+# Email: 523127@learning.eynesbury.edu.au, 522498@learning.eynesbury.edu.au, 521560@learning.eynesbury.edu.au
+# Description: Advisory lock and version stamp for a data directory shared by several processes.
+# This is our own work as defined by the Academic Integrity Policy
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+LOCK_FILE = "data.lock"
+VERSION_FILE = "data.version"
+
+
+class SharedDir:
+    '''
+    Coordination between processes that open the same data directory.
+
+    lock() takes an advisory lock on data.lock (flock on POSIX, msvcrt on
+    Windows); it is re-entrant within a process and threads of one process
+    take it in turn. data.version holds a number that is bumped every time
+    the snapshots are rewritten and the journal is truncated, so a process
+    can tell whether the journal records it has already merged are still
+    there or whether it has to reload.
+
+    Author: Botao HUANG
+    '''
+
+    def __init__(self, data_dir: str) -> None:
+        self.__lock_path = os.path.join(data_dir, LOCK_FILE)
+        self.__version_path = os.path.join(data_dir, VERSION_FILE)
+        self.__file = open(self.__lock_path, "a+b")
+        self.__thread_lock = threading.RLock()
+        self.__depth = 0
+
+    def __acquire_file(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self.__file.fileno(), fcntl.LOCK_EX)
+            return
+        self.__file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(self.__file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue  # LK_LOCK gives up after ~10s; keep waiting
+
+    def __release_file(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self.__file.fileno(), fcntl.LOCK_UN)
+            return
+        self.__file.seek(0)
+        msvcrt.locking(self.__file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    @contextmanager
+    def lock(self) -> Iterator[bool]:
+        '''
+        Hold the directory lock for the block.
+
+        Returns:
+        Iterator[bool]: yields True when this call took the lock, False when
+        the calling thread already held it.
+
+        Author: Botao HUANG
+        '''
+        with self.__thread_lock:
+            outermost = self.__depth == 0
+            if outermost:
+                self.__acquire_file()
+            self.__depth = self.__depth + 1
+            try:
+                yield outermost
+            finally:
+                self.__depth = self.__depth - 1
+                if outermost:
+                    self.__release_file()
+
+    def version(self) -> int:
+        '''
+        Current version stamp of the snapshots (0 if never bumped).
+
+        Author: Pratik SAPKOTA
+        '''
+        try:
+            with open(self.__version_path, "r", encoding="utf-8") as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def bump(self) -> int:
+        '''
+        Increase the version stamp; call with the lock held, after the
+        snapshots have been rewritten and the journal truncated.
+
+        Returns:
+        int: The new version.
+
+        Author: Pratik SAPKOTA
+        '''
+        v = self.version() + 1
+        tmp = self.__version_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(str(v))
+        os.replace(tmp, self.__version_path)
+        return v
+
+    def close(self) -> None:
+        self.__file.close()
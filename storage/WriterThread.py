@@ -0,0 +1,119 @@
+# File: WriterThread.py
+# Author: Unubileg ADILBISH, Pratik SAPKOTA, Botao HUANG
+# ID: 523127, 522498, 521560
+# Email: 523127@learning.eynesbury.edu.au, 522498@learning.eynesbury.edu.au, 521560@learning.eynesbury.edu.au
+# Description: Single background thread that performs every file write in submission order.
+# This is our own work as defined by the Academic Integrity Policy
+
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+_STOP = object()
+
+
+class WriterThread:
+    '''
+    Serializes file writes from many threads onto one worker thread.
+    Tasks run strictly in the order they were submitted, so a journal append
+    queued before a checkpoint is always on disk before the checkpoint runs.
+
+    submit() queues a task and returns at once; call() queues one and waits
+    for its result; flush() waits until everything queued so far is done.
+    An exception raised by a submitted task is re-raised by the next flush().
+
+    Author: Unubileg ADILBISH
+    '''
+
+    def __init__(self, name: str = "app-writer") -> None:
+        self.__queue: "queue.Queue[Any]" = queue.Queue()
+        self.__error: Optional[BaseException] = None
+        self.__thread = threading.Thread(target=self.__run, name=name, daemon=True)
+        self.__closed = False
+        self.__thread.start()
+
+    def __run(self) -> None:
+        while True:
+            task = self.__queue.get()
+            if task is _STOP:
+                return
+            fn, args, done = task
+            try:
+                result = fn(*args)
+                if done is not None:
+                    done["result"] = result
+            except BaseException as e:
+                if done is not None:
+                    done["error"] = e
+                elif self.__error is None:
+                    self.__error = e
+            finally:
+                if done is not None:
+                    done["event"].set()
+
+    def on_writer(self) -> bool:
+        '''
+        True when called from the writer thread itself.
+
+        Author: Unubileg ADILBISH
+        '''
+        return threading.current_thread() is self.__thread
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        '''
+        Queue fn(*args) to run on the writer thread.
+
+        Author: Unubileg ADILBISH
+        '''
+        if self.__closed:
+            raise RuntimeError("writer thread is closed")
+        if self.on_writer():
+            fn(*args)
+            return
+        self.__queue.put((fn, args, None))
+
+    def call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        '''
+        Run fn(*args) on the writer thread after everything queued before it,
+        and return its result (or raise its exception).
+
+        Author: Pratik SAPKOTA
+        '''
+        if self.on_writer():
+            return fn(*args)
+        if self.__closed:
+            raise RuntimeError("writer thread is closed")
+        done = {"event": threading.Event()}
+        self.__queue.put((fn, args, done))
+        done["event"].wait()
+        if "error" in done:
+            raise done["error"]
+        return done.get("result")
+
+    def flush(self) -> None:
+        '''
+        Wait until every task submitted so far has run.
+
+        Author: Pratik SAPKOTA
+        '''
+        if not self.__closed:
+            self.call(lambda: None)
+        err = self.__error
+        if err is not None:
+            self.__error = None
+            raise err
+
+    def close(self) -> None:
+        '''
+        Flush, then stop the thread.
+
+        Author: Botao HUANG
+        '''
+        if self.__closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self.__closed = True
+            self.__queue.put(_STOP)
+            self.__thread.join()
@@ -0,0 +1,149 @@
+# File: parallel_load.py
+# Author: Unubileg ADILBISH, Pratik SAPKOTA, Botao HUANG
+# ID: 523127, 522498, 521560
+# Email: 523127@learning.eynesbury.edu.au, 522498@learning.eynesbury.edu.au, 521560@learning.eynesbury.edu.au
+# Description: Parses very large circuits.csv / components.csv files across a process pool.
+# This is our own work as defined by the Academic Integrity Policy
+
+"""
+Parallel parsing of circuits.csv / components.csv for very large files.
+
+The file is cut into byte ranges that end on line boundaries, each range is
+parsed by a worker process, and the results are merged in file order with the
+same semantics as the serial loaders in App: duplicate fragments have their
+quantities summed, and duplicate kit names sum their quantities and keep the
+first definition. Workers send back canonical fragment text, which the parent
+turns into interned keys with ComponentKey.of_canonical (fields are parsed
+lazily), so the expensive parsing is what runs in parallel.
+
+Quoted fields with embedded newlines are not supported (the App never writes
+them). Files smaller than PARALLEL_MIN_BYTES are not worth the process start-up
+and are left to the serial loader.
+"""
+
+import os
+import csv
+import io
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+CHUNKS_PER_WORKER = 4
+
+
+def worth_parallel(path: str, workers: Optional[int]) -> bool:
+    """
+    True if path is large enough, and more than one worker is allowed, for a parallel load.
+    """
+    if workers is not None and workers < 2:
+        return False
+    if (os.cpu_count() or 1) < 2 and workers is None:
+        return False
+    try:
+        return os.path.getsize(path) >= PARALLEL_MIN_BYTES
+    except OSError:
+        return False
+
+
+def split_ranges(path: str, parts: int) -> List[Tuple[int, int]]:
+    """
+    Cut a file into at most parts byte ranges, each ending just after a newline.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    step = max(1, size // max(1, parts))
+    bounds = [0]
+    with open(path, "rb") as f:
+        pos = step
+        while pos < size:
+            f.seek(pos)
+            f.readline()
+            cut = f.tell()
+            if cut >= size:
+                break
+            if cut > bounds[-1]:
+                bounds.append(cut)
+            pos = cut + step
+    bounds.append(size)
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+
+def _rows(path: str, start: int, end: int) -> Any:
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return csv.reader(io.StringIO(data.decode("utf-8"), newline=""))
+
+
+def _parse_components(path: str, start: int, end: int) -> Dict[str, int]:
+    stock: Dict[str, int] = {}
+    for row in _rows(path, start, end):
+        if not row or len(row) < 2:
+            continue
+        try:
+            qty = int(row[0].strip())
+        except Exception:
+            qty = 0
+        frag = ",".join([c.strip() for c in row[1:]])
+        stock[frag] = stock.get(frag, 0) + qty
+    return stock
+
+
+def _parse_kits(path: str, start: int, end: int) -> Dict[str, Tuple[int, List[Tuple[int, str]]]]:
+    from circuitkit.CircuitKit import CircuitKit
+    kits: Dict[str, Tuple[int, List[Tuple[int, str]]]] = {}
+    for row in _rows(path, start, end):
+        if not row or len(row) < 2:
+            continue
+        try:
+            qty, kit = CircuitKit.from_components_csv_row(row)
+        except Exception:
+            continue
+        prev = kits.get(kit.name)
+        if prev is None:
+            kits[kit.name] = (qty, [(q, str(f)) for q, f in kit.items])
+        else:
+            kits[kit.name] = (prev[0] + qty, prev[1])
+    return kits
+
+
+def _map_ranges(fn: Any, path: str, workers: Optional[int]) -> List[Any]:
+    n = workers or os.cpu_count() or 2
+    ranges = split_ranges(path, n * CHUNKS_PER_WORKER)
+    with ProcessPoolExecutor(max_workers=n) as pool:
+        futures = [pool.submit(fn, path, lo, hi) for lo, hi in ranges]
+        return [fut.result() for fut in futures]
+
+
+def load_components(path: str, workers: Optional[int] = None) -> Dict[str, int]:
+    """
+    Parse circuits.csv in parallel.
+
+    Returns:
+    Dict[str, int]: canonical fragment -> summed quantity, in first-seen file order.
+    """
+    stock: Dict[str, int] = {}
+    for part in _map_ranges(_parse_components, path, workers):
+        if not stock:
+            stock = part
+            continue
+        for frag, qty in part.items():
+            stock[frag] = stock.get(frag, 0) + qty
+    return stock
+
+
+def load_kits(path: str, workers: Optional[int] = None) -> Dict[str, Tuple[int, List[Tuple[int, str]]]]:
+    """
+    Parse components.csv in parallel.
+
+    Returns:
+    Dict[str, Tuple[int, List[Tuple[int, str]]]]: kit name -> (summed quantity,
+    first definition as (item qty, canonical fragment) pairs), in first-seen file order.
+    """
+    kits: Dict[str, Tuple[int, List[Tuple[int, str]]]] = {}
+    for part in _map_ranges(_parse_kits, path, workers):
+        for name, (qty, items) in part.items():
+            prev = kits.get(name)
+            kits[name] = (qty, items) if prev is None else (prev[0] + qty, prev[1])
+    return kits
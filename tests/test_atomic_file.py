@@ -0,0 +1,66 @@
+# Academic Integrity Statment
+# Filename: test_atomic_file.py
+# Author: Unubileg Adilbish
+# Student ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Test code for atomic snapshot writes and fsync policies
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from storage.AtomicFile import AtomicFile, FsyncPolicy, FSYNC_ON_CLOSE
+from app import App
+
+def test_atomic_file():
+    print("\n=== Atomic file writes ===")
+    d = tempfile.mkdtemp()
+    path = os.path.join(d, "circuits.csv")
+    files = AtomicFile()
+    with files.open(path) as f:
+        f.write("10,Wire,25,1.6\n")
+    # a failed write leaves the old file untouched and no temp file behind
+    try:
+        with files.open(path) as f:
+            f.write("half a ro")
+            raise RuntimeError("crash")
+    except RuntimeError:
+        pass
+    assert open(path).read() == "10,Wire,25,1.6\n"
+    assert not os.path.exists(path + ".tmp")
+    # writes in a batch only appear at its end, the last one wins
+    lazy = AtomicFile(FsyncPolicy(FSYNC_ON_CLOSE))
+    with lazy.batch():
+        with lazy.open(path) as f:
+            f.write("1,Wire,25,1.6\n")
+        with lazy.open(path) as f:
+            f.write("2,Wire,25,1.6\n")
+        assert open(path).read() == "10,Wire,25,1.6\n"
+    assert open(path).read() == "2,Wire,25,1.6\n"
+    lazy.policy.sync()
+    try:
+        FsyncPolicy("sometimes")
+        assert False
+    except ValueError:
+        pass
+    app = App(d, fsync="always")
+    app.sell_component("Wire,25,1.6", 1)
+    app.close()
+    print("After close:", open(path).read().strip())
+    assert open(path).read() == "1,Wire,25,1.6\n"
+    # under "close" a checkpoint still fsyncs what it folded before the journal is truncated
+    lazy_app = App(d, fsync="close")
+    lazy_app.sell_component("Wire,25,1.6", 1)
+    synced = []
+    real_fsync = os.fsync
+    os.fsync = lambda fd: synced.append(fd)
+    try:
+        lazy_app.checkpoint()
+    finally:
+        os.fsync = real_fsync
+    print("fsyncs during checkpoint:", len(synced))
+    assert len(synced) >= 2   # at least the folded CSV and the directory
+
+if __name__ == "__main__":
+    test_atomic_file()
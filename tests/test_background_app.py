@@ -0,0 +1,69 @@
+# Academic Integrity Statment
+# Filename: test_background_app.py
+# Author: Unubileg Adilbish
+# Student ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Test code for persisting App changes on a background thread
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile, threading
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from circuitkit.CircuitKit import CircuitKit
+
+def test_background_app():
+    print("\n=== Background persistence ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("40,Battery,AA,1.5,3.1\n40,Wire,25,1.6\n")
+    kits_csv = os.path.join(d, "components.csv")
+    app = App(d, checkpoint_every=5, background=True)
+    for _ in range(12):
+        app.sell_component("Wire,25,1.6", 1)
+    app.flush()
+    # only circuits.csv had journaled changes, so components.csv is not rewritten
+    assert os.path.getsize(kits_csv) == 0
+    app.perform_pack(CircuitKit("Torch", 0.0, [(2, "Battery,AA,1.5,3.1")]), 3)
+    print("Ledger rows:", app.summarize_transactions()[:2])
+    assert len(app.search_transactions("2000-01-01", "2999-12-31")) == 13
+    app.close()
+    again = App(d)
+    print("Reopened:", again.list_component_rows())
+    assert again.list_component_rows() == [(34, "Battery,AA,1.5,3.1"), (28, "Wire,25,1.6")]
+    assert [(q, k.name) for q, k in again.list_circuit_objects()] == [(3, "Torch")]
+
+def test_threads_then_reopen():
+    print("\n=== Several writer threads, reopened without close() ===")
+    torch = CircuitKit("Torch", 0.0, [(1, "Wire,0,1.6"), (1, "Wire,1,1.6")])
+    for opts in [{"background": True}, {"threadsafe": True}]:
+        d = tempfile.mkdtemp()
+        with open(os.path.join(d, "circuits.csv"), "w") as f:
+            for i in range(8):
+                f.write("1000,Wire," + str(i) + ",1.6\n")
+        app = App(d, checkpoint_every=50, **opts)
+
+        def work(t):
+            for i in range(120):
+                frag = "Wire," + str((t + i) % 8) + ",1.6"
+                if i % 3 == 0:
+                    app.buy_component(frag, 2)
+                elif i % 3 == 1:
+                    app.sell_component(frag, 1)
+                else:
+                    app.perform_pack(torch, 1)
+        threads = [threading.Thread(target=work, args=(t,)) for t in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        app.flush()
+        again = App(d)
+        print(opts, "memory:", app.list_component_rows()[:2], "disk:", again.list_component_rows()[:2])
+        assert again.list_component_rows() == app.list_component_rows()
+        assert [(q, k.name) for q, k in again.list_circuit_objects()] == [(320, "Torch")]
+
+if __name__ == "__main__":
+    test_background_app()
+    test_threads_then_reopen()
@@ -0,0 +1,53 @@
+# Academic Integrity Statment
+# Filename: test_binary_snapshot.py
+# Author: Unubileg
+# Student ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Test code for the binary startup snapshot
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from circuitkit.CircuitKit import CircuitKit
+from storage.BinarySnapshot import BinarySnapshot, SNAPSHOT_FILE
+
+def test_binary_snapshot():
+    print("\n=== BinarySnapshot ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("8,Battery,AA,1.5,3.1\n10,Wire,25,1.6\n")
+    app = App(d)
+    app.add_circuit_object(CircuitKit("Torch", 0.0, [(2, "Battery,AA,1.5,3.1"), (1, "Wire,25,1.6")]), 3)
+    app.checkpoint()
+    # the kit added through the public mutator is folded into its CSV too
+    with open(os.path.join(d, "components.csv")) as f:
+        assert f.read().startswith("3,Torch,")
+    sources = [os.path.join(d, "circuits.csv"), os.path.join(d, "components.csv")]
+    snap = BinarySnapshot.open(os.path.join(d, SNAPSHOT_FILE), sources)
+    print("Components:", list(snap.iter_components()), "Kits:", list(snap.iter_kits()))
+    assert snap.component(1) == (10, "Wire,25,1.6")
+    assert list(snap.iter_kits()) == [("Torch", 3, [(2, "Battery,AA,1.5,3.1"), (1, "Wire,25,1.6")])]
+    snap.close()
+    again = App(d)
+    assert again.list_component_rows() == app.list_component_rows()
+    assert [(q, k.name, k.items) for q, k in again.list_circuit_objects()] == [(3, "Torch", app.list_circuit_objects()[0][1].items)]
+    # editing a CSV by hand makes the snapshot stale, so the CSV wins
+    with open(sources[0], "a") as f:
+        f.write("4,Wire,40,2.4\n")
+    assert BinarySnapshot.open(os.path.join(d, SNAPSHOT_FILE), sources) is None
+    assert len(App(d).list_component_rows()) == 3
+    # so does editing it while an App has it open: close() must not stamp
+    # a snapshot of the old contents with the edited file's mtime
+    opened = App(d)
+    opened.list_component_rows()
+    with open(sources[0], "a") as f:
+        f.write("5,Wire,60,3.0\n")
+    opened.close()
+    assert BinarySnapshot.open(os.path.join(d, SNAPSHOT_FILE), sources) is None
+    assert len(App(d).list_component_rows()) == 4
+
+if __name__ == "__main__":
+    test_binary_snapshot()
@@ -0,0 +1,32 @@
+# Academic Integrity Statment
+# Filename: test_bom_index.py
+# Author: Botao Huang
+# Student ID: 521560
+# Email: 521560@learning.eynesbury.edu.au
+# Description: Test code for BomIndex
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from circuitkit.BomIndex import BomIndex
+
+def test_bom_index():
+    print("\n=== BomIndex ===")
+    bom = BomIndex()
+    bom.compile("Light Circuit", [(2, "Battery,AA,1.5,3.1"), (1, "Wire,25,1.6")])
+    bom.compile("Sensor Circuit", [(1, "Sensor,motion,5,3.9"), (1, "Wire,25,1.6"), (1, "Wire,25,1.6")])
+    print("Lines:", bom.lines("Sensor Circuit", 3))
+    assert bom.lines("Sensor Circuit", 3) == [("Sensor,motion,5,3.9", 3), ("Wire,25,1.6", 6)]
+    assert bom.users("Wire,25,1.6") == {"Light Circuit", "Sensor Circuit"}
+    stock = {"Battery,AA,1.5,3.1": 3, "Wire,25,1.6": 5}
+    assert bom.shortfall("Light Circuit", 1, stock) is None
+    assert bom.shortfall("Light Circuit", 2, stock) == "Battery,AA,1.5,3.1"
+    bom.remove("Light Circuit")
+    print("Users of AA:", bom.users("Battery,AA,1.5,3.1"))
+    assert bom.users("Battery,AA,1.5,3.1") == set()
+    assert "Light Circuit" not in bom
+
+if __name__ == "__main__":
+    test_bom_index()
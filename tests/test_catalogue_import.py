@@ -0,0 +1,60 @@
+# Academic Integrity Statment
+# Filename: test_catalogue_import.py
+# Author: Pratik Sapkota
+# Student ID: 522498
+# Email: 522498@learning.eynesbury.edu.au
+# Description: Test code for bulk supplier catalogue imports
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+
+def test_catalogue_import():
+    print("\n=== Catalogue import ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("8,Battery,AA,1.5,3.1\n")
+    supplier = os.path.join(d, "supplier.csv")
+    with open(supplier, "w") as f:
+        f.write("4,battery, aa ,1.50,3.10\n")        # same battery, written differently
+        f.write("10,Wire,25,1.6\n")
+        f.write("5,Wire,25,1.60\n")
+        f.write("3,Wire,abc,1.6\n")                  # bad length
+        f.write("2,Teleporter,9000\n")               # unknown kind
+        f.write("\n")
+        f.write("1,Switch,push,4.5,4.6\n")
+    app = App(d)
+    report = app.import_catalogue(supplier, chunk_rows=2)
+    print("Report:", report)
+    assert (report["rows"], report["imported"], report["rejected"]) == (6, 4, 2)
+    assert [line for line, _ in report["errors"]] == [4, 5]
+    assert report["components"] == 3 and report["units"] == 20
+    # new components are stored as the program writes them, not as the supplier did
+    assert app.list_component_rows() == [(12, "Battery,AA,1.5,3.1"), (1, "Switch,push,4.5,4.60"),
+                                         (15, "Wire,25,1.60")]
+    # one purchase order: every ledger row shares a timestamp
+    stamps = set(t.split(",")[1] for t in open(os.path.join(d, "transactions.csv")).read().splitlines())
+    assert len(stamps) == 1
+    # large imports are folded straight into circuits.csv
+    big = App(d, checkpoint_every=2)
+    big.import_catalogue(supplier)
+    assert os.path.getsize(os.path.join(d, "journal.csv")) == 0
+    assert App(d).list_component_rows()[0] == (16, "Battery,AA,1.5,3.1")
+    # if the stock can't be saved, no ledger rows claim the import happened
+    ledger = open(os.path.join(d, "transactions.csv")).read()
+    failing = App(d, checkpoint_every=2)
+    def disk_full():
+        raise OSError("disk full")
+    failing.save_components = disk_full
+    try:
+        failing.import_catalogue(supplier)
+        assert False, "the checkpoint should have failed"
+    except OSError:
+        pass
+    assert open(os.path.join(d, "transactions.csv")).read() == ledger
+
+if __name__ == "__main__":
+    test_catalogue_import()
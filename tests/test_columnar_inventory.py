@@ -0,0 +1,73 @@
+# Academic Integrity Statment
+# Filename: test_columnar_inventory.py
+# Author: Botao Huang
+# Student ID: 521560
+# Email: 521560@learning.eynesbury.edu.au
+# Description: Test code for the columnar inventory analytics backend
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+import storage.ColumnarInventory as columnar
+from storage.ColumnarInventory import ColumnarInventory
+
+STOCK = {"Battery,AA,1.5,3.1": 8, "Battery,9V,9.0,5.0": 0, "Wire,25,1.6": 10,
+         "LED Light,red,2.0,20,0.5": 4, "Solar Panel,6.0,0.5,12.0": 1}
+
+def test_columnar_inventory():
+    print("\n=== ColumnarInventory ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("8,Battery,AA,1.5,3.1\n2,Battery,9V,9.0,5.0\n10,Wire,25,1.6\n")
+    app = App(d, columnar=True)
+    print("Value:", app.stock_valuation(), "By kind:", app.stock_totals_by_kind())
+    assert abs(app.stock_valuation() - (8 * 3.1 + 2 * 5.0 + 10 * 1.6)) < 1e-9
+    app.sell_component("Battery,9V,9.0,5.0", 2)
+    totals = app.stock_totals_by_kind()
+    assert totals["Battery"][0] == 8 and totals["Wire"] == (10, 16.0)
+    low = app.reorder_candidates(8)
+    print("Reorder:", low)
+    assert low == [(0, "Battery,9V,9.0,5.0"), (8, "Battery,AA,1.5,3.1")]
+    # without the backend the same figures come from a one-off copy
+    plain = App(d)
+    assert abs(plain.stock_valuation("Battery") - app.stock_valuation("Battery")) < 1e-9
+    # ... which is then kept, so later sales show up as in the maintained store
+    plain.sell_component("Wire,25,1.6", 10)
+    assert plain.reorder_candidates(0) == [(0, "Wire,25,1.6")]
+
+def test_current_column():
+    print("\n=== ColumnarInventory current column ===")
+    inv = ColumnarInventory.from_stock(STOCK)
+    # LED current is in mA, solar panel current in A; the column holds amps
+    print("0.01-0.1 A:", inv.current_range(0.01, 0.1), "0.1-1 A:", inv.current_range(0.1, 1.0))
+    assert inv.current_range(0.01, 0.1) == ["LED Light,red,2.0,20,0.5"]
+    assert inv.current_range(0.1, 1.0) == ["Solar Panel,6.0,0.5,12.0"]
+
+def test_numpy_branch():
+    print("\n=== ColumnarInventory numpy and array paths agree ===")
+    try:
+        import numpy
+    except ImportError:
+        print("numpy is not installed; skipped")
+        return
+    inv = ColumnarInventory.from_stock(STOCK)
+    results = []
+    for backend in (numpy, None):
+        columnar.np = backend
+        try:
+            results.append((inv.valuation(), inv.totals_by_kind(), inv.reorder(5),
+                            inv.reorder(5, "Battery"), inv.voltage_range(1.0, 6.0), inv.current_range(0.01, 1.0)))
+        finally:
+            columnar.np = numpy
+    print("numpy:", results[0])
+    assert abs(results[0][0] - results[1][0]) < 1e-9
+    assert [(u, round(v, 9)) for u, v in results[0][1].values()] == [(u, round(v, 9)) for u, v in results[1][1].values()]
+    assert results[0][2:] == results[1][2:]
+
+if __name__ == "__main__":
+    test_columnar_inventory()
+    test_current_column()
+    test_numpy_branch()
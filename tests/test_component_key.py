@@ -0,0 +1,32 @@
+# Academic Integrity Statment
+# Filename: test_component_key.py
+# Author: Unubileg Adilbish
+# Student ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Test code for the interned component keys
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, gc
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from component.ComponentKey import ComponentKey, _INTERNED
+
+def test_component_key():
+    print("\n=== ComponentKey ===")
+    key = ComponentKey.of("Battery,AA,1.5,3.1")
+    assert ComponentKey.of("Battery , AA , 1.5 , 3.1") is key
+    assert (key.kind, key.price, key.voltage) == ("Battery", 3.1, 1.5)
+    assert not hasattr(key, "__dict__")
+    # lazily parsed keys fill their slots on first use
+    lazy = ComponentKey.of_canonical("LED Light,red,2.0,20,0.5")
+    assert lazy.current == 0.02 and ComponentKey.of("LED Light, red,2.0,20,0.5") is lazy
+    # only canonical text is interned, and only while a key is in use
+    assert "Battery , AA , 1.5 , 3.1" not in _INTERNED
+    ComponentKey.of("Wire,99,9.9")
+    gc.collect()
+    print("Interned:", sorted(_INTERNED.keys()))
+    assert "Wire,99,9.9" not in _INTERNED and "Battery,AA,1.5,3.1" in _INTERNED
+
+if __name__ == "__main__":
+    test_component_key()
@@ -0,0 +1,45 @@
+# Academic Integrity Statment
+# Filename: test_fast_construction.py
+# Author: Unubileg
+# Student ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Test code for slotted components and fromTrusted construction
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from component.Battery import Battery
+from component.Buzzer import Buzzer
+from component.Light import Light
+from component.factory import csv_to_component
+from component.schema import SCHEMAS
+
+def test_fast_construction():
+    print("\n=== fromTrusted ===")
+    pairs = [
+        (Battery("AA Battery", 3.1, 1.5), Battery.fromTrusted("AA Battery", 3.1, 1.5)),
+        (Light("LED Light", 0.5, "red", 2.0, 0.02), Light.fromTrusted("LED Light", 0.5, "red", 2.0, 0.02)),
+    ]
+    for checked, trusted in pairs:
+        print(checked.showDetails(), "|", trusted.showDetails())
+        assert checked.isEqual(trusted)
+        assert not hasattr(trusted, "__dict__")
+    b = Buzzer.fromTrusted(12.0, 0.02, 2000.0, 85.0, 4.5)
+    print(b.showDetails())
+    assert b.isEquals(Buzzer(12.0, 0.02, 2000.0, 85.0, 4.5))
+    # ledger rows are decoded through the trusted path of every schema
+    rows = {"Wire": ["25", "1.6"], "Battery": ["aa", "1.5", "3.1"], "Solar Panel": ["1.4", "0.4", "14"],
+            "Light Globe": ["red", "3", "200", "2.5"], "LED Light": ["green", "2", "20", "0.5"],
+            "Switch": ["push", "4.5", "4.8"], "Sensor": ["motion", "5", "3.9"],
+            "Buzzer": ["240", "90", "4", "120", "5.6"]}
+    assert sorted(rows) == sorted(SCHEMAS)
+    for kind, fields in rows.items():
+        checked = csv_to_component(kind, fields)
+        trusted = csv_to_component(kind, fields, trusted=True)
+        assert type(checked) is type(trusted)
+        assert checked.showDetails() == trusted.showDetails()
+
+if __name__ == "__main__":
+    test_fast_construction()
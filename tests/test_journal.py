@@ -0,0 +1,71 @@
+# Academic Integrity Statment
+# Filename: test_journal.py
+# Author: Botao Huang
+# Student ID: 521560
+# Email: 521560@learning.eynesbury.edu.au
+# Description: Test code for the App mutation journal
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from circuitkit.CircuitKit import CircuitKit
+from storage.Journal import Journal
+
+def test_journal():
+    print("\n=== Journal ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("8,Battery,AA,1.5,3.1\n10,Wire,25,1.6\n")
+    a1 = App(d)
+    a1.buy_component("Battery,AA,1.5,3.1", 2)
+    a1.sell_component("Wire,25,1.6", 4)
+    with open(os.path.join(d, "circuits.csv")) as f:
+        print("Snapshot untouched:", f.read() == "8,Battery,AA,1.5,3.1\n10,Wire,25,1.6\n")
+    a2 = App(d)
+    print("Replayed:", a2.list_component_rows())
+    assert a2.list_component_rows() == [(10, "Battery,AA,1.5,3.1"), (6, "Wire,25,1.6")]
+    a2.checkpoint()
+    a3 = App(d)
+    print("After checkpoint:", a3.list_component_rows())
+    assert a3.list_component_rows() == a2.list_component_rows()
+    assert os.path.getsize(os.path.join(d, "journal.csv")) == 0
+    kit = CircuitKit("Light Circuit", 0.0, [(2, "Battery,AA,1.5,3.1"), (1, "Wire,25,1.6")])
+    a3.perform_pack(kit, 3)
+    a3.perform_unpack("Light Circuit", 1)
+    a4 = App(d)
+    print("Kits replayed:", [(q, k.name, k.items) for q, k in a4.list_circuit_objects()])
+    assert [(q, k.items) for q, k in a4.list_circuit_objects()] == [(2, kit.items)]
+    assert a4.list_component_rows() == [(6, "Battery,AA,1.5,3.1"), (4, "Wire,25,1.6")]
+
+def test_crash_before_clear():
+    print("\n=== Checkpoint interrupted before the journal is truncated ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("8,Battery,AA,1.5,3.1\n")
+    a1 = App(d)
+    a1.buy_component("Battery,AA,1.5,3.1", 2)
+    clear = Journal.clear
+    def crash(self):
+        raise OSError("crashed before clear()")
+    Journal.clear = crash
+    try:
+        a1.checkpoint()
+    except OSError:
+        pass
+    finally:
+        Journal.clear = clear
+    with open(os.path.join(d, "circuits.csv")) as f:
+        print("Folded:", f.read().strip())
+    a2 = App(d)
+    print("Reopened:", a2.list_component_rows())
+    assert a2.list_component_rows() == [(10, "Battery,AA,1.5,3.1")]
+    a2.buy_component("Battery,AA,1.5,3.1", 1)
+    a3 = App(d)
+    assert a3.list_component_rows() == [(11, "Battery,AA,1.5,3.1")]
+
+if __name__ == "__main__":
+    test_journal()
+    test_crash_before_clear()
@@ -0,0 +1,29 @@
+# Academic Integrity Statment
+# Filename: test_kit_planner.py
+# Author: Botao Huang
+# Student ID: 521560
+# Email: 521560@learning.eynesbury.edu.au
+# Description: Test code for KitPlanner
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from circuitkit.KitPlanner import KitPlanner
+
+def test_kit_planner():
+    print("\n=== KitPlanner ===")
+    planner = KitPlanner({
+        "Light Circuit": [(2, "Battery,AA,1.5,3.1"), (1, "Wire,25,1.6")],
+        "Sensor Circuit": [(1, "Sensor,motion,5,3.9"), (1, "Wire,25,1.6"), (1, "Wire,25,1.6")],
+        "Empty": [],
+    })
+    plan = planner.plan({"Battery,AA,1.5,3.1": 7, "Wire,25,1.6": 10, "Sensor,motion,5,3.9": 1})
+    print("Plan:", plan)
+    assert plan["Light Circuit"] == (3, "Battery,AA,1.5,3.1")
+    assert plan["Sensor Circuit"] == (1, "Sensor,motion,5,3.9")
+    assert plan["Empty"] == (0, None)
+
+if __name__ == "__main__":
+    test_kit_planner()
@@ -0,0 +1,33 @@
+# Academic Integrity Statment
+# Filename: test_label_cache.py
+# Author: Pratik Sapkota
+# Student ID: 522498
+# Email: 522498@learning.eynesbury.edu.au
+# Description: Test code for the menu LabelCache
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from menu import LabelCache
+
+def test_label_cache():
+    print("\n=== LabelCache ===")
+    cache = LabelCache(2)
+    calls = []
+    def render(frag):
+        calls.append(frag)
+        return frag.upper()
+    print(cache.get("Wire,25,1.6", "caps", render))
+    cache.get("Wire,25,1.6", "caps", render)
+    cache.get("Wire,30,1.9", "caps", render)
+    cache.get("Wire,25,1.6", "caps", render)
+    cache.get("Wire,40,2.4", "caps", render)   # evicts Wire,30
+    cache.get("Wire,30,1.9", "caps", render)
+    print("Rendered:", calls, "Hits:", cache.hits)
+    assert calls == ["Wire,25,1.6", "Wire,30,1.9", "Wire,40,2.4", "Wire,30,1.9"]
+    assert len(cache) == 2
+
+if __name__ == "__main__":
+    test_label_cache()
@@ -0,0 +1,79 @@
+# Academic Integrity Statment
+# Filename: test_lazy_app.py
+# Author: Pratik Sapkota
+# Student ID: 522498
+# Email: 522498@learning.eynesbury.edu.au
+# Description: Test code for on-demand loading of App datasets
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile, builtins
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from circuitkit.CircuitKit import CircuitKit
+
+def test_lazy_app():
+    print("\n=== Lazy App ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("8,Battery,AA,1.5,3.1\n10,Wire,25,1.6\n")
+    app = App(d)
+    kit = CircuitKit("Torch", 0.0, [(2, "Battery,AA,1.5,3.1"), (1, "Wire,25,1.6")])
+    app.perform_pack(kit, 2)
+    app.sell_circuit("Torch", 1)
+    # a fresh App replays each dataset's journal records when it is first used
+    again = App(d)
+    print("Components:", again.list_component_rows())
+    assert again.list_component_rows() == [(4, "Battery,AA,1.5,3.1"), (8, "Wire,25,1.6")]
+    again.sell_component("Wire,25,1.6", 3)
+    kits = again.list_circuit_objects()
+    print("Kits:", [(q, k.name) for q, k in kits])
+    assert [(q, k.name) for q, k in kits] == [(1, "Torch")]
+    # nothing journaled since the last compaction: checkpoint leaves the files alone
+    again.checkpoint()
+    third = App(d)
+    before = os.path.getmtime(os.path.join(d, "circuits.csv"))
+    third.checkpoint()
+    assert os.path.getmtime(os.path.join(d, "circuits.csv")) == before
+    assert third.list_component_rows() == [(4, "Battery,AA,1.5,3.1"), (5, "Wire,25,1.6")]
+
+def test_component_only_workflow():
+    print("\n=== Component-only workflow leaves kits and ledger unread ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("8,Battery,AA,1.5,3.1\n10,Wire,25,1.6\n")
+    with open(os.path.join(d, "components.csv"), "w") as f:
+        f.write("2,Torch,2,Battery,AA,1.5,3.1,1,Wire,25,1.6\n")
+    with open(os.path.join(d, "transactions.csv"), "w") as f:
+        f.write("Purchase,2025-01-01 10:00:00,8,Battery,AA,1.5,3.1\n")
+    opened = []
+    parsed = []
+    real_open, real_parse = builtins.open, CircuitKit.from_components_csv_row
+    def watch_open(file, mode="r", *args, **kwargs):
+        opened.append((os.path.basename(str(file)), mode))
+        return real_open(file, mode, *args, **kwargs)
+    def watch_parse(row):
+        parsed.append(row)
+        return real_parse(row)
+    builtins.open = watch_open
+    CircuitKit.from_components_csv_row = staticmethod(watch_parse)
+    try:
+        app = App(d)
+        app.buy_component("Battery,AA,1.5,3.1", 2)
+        app.sell_component("Wire,25,1.6", 1)
+        rows = app.list_component_rows()
+        total = app.query_components(kind="Battery")[0]
+    finally:
+        builtins.open = real_open
+        CircuitKit.from_components_csv_row = staticmethod(real_parse)
+    print("Opened:", opened)
+    assert rows == [(10, "Battery,AA,1.5,3.1"), (9, "Wire,25,1.6")] and total == 1
+    # the kit file is never opened and no kit row is parsed
+    assert [name for name, _ in opened if name == "components.csv"] == [] and parsed == []
+    # the ledger is only appended to, never read
+    assert [mode for name, mode in opened if name == "transactions.csv" and "a" not in mode] == []
+
+if __name__ == "__main__":
+    test_lazy_app()
+    test_component_only_workflow()
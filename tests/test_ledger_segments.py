@@ -0,0 +1,66 @@
+# Academic Integrity Statment
+# Filename: test_ledger_segments.py
+# Author: Unubileg
+# Student ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Test code for ledger rotation into compressed segments
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+from datetime import date
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from transaction.LedgerSegments import LedgerSegments
+from transaction.TransactionIndex import TransactionIndex
+from transaction.TransactionHistory import TransactionHistory
+
+def test_ledger_segments():
+    print("\n=== Ledger segments ===")
+    d = tempfile.mkdtemp()
+    ledger = os.path.join(d, "transactions.csv")
+    summary = os.path.join(d, "transactions_summary.csv")
+    with open(ledger, "w") as f:
+        f.write("Purchase Order, 2025-08-11 15:30:47, 2,Battery,AA,1.5,3.1\n")
+        f.write("Customer Sale, 2025-08-12 16:23:31, 2,LED Light,green,3,150,2.2\n")
+    segs = LedgerSegments.for_data_dir(d, max_bytes=None, monthly=True)
+    history = TransactionHistory(ledger, summary, segs)
+    history.refresh()
+    assert not segs.due("2025-08-30") and segs.due("2025-09-01")
+    seg = segs.rotate()
+    print("Closed:", seg.name, seg.first_day, seg.last_day, seg.rows)
+    assert (seg.first_day, seg.last_day, seg.rows) == ("2025-08-11", "2025-08-12", 2)
+    assert os.path.getsize(ledger) == 0
+    with open(ledger, "a") as f:
+        f.write("Customer Sale, 2025-09-02 10:00:00, 1,Wire,25,1.6\n")
+
+    # queries only open the segments their range touches
+    idx = TransactionIndex.for_data_dir(d)
+    assert segs.segments_for("2025-09-01", "2025-09-30") == []
+    assert [r[1].strip() for r in idx.read_rows("2025-08-12")] == ["2025-08-12 16:23:31"]
+    assert len(list(idx.read_rows("2025-08-01", "2025-09-30"))) == 3
+
+    # totals carry across the rotation, with or without a saved checkpoint
+    totals = sorted((op, ts, round(t, 2)) for op, ts, t in history.summarize())
+    print("Summary:", totals)
+    assert len(totals) == 3
+    os.remove(summary)
+    assert sorted((op, ts, round(t, 2)) for op, ts, t in TransactionHistory(ledger, summary, segs).summarize()) == totals
+
+    # a rotation interrupted after the rename is finished by recover()
+    os.replace(ledger, ledger + ".00002.closing")
+    open(ledger, "w").close()
+    assert segs.recover() == 1 and len(segs.entries()) == 2
+    assert not os.path.exists(ledger + ".00002.closing")
+
+    # the App rotates by size and still finds every sale of the day
+    app = App(d, ledger_segment_bytes=200)
+    for i in range(10):
+        app.add_component_transaction("Customer Sale", "Wire,25,1.6", i + 1)
+    print("Segments:", [e.name for e in segs.entries()])
+    assert len(segs.entries()) > 3
+    assert len(app.search_transactions(date.today())) == 10
+
+if __name__ == "__main__":
+    test_ledger_segments()
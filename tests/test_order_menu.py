@@ -0,0 +1,42 @@
+# Academic Integrity Statment
+# Filename: test_order_menu.py
+# Author: Pratik Sapkota
+# Student ID: 522498
+# Email: 522498@learning.eynesbury.edu.au
+# Description: Test code for entering long orders through the purchase / sale menus
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile, builtins
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from menu import UI
+
+def test_order_menu():
+    print("\n=== Long orders through the menus ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("10,Wire,25,1.6\n")
+    ui = UI(App(d))
+    lines = 600   # well past the recursion limit of the old recursive menus
+    # add item, pick the wire, quantity 1 ... then complete
+    script = ["1", "1", "1"] * lines + ["2"]
+    script = script + ["1", "1", "1"] * lines + ["2"]
+    answers = iter(script)
+    real_input, real_print = builtins.input, builtins.print
+    builtins.input = lambda prompt="": next(answers)
+    builtins.print = lambda *a, **k: None
+    try:
+        ui.purchase_orders_menu()
+        bought = ui.app.list_component_rows()
+        ui.customer_sales_menu()
+        sold = ui.app.list_component_rows()
+    finally:
+        builtins.input, builtins.print = real_input, real_print
+    print("After purchase:", bought, "after sale:", sold)
+    assert bought == [(10 + lines, "Wire,25,1.6")]
+    assert sold == [(10, "Wire,25,1.6")]
+
+if __name__ == "__main__":
+    test_order_menu()
@@ -0,0 +1,42 @@
+# Academic Integrity Statment
+# Filename: test_orders.py
+# Author: Pratik Sapkota
+# Student ID: 522498
+# Email: 522498@learning.eynesbury.edu.au
+# Description: Test code for completing whole purchase orders and customer sales
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from component.factory import csv_to_component
+from transaction.PurchaseOrder import PurchaseOrder
+from transaction.CustomerSale import CustomerSale
+
+def test_orders():
+    print("\n=== Orders ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("8,Battery,AA,1.5,3.1\n10,Wire,25,1.6\n")
+    app = App(d)
+    po = PurchaseOrder("Jaycar", "Any")
+    po.addItem("Wire,25,1.6", 5)
+    po.addItem(csv_to_component("Battery", ["AA", "1.5", "3.10"]), 2)
+    print("Purchase:", app.complete_purchase_order(po), format(po.salesTotal, ".2f"))
+    assert app.list_component_rows() == [(10, "Battery,AA,1.5,3.1"), (15, "Wire,25,1.6")]
+    short = CustomerSale("Bob")
+    short.addItem("Wire,25,1.6", 1)
+    short.addItem("Battery,AA,1.5,3.1", 11)
+    print("Short sale:", app.complete_customer_sale(short))
+    assert app.list_component_rows() == [(10, "Battery,AA,1.5,3.1"), (15, "Wire,25,1.6")]
+    sale = CustomerSale("Bob")
+    sale.addItem("Wire,25,1.6", 15)
+    print("Sale:", app.complete_customer_sale(sale), format(sale.saleTotal, ".2f"))
+    assert app.list_component_rows() == [(10, "Battery,AA,1.5,3.1")]
+    with open(os.path.join(d, "transactions.csv")) as f:
+        print("Ledger rows:", len(f.readlines()))
+
+if __name__ == "__main__":
+    test_orders()
@@ -0,0 +1,89 @@
+# Academic Integrity Statment
+# Filename: test_paged_query.py
+# Author: Unubileg Adilbish
+# Student ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Test code for filtered, paginated inventory queries and the paged menu
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile, builtins
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from menu import PagedMenu, UI
+from circuitkit.CircuitKit import CircuitKit
+
+def test_paged_query():
+    print("\n=== Paged queries ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        for i in range(10):
+            f.write("5,Wire," + str(10 + i) + "," + format(1 + i * 0.5, ".1f") + "\n")
+        f.write("3,Battery,AA,1.5,3.1\n3,Battery,D,9.0,7.5\n2,Sensor,motion,5.0,3.9\n")
+    app = App(d)
+    total, page = app.query_components(0, 4, kind="Wire")
+    print("Wire page 1:", total, page)
+    assert total == 10 and len(page) == 4
+    # pages meet without gaps or overlaps, and the last one is short
+    pages = [app.query_components(off, 4, kind="Wire")[1] for off in (0, 4, 8)]
+    assert [len(p) for p in pages] == [4, 4, 2]
+    assert sum(pages, []) == app.query_components(kind="Wire")[1]
+    assert app.query_components(12, 4, kind="Wire") == (10, [])
+    assert app.query_components(prefix="Battery,A")[1] == [(3, "Battery,AA,1.5,3.1")]
+    assert app.query_components(min_price=3.0, max_price=4.0)[0] == 5   # 3 wires, the AA battery and the sensor
+    assert [f for _, f in app.query_components(min_voltage=5.0)[1]] == ["Battery,D,9.0,7.5", "Sensor,motion,5.0,3.9"]
+    # the indexes follow buy/sell
+    app.sell_component("Battery,D,9.0,7.5", 3)
+    app.buy_component("Battery,C,1.5,4.0", 1)
+    assert [f for _, f in app.query_components(kind="Battery")[1]] == ["Battery,AA,1.5,3.1", "Battery,C,1.5,4.0"]
+    assert app.query_components(min_voltage=5.0)[0] == 1
+    app.buy_component("Wire,9,3.2", 1)
+    assert app.query_components(1, 1, kind="Wire", min_price=3.0) == (7, [(5, "Wire,15,3.5")])
+    assert app.query_components(kind="Wire", min_price=3.0)[1][-1] == (1, "Wire,9,3.2")
+    for name in ["Alpha", "Beta", "Bravo", "Charlie"]:
+        app.perform_pack(CircuitKit(name, 0.0, [(1, "Wire,10,1.0")]), 1)
+    total, kits = app.query_circuits(0, 1, prefix="B")
+    assert total == 2 and [k.name for _, k in kits] == ["Beta"]
+    assert [k.name for _, k in app.query_circuits(1, 5, prefix="B")[1]] == ["Bravo"]
+
+    # PagedMenu: next page, previous page, pick the second item, then BACK
+    picked = []
+    def fetch(offset, limit):
+        total, rows = app.query_components(offset, limit, kind="Wire")
+        return total, [(f, (lambda f=f: picked.append(f))) for _, f in rows]
+    menu = PagedMenu("WIRES", fetch, page_size=4)
+    answers = iter(["5", "6", "5", "2"])   # NEXT, PREVIOUS, NEXT, then item 2 of page 2
+    real_input, real_print = builtins.input, builtins.print
+    builtins.input = lambda prompt="": next(answers)
+    builtins.print = lambda *a, **k: None
+    try:
+        assert menu.run() is True
+    finally:
+        builtins.input, builtins.print = real_input, real_print
+    print("Picked:", picked)
+    assert picked == [app.query_components(5, 1, kind="Wire")[1][0][1]]
+
+def test_search_kind_selection():
+    print("\n=== Search kind selection ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("3,Battery,AA,1.5,3.1\n5,Wire,10,1.0\n")
+    ui = UI(App(d))
+    searched = []
+    ui.view_components = lambda **filters: searched.append(filters)
+    # 0 and 3 are out of range for two kinds and are asked again
+    answers = iter(["0", "3", "2", "", "", "", "", ""])
+    real_input, real_print = builtins.input, builtins.print
+    builtins.input = lambda prompt="": next(answers)
+    builtins.print = lambda *a, **k: None
+    try:
+        ui.search_components()
+    finally:
+        builtins.input, builtins.print = real_input, real_print
+    print("Filters:", searched)
+    assert searched == [{"kind": "Wire"}]
+
+if __name__ == "__main__":
+    test_paged_query()
+    test_search_kind_selection()
@@ -0,0 +1,46 @@
+# Academic Integrity Statment
+# Filename: test_parallel_load.py
+# Author: Unubileg Adilbish
+# Student ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Test code for loading large CSV files across a process pool
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from storage import parallel_load
+
+def test_parallel_load():
+    print("\n=== Parallel CSV load ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        for i in range(300):
+            f.write(str(i % 7) + ",Wire," + str(i % 40) + ",1.6\n")   # many duplicates
+        f.write("2,Battery, AA ,1.5,3.1\n")
+    with open(os.path.join(d, "components.csv"), "w") as f:
+        for i in range(60):
+            f.write("1,Kit " + str(i % 9) + ",2,Wire," + str(i % 40) + ",1.6\n")
+    print("Ranges:", parallel_load.split_ranges(os.path.join(d, "circuits.csv"), 5))
+    serial = App(d, load_workers=1)
+    old = parallel_load.PARALLEL_MIN_BYTES
+    parallel_load.PARALLEL_MIN_BYTES = 0
+    try:
+        parallel = App(d, load_workers=2)
+        assert parallel.list_component_rows() == serial.list_component_rows()
+        as_rows = lambda app: [(q, k.name, k.items) for q, k in app.list_circuit_objects()]
+        assert as_rows(parallel) == as_rows(serial)
+        print("Kits:", [(q, k.name) for q, k in parallel.list_circuit_objects()][:3])
+    finally:
+        parallel_load.PARALLEL_MIN_BYTES = old
+    # every byte is covered exactly once, on line boundaries
+    path = os.path.join(d, "circuits.csv")
+    ranges = parallel_load.split_ranges(path, 7)
+    data = open(path, "rb").read()
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert all(a[1] == b[0] and data[a[1] - 1:a[1]] == b"\n" for a, b in zip(ranges, ranges[1:]))
+
+if __name__ == "__main__":
+    test_parallel_load()
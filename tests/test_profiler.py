@@ -0,0 +1,53 @@
+# Academic Integrity Statment
+# Filename: test_profiler.py
+# Author: Pratik Sapkota
+# Student ID: 522498
+# Email: 522498@learning.eynesbury.edu.au
+# Description: Test code for the opt-in App / UI profiler
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, json, time, tempfile, builtins
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from menu import UI
+from profiling.Profiler import Profiler
+
+def test_profiler():
+    print("\n=== Profiler ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("8,Battery,AA,1.5,3.1\n10,Wire,25,1.6\n")
+    dump = os.path.join(d, "stats.json")
+    prof = Profiler(dump_path=dump)
+    app = App(d, profiler=prof)
+    ui = UI(app, profiler=prof)
+    for _ in range(20):
+        app.sell_component("Wire,25,1.6", 0)
+    app.list_component_rows()
+    # only actions are timed, and not the time spent typing at their prompts
+    assert "home" not in vars(ui) and "purchase_orders_menu" not in vars(ui)
+    real_input = builtins.input
+    builtins.input = lambda prompt="": (time.sleep(0.2), "1")[1]
+    try:
+        ui._sell_component("Wire,25,1.6")
+    finally:
+        builtins.input = real_input
+    assert prof.stats()["ops"]["ui._sell_component"]["max_ms"] < 100
+    app.close()
+    stats = prof.stats()
+    sell = stats["ops"]["app.sell_component"]
+    print("sell_component:", sell)
+    assert sell["count"] == 21
+    assert sell["p50_ms"] <= sell["p95_ms"] <= sell["p99_ms"] <= sell["max_ms"]
+    assert stats["rows_parsed"]["load_components"] == 2
+    assert stats["bytes_written"]["save_components"] == os.path.getsize(os.path.join(d, "circuits.csv"))
+    assert "close_app" in vars(ui)
+    with open(dump) as f:
+        assert json.load(f)["ops"]["app.sell_component"]["count"] == 21
+    # without a profiler nothing is wrapped
+    assert "sell_component" not in vars(App(d))
+
+if __name__ == "__main__":
+    test_profiler()
@@ -0,0 +1,37 @@
+# Academic Integrity Statment
+# Filename: test_schema.py
+# Author: Pratik Sapkota
+# Student ID: 522498
+# Email: 522498@learning.eynesbury.edu.au
+# Description: Test code for the component CSV schema registry
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from component.factory import csv_to_component, component_to_csv_row
+from component.schema import SCHEMAS, schema_for_kind
+
+def test_schema():
+    print("\n=== Component schema ===")
+    rows = [
+        ["3", "Wire", "25", "1.60"],
+        ["2", "Battery", "AA", "1.5", "3.10"],
+        ["1", "Solar Panel", "6.0", "0.1", "9.90"],
+        ["4", "LED Light", "red", "2.0", "20", "0.50"],
+        ["1", "Sensor", "light", "5.0", "4.20"],
+        ["1", "Buzzer", "2000.0", "85", "12.0", "20", "4.50"],
+    ]
+    for row in rows:
+        comp = csv_to_component(row[1], row[2:])
+        out = component_to_csv_row(int(row[0]), comp)
+        print(row, "->", out)
+        assert out == row
+    assert schema_for_kind("led light") is SCHEMAS["LED Light"]
+    caps = SCHEMAS["Battery"].caps(("Battery", "AA", "1.5", "3.10"), ("Battery", None, 1.5, 3.1))
+    print(caps)
+    assert caps == "1.5V AA BATTERY $3.10"
+
+if __name__ == "__main__":
+    test_schema()
@@ -0,0 +1,43 @@
+# Academic Integrity Statment
+# Filename: test_shared_dir.py
+# Author: Botao Huang
+# Student ID: 521560
+# Email: 521560@learning.eynesbury.edu.au
+# Description: Test code for two Apps sharing one data directory
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from circuitkit.CircuitKit import CircuitKit
+
+def test_shared_dir():
+    print("\n=== Shared data directory ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("10,Battery,AA,1.5,3.1\n10,Wire,25,1.6\n")
+    # two terminals (processes) on the same directory
+    a = App(d, shared=True)
+    b = App(d, shared=True)
+    assert a.sell_component("Battery,AA,1.5,3.1", 4)
+    # b merges a's journal records before checking stock
+    assert not b.sell_component("Battery,AA,1.5,3.1", 7)
+    assert b.sell_component("Battery,AA,1.5,3.1", 6)
+    print("A sees:", a.list_component_rows())
+    assert a.list_component_rows() == [(10, "Wire,25,1.6")]
+    # a checkpoint by one process makes the other reload instead of double counting
+    b.perform_pack(CircuitKit("Probe", 0.0, [(2, "Wire,25,1.6")]), 1)
+    b.checkpoint()
+    assert a.list_component_rows() == [(8, "Wire,25,1.6")]
+    a.buy_component("Wire,25,1.6", 1)
+    a.close()
+    b.close()
+    c = App(d)
+    print("After both closed:", c.list_component_rows())
+    assert c.list_component_rows() == [(9, "Wire,25,1.6")]
+    assert [(q, k.name) for q, k in c.list_circuit_objects()] == [(1, "Probe")]
+
+if __name__ == "__main__":
+    test_shared_dir()
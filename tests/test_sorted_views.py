@@ -0,0 +1,49 @@
+# Academic Integrity Statment
+# Filename: test_sorted_views.py
+# Author: Botao Huang
+# Student ID: 521560
+# Email: 521560@learning.eynesbury.edu.au
+# Description: Test code for the incrementally maintained component and kit listings
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from circuitkit.CircuitKit import CircuitKit
+
+def test_sorted_views():
+    print("\n=== Sorted views ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("5,Wire,25,1.6\n2,Battery,AA,1.5,3.1\n")
+    app = App(d)
+    assert app.list_component_rows() == [(2, "Battery,AA,1.5,3.1"), (5, "Wire,25,1.6")]
+    # selling out removes a row, buying a new component inserts it in order
+    app.sell_component("Battery,AA,1.5,3.1", 2)
+    app.buy_component("Buzzer,240,90,4,120,5.6", 3)
+    print("After sell/buy:", app.list_component_rows())
+    assert app.list_component_rows() == [(3, "Buzzer,240,90,4,120,5.6"), (5, "Wire,25,1.6")]
+    assert app.list_component_rows(1, 1) == [(5, "Wire,25,1.6")]
+    # packing updates the kit view and the component quantities it used
+    app.perform_pack(CircuitKit("Beta", 0.0, [(1, "Wire,25,1.6")]), 2)
+    app.perform_pack(CircuitKit("Alpha", 0.0, [(1, "Wire,25,1.6")]), 1)
+    kits = [(q, k.name) for q, k in app.list_circuit_objects()]
+    print("Kits:", kits)
+    assert kits == [(1, "Alpha"), (2, "Beta")]
+    assert app.list_component_rows()[-1] == (2, "Wire,25,1.6")
+    # the stored kit object is reused, and selling out removes the kit
+    first = app.list_circuit_objects()[1][1]
+    assert app.list_circuit_objects()[1][1] is first
+    app.sell_circuit("Alpha", 1)
+    assert [(q, k.name) for q, k in app.list_circuit_objects()] == [(2, "Beta")]
+    app.perform_unpack("Beta", 2)
+    assert app.list_circuit_objects() == []
+    assert app.list_component_rows()[-1] == (4, "Wire,25,1.6")
+    # a fresh App sorts what the first one saved the same way
+    app.checkpoint()
+    assert App(d).list_component_rows() == app.list_component_rows()
+
+if __name__ == "__main__":
+    test_sorted_views()
@@ -0,0 +1,50 @@
+# Academic Integrity Statment
+# Filename: test_threadsafe_app.py
+# Author: Botao Huang
+# Student ID: 521560
+# Email: 521560@learning.eynesbury.edu.au
+# Description: Test code for sharing one App between several threads
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile, threading
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from circuitkit.CircuitKit import CircuitKit
+
+def test_threadsafe_app():
+    print("\n=== Thread-safe App ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("100,Battery,AA,1.5,3.1\n50,Wire,25,1.6\n")
+    app = App(d, checkpoint_every=25, threadsafe=True)
+    kit = CircuitKit("Torch", 0.0, [(2, "Battery,AA,1.5,3.1"), (1, "Wire,25,1.6")])
+    sold = []
+    packed = []
+
+    def terminal():
+        for _ in range(40):
+            if app.sell_component("Battery,AA,1.5,3.1", 1):
+                sold.append(1)
+            if app.try_pack(kit, 1):
+                packed.append(1)
+
+    threads = [threading.Thread(target=terminal) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    print("Sold:", len(sold), "Packed:", len(packed))
+    # every unit is accounted for: nothing oversold, nothing lost
+    assert len(sold) + 2 * len(packed) == 100
+    assert app.list_component_rows() == [(50 - len(packed), "Wire,25,1.6")]
+    app.close()
+    again = App(d)
+    assert again.list_component_rows() == [(50 - len(packed), "Wire,25,1.6")]
+    assert again.list_circuit_objects()[0][0] == len(packed)
+    with open(os.path.join(d, "transactions.csv")) as f:
+        assert len(f.readlines()) == len(sold) + len(packed)
+
+if __name__ == "__main__":
+    test_threadsafe_app()
@@ -0,0 +1,44 @@
+# Academic Integrity Statment
+# Filename: test_transaction_history.py
+# Author: Unubileg
+# Student ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Test code for TransactionHistory
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from transaction.TransactionHistory import TransactionHistory
+
+def test_transaction_history():
+    print("\n=== TransactionHistory ===")
+    d = tempfile.mkdtemp()
+    ledger = os.path.join(d, "transactions.csv")
+    summary = os.path.join(d, "transactions_summary.csv")
+    with open(ledger, "w") as f:
+        f.write("Purchase Order, 2025-08-12 15:30:47, 2,Battery,AA,1.5,3.1\n")
+        f.write("Purchase Order, 2025-08-12 15:30:47, 1,Light Circuit,2,Battery,AA,1.5,3.1,1,Wire,25,1.6\n")
+        f.write("Customer Sale, 2025-08-12 16:23:31, 2,LED Light,green,3,150,2.2\n")
+    h1 = TransactionHistory(ledger, summary)
+    lines = h1.summarize()
+    print("Summary:", lines)
+    assert [(op, ts, round(t, 2)) for op, ts, t in lines] == [
+        ("Purchase Order", "2025-08-12 15:30:47", 14.0),
+        ("Customer Sale", "2025-08-12 16:23:31", 4.4),
+    ]
+    with open(ledger, "a") as f:
+        f.write("Customer Sale, 2025-08-13 10:00:00, 1,Wire,25,1.6\n")
+    h2 = TransactionHistory(ledger, summary)
+    n = h2.refresh()
+    print("Rows read after reopen:", n)
+    assert n == 1
+    assert len(h2.summarize()) == 3
+    with open(ledger, "w") as f:
+        f.write("Pack, 2025-09-01 09:00:00, 1,Wire,25,1.6\n")
+    print("After rewrite:", h2.summarize())
+    assert len(h2.summarize()) == 1
+
+if __name__ == "__main__":
+    test_transaction_history()
@@ -0,0 +1,39 @@
+# Academic Integrity Statment
+# Filename: test_transaction_index.py
+# Author: Unubileg
+# Student ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Test code for TransactionIndex and Transaction.searchByDate
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from datetime import date
+from transaction.Transaction import Transaction
+from transaction.TransactionIndex import TransactionIndex
+
+def test_transaction_index():
+    print("\n=== TransactionIndex ===")
+    d = tempfile.mkdtemp()
+    idx = TransactionIndex.for_data_dir(d)
+    idx.append_rows([
+        ["Purchase Order", " 2025-08-11 09:00:00", 2, "Battery", "AA", "1.5", "3.1"],
+        ["Customer Sale", " 2025-08-12 10:00:00", 1, "Wire", "25", "1.6"],
+    ])
+    # another process appends without going through the index
+    with open(idx.ledger_path, "a") as f:
+        f.write("Customer Sale, 2025-08-13 11:00:00, 3,Wire,25,1.6\n")
+    print("Days:", idx.days())
+    assert idx.days() == ["2025-08-11", "2025-08-12", "2025-08-13"]
+    found = Transaction().searchByDate(date(2025, 8, 12), date(2025, 8, 13), idx)
+    for t in found:
+        print(t)
+    assert [round(t.getTotalPrice(), 2) for t in found] == [1.6, 4.8]
+    fresh = TransactionIndex.for_data_dir(d)
+    print("Rebuilt rows:", fresh.rebuild())
+    assert fresh.ranges("2025-08-11") == idx.ranges("2025-08-11")
+
+if __name__ == "__main__":
+    test_transaction_index()
@@ -0,0 +1,36 @@
+# Academic Integrity Statment
+# Filename: test_where_used.py
+# Author: Botao Huang
+# Student ID: 521560
+# Email: 521560@learning.eynesbury.edu.au
+# Description: Test code for the App where-used queries
+# This is my own work as defined by the Academic Integrity Policy
+
+
+import sys, os, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app import App
+from circuitkit.CircuitKit import CircuitKit
+
+def test_where_used():
+    print("\n=== Where used ===")
+    d = tempfile.mkdtemp()
+    with open(os.path.join(d, "circuits.csv"), "w") as f:
+        f.write("8,Battery,AA,1.5,3.1\n10,Wire,25,1.6\n3,Sensor,motion,5.0,3.9\n")
+    app = App(d)
+    app.add_circuit_object(CircuitKit("Torch", 0.0, [(2, "Battery,AA,1.5,3.1"), (1, "Wire,25,1.6")]), 1)
+    app.add_circuit_object(CircuitKit("Alarm", 0.0, [(1, "Sensor,motion,5.0,3.9"), (2, "Wire,25,1.6")]), 1)
+    used = app.where_used("Wire,25,1.6")
+    print("Wire:", used)
+    assert used == {"Alarm": (3, "Sensor,motion,5.0,3.9"), "Torch": (4, "Battery,AA,1.5,3.1")}
+    app.sell_component("Battery,AA,1.5,3.1", 5)
+    assert app.where_used("Battery,AA,1.5,3.1") == {"Torch": (1, "Battery,AA,1.5,3.1")}
+    gone = app.where_used("Wire,25,1.6", discontinued=True)
+    print("Wire discontinued:", gone)
+    assert gone == {"Alarm": (0, "Wire,25,1.6"), "Torch": (0, "Wire,25,1.6")}
+    app.change_circuit_qty("Alarm", -1)
+    assert list(app.where_used("Wire,25,1.6")) == ["Torch"]
+
+if __name__ == "__main__":
+    test_where_used()
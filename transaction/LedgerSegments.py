@@ -0,0 +1,278 @@
+# File: LedgerSegments.py
+# Author: Unubileg
+# ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Size / month rotation of transactions.csv into gzip segments listed in a manifest
+# This is my own work as defined by the Academic Integrity Policy
+
+import os
+import csv
+import gzip
+from datetime import date
+from typing import IO, List, Iterator, Optional, Tuple, Any
+from storage.AtomicFile import AtomicFile
+from transaction.TransactionIndex import LEDGER_FILE, _as_day
+
+ARCHIVE_DIR = "transactions_archive"
+MANIFEST_FILE = "transactions_manifest.csv"
+CLOSING_SUFFIX = ".closing"
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+
+
+def _line_day(line: bytes) -> str:
+    '''
+    "YYYY-MM-DD" of a raw ledger line, or "" if it has no timestamp.
+    Unubileg
+    '''
+    parts = line.split(b",", 2)
+    if len(parts) < 2:
+        return ""
+    day = parts[1].decode("utf-8", errors="replace").strip()[:10]
+    return day if len(day) == 10 and day[4] == "-" else ""
+
+
+class Segment:
+    '''
+    One closed, compressed piece of the ledger as listed in the manifest.
+    Unubileg
+    '''
+    __slots__ = ("name", "first_day", "last_day", "rows", "raw_bytes")
+
+    def __init__(self, name: str, first_day: str, last_day: str, rows: int, raw_bytes: int) -> None:
+        self.name = name
+        self.first_day = first_day
+        self.last_day = last_day
+        self.rows = rows
+        self.raw_bytes = raw_bytes
+
+    def overlaps(self, lo_day: str, hi_day: str) -> bool:
+        return self.first_day != "" and self.first_day <= hi_day and self.last_day >= lo_day
+
+
+class LedgerSegments:
+    '''
+    Closes transactions.csv once it reaches max_bytes, or when a new month
+    starts, and keeps the closed segments gzip-compressed in ARCHIVE_DIR.
+    The manifest lists them oldest first with the first and last day they
+    hold, so a date query only opens the segments its range touches, and
+    those are streamed through gzip without being unpacked to disk.
+
+    A rotation renames the ledger to a ".closing" file first, so appends
+    made after it start a fresh ledger; the closing file is compressed,
+    listed in the manifest, then removed. recover() finishes a rotation
+    that was interrupted part way.
+    Unubileg
+    '''
+
+    def __init__(self, ledger_path: str, archive_dir: str, manifest_path: str,
+                 max_bytes: Optional[int] = DEFAULT_SEGMENT_BYTES, monthly: bool = False,
+                 files: Optional[AtomicFile] = None) -> None:
+        '''
+        Parameters:
+        ledger_path (str): The live transactions.csv.
+        archive_dir (str): Where compressed segments are kept.
+        manifest_path (str): CSV listing the segments.
+        max_bytes (Optional[int]): Rotate once the ledger is this large; never if None.
+        monthly (bool): Also rotate when the ledger holds rows from an earlier month.
+        files (Optional[AtomicFile]): Writes segments and the manifest (fsync policy).
+        Unubileg
+        '''
+        self.__ledger_path = ledger_path
+        self.__archive_dir = archive_dir
+        self.__manifest_path = manifest_path
+        self.__max_bytes = max_bytes
+        self.__monthly = monthly
+        self.__files = files if files is not None else AtomicFile()
+        self.__entries: List[Segment] = []
+        self.__manifest_stat: Optional[Tuple[int, int, int]] = None
+        self.__first_month: Optional[Tuple[int, str]] = None   # (ledger size when read, "YYYY-MM")
+
+    @staticmethod
+    def for_data_dir(data_dir: str, **kwargs: Any) -> "LedgerSegments":
+        '''
+        Segments of the ledger kept in an App data directory.
+        Unubileg
+        '''
+        return LedgerSegments(os.path.join(data_dir, LEDGER_FILE), os.path.join(data_dir, ARCHIVE_DIR),
+                              os.path.join(data_dir, MANIFEST_FILE), **kwargs)
+
+    # ---------------- manifest ----------------
+
+    def entries(self) -> List[Segment]:
+        '''
+        Closed segments, oldest first. The manifest is only re-read when it
+        changed on disk (another process may have rotated).
+        Unubileg
+        '''
+        try:
+            st = os.stat(self.__manifest_path)
+        except OSError:
+            self.__entries = []
+            self.__manifest_stat = None
+            return []
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if stamp != self.__manifest_stat:
+            entries = []
+            with open(self.__manifest_path, "r", encoding="utf-8", newline="") as f:
+                for row in csv.reader(f):
+                    if len(row) < 5 or row[0].startswith("#"):
+                        continue
+                    try:
+                        entries.append(Segment(row[0], row[1], row[2], int(row[3]), int(row[4])))
+                    except ValueError:
+                        continue
+            self.__entries = entries
+            self.__manifest_stat = stamp
+        return list(self.__entries)
+
+    def __write_manifest(self, entries: List[Segment]) -> None:
+        with self.__files.open(self.__manifest_path) as f:
+            writer = csv.writer(f)
+            writer.writerow(["#segment", "first_day", "last_day", "rows", "raw_bytes"])
+            for e in entries:
+                writer.writerow([e.name, e.first_day, e.last_day, e.rows, e.raw_bytes])
+        self.__manifest_stat = None
+
+    def path_of(self, segment: Segment) -> str:
+        return os.path.join(self.__archive_dir, segment.name)
+
+    # ---------------- rotation ----------------
+
+    def due(self, today: Optional[str] = None) -> bool:
+        '''
+        True if the ledger should be closed before rows dated today are appended.
+
+        Parameters:
+        today (Optional[str]): "YYYY-MM-DD", defaults to the current date.
+        Unubileg
+        '''
+        try:
+            size = os.path.getsize(self.__ledger_path)
+        except OSError:
+            return False
+        if size == 0:
+            return False
+        if self.__max_bytes is not None and size >= self.__max_bytes:
+            return True
+        if not self.__monthly:
+            return False
+        if self.__first_month is None or size < self.__first_month[0]:
+            first = ""
+            with open(self.__ledger_path, "rb") as f:
+                for line in f:
+                    first = _line_day(line)
+                    if first:
+                        break
+            self.__first_month = (size, first[:7])
+        month = self.__first_month[1]
+        today = today if today is not None else date.today().isoformat()
+        return month != "" and month != today[:7]
+
+    def rotate(self) -> Optional[Segment]:
+        '''
+        Close the current ledger into a new compressed segment.
+
+        Returns:
+        Optional[Segment]: The new segment, or None if the ledger was empty.
+        Unubileg
+        '''
+        self.recover()
+        try:
+            if os.path.getsize(self.__ledger_path) == 0:
+                return None
+        except OSError:
+            return None
+        seq = len(self.entries()) + 1
+        closing = self.__ledger_path + "." + str(seq).zfill(5) + CLOSING_SUFFIX
+        os.replace(self.__ledger_path, closing)
+        with open(self.__ledger_path, "ab"):
+            pass
+        self.__first_month = None
+        return self.__close(seq, closing)
+
+    def recover(self) -> int:
+        '''
+        Finish rotations interrupted by a crash: closing files already listed
+        in the manifest are removed, the others are compressed and listed.
+
+        Returns:
+        int: Number of segments added.
+        Unubileg
+        '''
+        folder = os.path.dirname(self.__ledger_path) or "."
+        prefix = os.path.basename(self.__ledger_path) + "."
+        found = []
+        for name in os.listdir(folder):
+            if name.startswith(prefix) and name.endswith(CLOSING_SUFFIX):
+                try:
+                    found.append((int(name[len(prefix):-len(CLOSING_SUFFIX)]), os.path.join(folder, name)))
+                except ValueError:
+                    continue
+        added = 0
+        for seq, closing in sorted(found):
+            if seq <= len(self.entries()):
+                os.remove(closing)
+            elif self.__close(seq, closing) is not None:
+                added = added + 1
+        return added
+
+    def __close(self, seq: int, closing: str) -> Optional[Segment]:
+        '''
+        Compress a closing file into segment seq, list it, then remove it.
+        Unubileg
+        '''
+        entries = self.entries()
+        if seq != len(entries) + 1:
+            return None   # out of order; left for recover()
+        if not os.path.exists(self.__archive_dir):
+            os.makedirs(self.__archive_dir)
+        first = last = ""
+        rows = raw = 0
+        name = "transactions-" + str(seq).zfill(5) + ".csv.gz"
+        with open(closing, "rb") as src, self.__files.open(os.path.join(self.__archive_dir, name), binary=True) as out:
+            with gzip.GzipFile(fileobj=out, mode="wb", compresslevel=6, mtime=0) as gz:
+                for line in src:
+                    gz.write(line)
+                    raw = raw + len(line)
+                    rows = rows + 1
+                    day = _line_day(line)
+                    if day:
+                        first = day if first == "" or day < first else first
+                        last = day if day > last else last
+        segment = Segment(name, first, last, rows, raw)
+        self.__write_manifest(entries + [segment])
+        os.remove(closing)
+        return segment
+
+    # ---------------- reading ----------------
+
+    def open(self, segment: Segment) -> IO[bytes]:
+        '''
+        Binary stream over the uncompressed contents of a segment.
+        Unubileg
+        '''
+        return gzip.open(self.path_of(segment), "rb")
+
+    def segments_for(self, start: Any, end: Optional[Any] = None) -> List[Segment]:
+        '''
+        Segments holding at least one row dated start..end (inclusive).
+        Unubileg
+        '''
+        lo = _as_day(start)
+        hi = _as_day(end) if end is not None else lo
+        return [e for e in self.entries() if e.overlaps(lo, hi)]
+
+    def read_rows(self, start: Any, end: Optional[Any] = None) -> Iterator[List[str]]:
+        '''
+        Stream the archived rows dated start..end, oldest segment first.
+        Unubileg
+        '''
+        lo = _as_day(start)
+        hi = _as_day(end) if end is not None else lo
+        for segment in self.segments_for(lo, hi):
+            with self.open(segment) as f:
+                for line in f:
+                    day = _line_day(line)
+                    if day and lo <= day <= hi:
+                        for row in csv.reader([line.decode("utf-8", errors="replace")]):
+                            yield row
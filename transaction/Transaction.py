@@ -1,11 +1,16 @@
-from typing import List
+import os
+from typing import List, Optional
 from datetime import datetime
 from component.Component import Component
+from component.factory import csv_to_component
+from circuitkit.CircuitKit import CircuitKit, ITEM_ARITY
+from transaction.TransactionIndex import TransactionIndex
 
 class Transaction:
-    def __init__(self, dateTime: "datetime" = None) -> None:
+    def __init__(self, dateTime: "datetime" = None, opType: str = "") -> None:
         self.items: List[Component] = []
         self.dateTime = dateTime or datetime.now()
+        self.opType = opType
 
     def addItem(self, component: Component) -> None:
         self.items.append(component)
@@ -23,8 +28,52 @@ class Transaction:
     def confirm(self) -> None:
         pass
 
-    def searchByDate(self, date: "datetime") -> list["Transaction"]:
-        return []
+    def searchByDate(self, date: "datetime", endDate: Optional["datetime"] = None,
+                     index: Optional[TransactionIndex] = None) -> list["Transaction"]:
+        """
+        Transactions recorded on date (or from date to endDate inclusive).
+        Only the matching rows are read, via the day index next to the ledger.
+        """
+        if index is None:
+            index = TransactionIndex.for_data_dir(Transaction.defaultDataDir())
+        out: List["Transaction"] = []
+        for row in index.read_rows(date, endDate):
+            t = Transaction.fromLedgerRow(row)
+            if t is not None:
+                out.append(t)
+        return out
+
+    @staticmethod
+    def defaultDataDir() -> str:
+        return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+    @staticmethod
+    def fromLedgerRow(row: List[str]) -> Optional["Transaction"]:
+        """
+        Build a Transaction from one transactions.csv row. Each unit bought or
+        sold becomes one entry in items, so getTotalPrice() matches the ledger.
+        """
+        if len(row) < 4:
+            return None
+        try:
+            when = datetime.strptime(row[1].strip(), "%Y-%m-%d %H:%M:%S")
+            qty = int(row[2].strip())
+        except Exception:
+            return None
+        head = row[3].strip()
+        if head in ITEM_ARITY:
+            lines = [(qty, [head] + [c.strip() for c in row[4:]])]
+        else:
+            lines = [(qty * iq, list(key.parts)) for iq, key in CircuitKit.parse_item_tokens(row[4:])]
+        t = Transaction(when, row[0].strip())
+        for n, parts in lines:
+            try:
+                # ledger rows are written by the App from validated keys
+                comp = csv_to_component(parts[0], parts[1:], trusted=True)
+            except Exception:
+                continue
+            t.items.extend([comp] * n)
+        return t
 
     def __str__(self) -> str:
         header = " ".join(["Transaction:", self.dateTime.strftime("%Y-%m-%d %H:%M:%S")])
@@ -0,0 +1,232 @@
+# File: TransactionHistory.py
+# Author: Unubileg
+# ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Streaming transaction history engine over transactions.csv
+# This is my own work as defined by the Academic Integrity Policy
+
+import os
+import csv
+import zlib
+from typing import IO, Dict, List, Tuple, Optional, TYPE_CHECKING
+from circuitkit.CircuitKit import CircuitKit, ITEM_ARITY
+
+if TYPE_CHECKING:
+    from transaction.LedgerSegments import LedgerSegments
+
+# How many leading bytes of the ledger are fingerprinted to detect a replaced file
+HEAD_BYTES = 256
+
+
+def parse_ledger_row(row: List[str]) -> Optional[Tuple[str, str, float]]:
+    '''
+    Price one transactions.csv row.
+
+    Component rows: op_type, timestamp, qty, item_type, ...fields...
+    Kit rows:       op_type, timestamp, qty, kit_name, item_qty, item_type, ...
+
+    Parameters:
+    row (List[str]): One parsed CSV row.
+
+    Returns:
+    Optional[Tuple[str, str, float]]: (op_type, timestamp, line total), or None
+    if the row is not a well-formed ledger row.
+
+    Unubileg
+    '''
+    if len(row) < 4:
+        return None
+    op = row[0].strip()
+    ts = row[1].strip()
+    # cheap shape check for "YYYY-MM-DD HH:MM:SS"
+    if op == "" or len(ts) != 19 or ts[4] != "-" or ts[13] != ":":
+        return None
+    try:
+        qty = int(row[2].strip())
+    except Exception:
+        return None
+    head = row[3].strip()
+    unit = 0.0
+    if head in ITEM_ARITY:
+        try:
+            unit = float(row[-1])
+        except Exception:
+            return None
+    else:
+        for iqty, key in CircuitKit.parse_item_tokens(row[4:]):
+            unit = unit + iqty * key.price
+    return op, ts, qty * unit
+
+
+class TransactionHistory:
+    '''
+    Keeps running (op_type, timestamp) totals for transactions.csv.
+
+    The ledger is streamed line by line from a byte-offset checkpoint that is
+    persisted next to it together with the totals, so every refresh only reads
+    rows appended since the previous one. A ledger that shrank or was replaced
+    is rescanned from the start.
+
+    With segments, the checkpoint also counts the archived segments already
+    folded in. When the ledger is rotated, the rest of the segment it became
+    is read from the same offset (through gzip), so no row is counted twice.
+    Unubileg
+    '''
+
+    def __init__(self, ledger_path: str, summary_path: str,
+                 segments: Optional["LedgerSegments"] = None) -> None:
+        '''
+        Parameters:
+        ledger_path (str): transactions.csv
+        summary_path (str): Sidecar file holding the checkpoint and totals.
+        segments (Optional[LedgerSegments]): Closed segments of the ledger, if it is rotated.
+        Unubileg
+        '''
+        self.__ledger_path = ledger_path
+        self.__summary_path = summary_path
+        self.__segments = segments
+        self.__offset = 0
+        self.__head_crc = 0
+        self.__archived = 0
+        self.__totals: Dict[Tuple[str, str], float] = {}
+        self.__load_summary()
+
+    def __load_summary(self) -> None:
+        '''
+        Restore the checkpoint and totals written by a previous run.
+        Unubileg
+        '''
+        if not os.path.exists(self.__summary_path):
+            return
+        try:
+            with open(self.__summary_path, "r", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                header = next(reader)
+                offset = int(header[1])
+                head_crc = int(header[2])
+                archived = int(header[3]) if len(header) > 3 else 0
+                totals: Dict[Tuple[str, str], float] = {}
+                for row in reader:
+                    totals[(row[0], row[1])] = float(row[2])
+        except Exception:
+            return
+        self.__offset = offset
+        self.__head_crc = head_crc
+        self.__archived = archived
+        self.__totals = totals
+
+    def __save_summary(self) -> None:
+        '''
+        Persist checkpoint and totals (written to a temp file, then swapped in).
+        Unubileg
+        '''
+        tmp = self.__summary_path + ".tmp"
+        with open(tmp, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["#checkpoint", self.__offset, self.__head_crc, self.__archived])
+            for (op, ts), total in self.__totals.items():
+                writer.writerow([op, ts, repr(total)])
+        os.replace(tmp, self.__summary_path)
+
+    def __reset(self) -> None:
+        self.__offset = 0
+        self.__head_crc = 0
+        self.__archived = 0
+        self.__totals = {}
+
+    def __fold_lines(self, f: IO[bytes], offset: int) -> Tuple[int, int]:
+        '''
+        Add the complete lines of f (positioned at offset) to the totals.
+
+        Returns:
+        Tuple[int, int]: (offset just past the last complete line, lines read)
+        Unubileg
+        '''
+        consumed = 0
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            offset = offset + len(line)
+            consumed = consumed + 1
+            text = line.decode("utf-8", errors="replace")
+            for row in csv.reader([text]):
+                priced = parse_ledger_row(row)
+                if priced is None:
+                    continue
+                op, ts, amount = priced
+                self.__totals[(op, ts)] = self.__totals.get((op, ts), 0.0) + amount
+        return offset, consumed
+
+    def __fold_archives(self) -> int:
+        '''
+        Fold in the segments closed since the last refresh. The first of them
+        is the ledger this history was reading, so it resumes at the offset.
+        Unubileg
+        '''
+        if self.__segments is None:
+            return 0
+        entries = self.__segments.entries()
+        if len(entries) < self.__archived:
+            self.__reset()
+        consumed = 0
+        for segment in entries[self.__archived:]:
+            with self.__segments.open(segment) as f:
+                head = f.read(HEAD_BYTES)
+                if self.__offset > 0 and zlib.crc32(head[:self.__offset]) != self.__head_crc:
+                    self.__reset()
+                    return self.__fold_archives()
+                f.seek(self.__offset)
+                _, n = self.__fold_lines(f, self.__offset)
+            consumed = consumed + n
+            self.__archived = self.__archived + 1
+            self.__offset = 0
+            self.__head_crc = 0
+        return consumed
+
+    def refresh(self) -> int:
+        '''
+        Fold rows appended since the last checkpoint into the totals.
+        A trailing line without a newline (still being written) is left for
+        the next refresh.
+
+        Returns:
+        int: Number of ledger rows consumed.
+        Unubileg
+        '''
+        before = (self.__offset, self.__archived)
+        consumed = self.__fold_archives()
+        if not os.path.exists(self.__ledger_path):
+            if self.__segments is None:
+                self.__reset()
+                return 0
+            if (self.__offset, self.__archived) != before:
+                self.__save_summary()
+            return consumed
+        with open(self.__ledger_path, "rb") as f:
+            head = f.read(HEAD_BYTES)
+            size = os.fstat(f.fileno()).st_size
+            if size < self.__offset or \
+                    (self.__offset > 0 and zlib.crc32(head[:self.__offset]) != self.__head_crc):
+                self.__reset()
+                consumed = self.__fold_archives()
+            if self.__offset != size:
+                f.seek(self.__offset)
+                offset, n = self.__fold_lines(f, self.__offset)
+                consumed = consumed + n
+                if offset != self.__offset:
+                    self.__offset = offset
+                    self.__head_crc = zlib.crc32(head[:offset])
+        if (self.__offset, self.__archived) != before or consumed:
+            self.__save_summary()
+        return consumed
+
+    def summarize(self) -> List[Tuple[str, str, float]]:
+        '''
+        Refresh, then return totals grouped by (op_type, timestamp) in ledger order.
+
+        Returns:
+        List[Tuple[str, str, float]]
+        Unubileg
+        '''
+        self.refresh()
+        return [(op, ts, total) for (op, ts), total in self.__totals.items()]
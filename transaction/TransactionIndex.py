@@ -0,0 +1,251 @@
+# File: TransactionIndex.py
+# Author: Unubileg
+# ID: 523127
+# Email: 523127@learning.eynesbury.edu.au
+# Description: Day -> byte offset sidecar index over transactions.csv
+# This is my own work as defined by the Academic Integrity Policy
+
+import io
+import os
+import csv
+import bisect
+from datetime import date, datetime
+from typing import Dict, List, Tuple, Iterable, Iterator, Optional, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from transaction.LedgerSegments import LedgerSegments
+
+LEDGER_FILE = "transactions.csv"
+INDEX_FILE = "transactions_index.csv"
+
+
+def _as_day(d: Any) -> str:
+    '''
+    Normalise a date / datetime / "YYYY-MM-DD..." string to "YYYY-MM-DD".
+    Unubileg
+    '''
+    if isinstance(d, datetime):
+        return d.strftime("%Y-%m-%d")
+    if isinstance(d, date):
+        return d.isoformat()
+    return str(d).strip()[:10]
+
+
+class TransactionIndex:
+    '''
+    Sidecar index mapping each day to the byte ranges of its rows in
+    transactions.csv. Index rows are "day,offset,end" and are appended as the
+    App writes ledger rows; rows appended by anyone else are picked up by
+    catch_up() from the end of the last indexed row.
+
+    Only the live ledger is indexed; once it is rotated into compressed
+    segments, read_rows() streams the segments whose days overlap the query.
+    Unubileg
+    '''
+
+    def __init__(self, ledger_path: str, index_path: str,
+                 segments: Optional["LedgerSegments"] = None) -> None:
+        self.__ledger_path = ledger_path
+        self.__index_path = index_path
+        self.__segments = segments
+        self.__days: Dict[str, Dict[int, int]] = {}
+        self.__sorted_days: List[str] = []
+        self.__covered = 0      # ledger bytes covered by the index
+        self.__index_read = 0   # index file bytes already loaded
+        self.__loaded = False
+
+    @staticmethod
+    def for_data_dir(data_dir: str) -> "TransactionIndex":
+        '''
+        Index over the ledger (and its archived segments) kept in an App data directory.
+        Unubileg
+        '''
+        from transaction.LedgerSegments import LedgerSegments
+        return TransactionIndex(os.path.join(data_dir, LEDGER_FILE), os.path.join(data_dir, INDEX_FILE),
+                                LedgerSegments.for_data_dir(data_dir))
+
+    @property
+    def ledger_path(self) -> str:
+        return self.__ledger_path
+
+    # ---------------- in-memory index ----------------
+
+    def __add(self, day: str, offset: int, end: int) -> None:
+        offsets = self.__days.get(day)
+        if offsets is None:
+            offsets = {}
+            self.__days[day] = offsets
+            bisect.insort(self.__sorted_days, day)
+        offsets[offset] = end
+        if end > self.__covered:
+            self.__covered = end
+
+    def __load(self) -> None:
+        '''
+        Read index rows appended since the last load (by this or another process).
+        Unubileg
+        '''
+        self.__loaded = True
+        if not os.path.exists(self.__index_path):
+            return
+        if os.path.getsize(self.__index_path) < self.__index_read:
+            self.__days = {}
+            self.__sorted_days = []
+            self.__covered = 0
+            self.__index_read = 0
+        with open(self.__index_path, "rb") as f:
+            f.seek(self.__index_read)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                self.__index_read = self.__index_read + len(line)
+                parts = line.decode("utf-8", errors="replace").strip().split(",")
+                try:
+                    self.__add(parts[0], int(parts[1]), int(parts[2]))
+                except Exception:
+                    continue
+
+    def __write_entries(self, entries: List[Tuple[str, int, int]]) -> None:
+        if not entries:
+            return
+        data = "".join([day + "," + str(off) + "," + str(end) + "\n" for day, off, end in entries])
+        raw = data.encode("utf-8")
+        with open(self.__index_path, "ab") as f:
+            f.write(raw)
+            f.flush()
+            # only skip re-reading our own entries if nobody appended in between
+            if f.tell() - len(raw) == self.__index_read:
+                self.__index_read = f.tell()
+
+    # ---------------- writing ----------------
+
+    def append_rows(self, rows: List[List[Any]]) -> None:
+        '''
+        Append ledger rows to transactions.csv in one write and index them
+        from the bytes written, without reading the ledger back.
+
+        Parameters:
+        rows (List[List[Any]]): Rows as [op_type, " timestamp", qty, ...].
+        Unubileg
+        '''
+        if not rows:
+            return
+        self.__load()
+        data = io.StringIO()
+        csv.writer(data).writerows(rows)
+        raw = data.getvalue().encode("utf-8")
+        with open(self.__ledger_path, "ab") as f:
+            start = f.tell()
+            f.write(raw)
+        if start == self.__covered:
+            self.__index_lines(io.BytesIO(raw), start)
+        # otherwise rows before ours (another process's, or a ledger never
+        # indexed) are not covered yet; the next catch_up() indexes them all
+
+    def catch_up(self) -> int:
+        '''
+        Index complete ledger rows past the last indexed one. Rebuilds from
+        scratch if the ledger is now shorter than what the index covers.
+
+        Returns:
+        int: Number of rows newly indexed.
+        Unubileg
+        '''
+        if not self.__loaded:
+            self.__load()
+        if not os.path.exists(self.__ledger_path):
+            return 0
+        size = os.path.getsize(self.__ledger_path)
+        if size < self.__covered:
+            return self.rebuild()
+        if size == self.__covered:
+            return 0
+        with open(self.__ledger_path, "rb") as f:
+            f.seek(self.__covered)
+            return self.__index_lines(f, self.__covered)
+
+    def __index_lines(self, lines: Iterable[bytes], offset: int) -> int:
+        '''
+        Index complete ledger lines that start at byte offset.
+        Unubileg
+        '''
+        entries: List[Tuple[str, int, int]] = []
+        for line in lines:
+            if not line.endswith(b"\n"):
+                break
+            end = offset + len(line)
+            parts = line.split(b",", 2)
+            if len(parts) >= 2:
+                day = parts[1].decode("utf-8", errors="replace").strip()[:10]
+                if len(day) == 10 and day[4] == "-":
+                    entries.append((day, offset, end))
+            offset = end
+        for day, off, stop in entries:
+            self.__add(day, off, stop)
+        self.__covered = max(self.__covered, offset)
+        self.__write_entries(entries)
+        return len(entries)
+
+    def rebuild(self) -> int:
+        '''
+        Throw the index away and rebuild it from the whole ledger.
+
+        Returns:
+        int: Number of rows indexed.
+        Unubileg
+        '''
+        with open(self.__index_path, "w", encoding="utf-8") as f:
+            pass
+        self.__days = {}
+        self.__sorted_days = []
+        self.__covered = 0
+        self.__index_read = 0
+        self.__loaded = True
+        return self.catch_up()
+
+    # ---------------- queries ----------------
+
+    def days(self) -> List[str]:
+        '''
+        Days that have at least one row in the live ledger, ascending.
+        Unubileg
+        '''
+        self.__load()
+        self.catch_up()
+        return list(self.__sorted_days)
+
+    def ranges(self, start: Any, end: Optional[Any] = None) -> List[Tuple[int, int]]:
+        '''
+        Byte ranges of the live ledger rows dated start..end (inclusive), in file order.
+        Unubileg
+        '''
+        self.__load()
+        self.catch_up()
+        lo_day = _as_day(start)
+        hi_day = _as_day(end) if end is not None else lo_day
+        lo = bisect.bisect_left(self.__sorted_days, lo_day)
+        hi = bisect.bisect_right(self.__sorted_days, hi_day)
+        out: List[Tuple[int, int]] = []
+        for day in self.__sorted_days[lo:hi]:
+            out.extend(self.__days[day].items())
+        out.sort()
+        return out
+
+    def read_rows(self, start: Any, end: Optional[Any] = None) -> Iterator[List[str]]:
+        '''
+        Seek straight to the rows dated start..end and yield them parsed,
+        after the matching rows of any archived segments.
+        Unubileg
+        '''
+        if self.__segments is not None:
+            for row in self.__segments.read_rows(start, end):
+                yield row
+        spans = self.ranges(start, end)
+        if not spans:
+            return
+        with open(self.__ledger_path, "rb") as f:
+            for off, stop in spans:
+                f.seek(off)
+                text = f.read(stop - off).decode("utf-8", errors="replace")
+                for row in csv.reader([text]):
+                    yield row